@@ -1,9 +1,71 @@
-from CTFdPy.client import Client
-from CTFdPy.constants import ChallengeType, ChallengeState, FlagType
+"""A client for the CTFd API
 
+Only the constants are imported with the package. Everything else is imported on
+first access, so `from CTFdPy import ChallengeType` does not import `requests`
+or the models, which keeps short-lived scripts fast to start.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from CTFdPy.constants import ChallengeState, ChallengeType, FlagType
+
+if TYPE_CHECKING:
+    from CTFdPy.async_client import AsyncClient
+    from CTFdPy.bulk import BulkItemResult, BulkResult
+    from CTFdPy.client import Client
+    from CTFdPy.csv import CredentialWriter, CSVHandler, RosterCSVHandler
+    from CTFdPy.models.challenges import Challenge
+    from CTFdPy.models.flags import Flag
+    from CTFdPy.models.hints import Hint
+    from CTFdPy.models.teams import Team
+    from CTFdPy.models.users import User
+
+# The module each lazily imported attribute comes from
+_LAZY = {
+    "Client": "CTFdPy.client",
+    "AsyncClient": "CTFdPy.async_client",
+    "BulkResult": "CTFdPy.bulk",
+    "BulkItemResult": "CTFdPy.bulk",
+    "CSVHandler": "CTFdPy.csv",
+    "CredentialWriter": "CTFdPy.csv",
+    "RosterCSVHandler": "CTFdPy.csv",
+    "Challenge": "CTFdPy.models.challenges",
+    "Flag": "CTFdPy.models.flags",
+    "Hint": "CTFdPy.models.hints",
+    "Team": "CTFdPy.models.teams",
+    "User": "CTFdPy.models.users",
+}
+
+# AsyncClient is left out, as `from CTFdPy import *` would then require aiohttp
 __all__ = (
     "Client",
     "ChallengeType",
     "ChallengeState",
-    "FlagType"
-)
\ No newline at end of file
+    "FlagType",
+    "BulkResult",
+    "BulkItemResult",
+    "CSVHandler",
+    "CredentialWriter",
+    "RosterCSVHandler",
+    "Challenge",
+    "Flag",
+    "Hint",
+    "Team",
+    "User"
+)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache it, so later accesses do not go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
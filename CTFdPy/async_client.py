@@ -0,0 +1,1056 @@
+import asyncio
+import os
+from collections import deque
+from io import BufferedIOBase
+from typing import (TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable,
+                    Iterable, Literal, TypeVar)
+
+try:
+    import aiohttp
+except ImportError as e:
+    raise ImportError("AsyncClient requires aiohttp, install it with `pip install aiohttp`") from e
+
+from CTFdPy.bulk import BulkItemResult, BulkResult
+from CTFdPy.client import APIResponse, Client
+from CTFdPy.constants import (CASE_INSENSITIVE, CASE_SENSITIVE, ChallengeState,
+                              ChallengeType, FlagType)
+from CTFdPy.models.challenges import (BaseChallenge, Challenge,
+                                      ChallengeCreateResult, ChallengePreview)
+from CTFdPy.models.files import File
+from CTFdPy.models.flags import Flag
+from CTFdPy.models.hints import Hint, PartialHint
+from CTFdPy.models.scoreboard import ScoreboardEntry
+from CTFdPy.models.submissions import Solve, Submission
+from CTFdPy.models.tags import Tag
+from CTFdPy.models.teams import Team
+from CTFdPy.models.topics import ChallengeTopic, Topic, TopicCreateResult
+from CTFdPy.models.users import User
+from CTFdPy.uploads import HashManifest, hash_file
+
+if TYPE_CHECKING:
+    from CTFdPy.journal import Journal
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+class AsyncClient:
+    """An asyncio version of `Client`, requires `aiohttp`
+
+    Every method of `Client` is available here as a coroutine, and its `iter_*` methods
+    as async iterators. Arguments that size thread pools (`workers`, `parallel`,
+    `prefetch`) are left out, as everything runs on the event loop bounded by
+    `concurrency`: the flags, hints, tags, topics and files of a challenge are created
+    at once, and bulk operations such as `create_users` or `ban_users` keep
+    `concurrency * 2` items in flight. Upload progress, caching, retries and hooks are
+    only available on `Client`.
+
+    Requests share a single pooled connector, and at most `concurrency` requests are
+    in flight at any time, so it is safe to `asyncio.gather` thousands of calls at once.
+
+    The client should be closed after use, either with `await client.close()`
+    or by using it as an async context manager.
+
+    Parameters
+    ----------
+    url : str, optional
+        The url of the CTFd instance, by default "http://localhost:8080"
+    token : str, optional
+        The admin API token
+    credentials : tuple[str, str], optional
+        The (username, password) used to log in for form requests
+    concurrency : int, optional
+        The maximum number of requests in flight, by default 20
+    max_connections : int, optional
+        The size of the connection pool, by default `concurrency`
+    timeout : float, optional
+        The total timeout of a single request in seconds, by default 60
+    """
+
+    def __init__(
+        self,
+        url: str = "http://localhost:8080",
+        token: str | None = None,
+        credentials: tuple[str, str] | None = None,
+        *,
+        concurrency: int = 20,
+        max_connections: int | None = None,
+        timeout: float = 60
+    ):
+        self.token = token
+        self.credentials = credentials
+
+        if self.token is None and self.credentials is None:
+            raise ValueError("Either token or credentials must be provided")
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        self.url = url.rstrip("/")
+
+        self.headers = {"Authorization": f"Token {self.token}"}
+
+        self.concurrency = concurrency
+        self.max_connections = max_connections or concurrency
+        self.timeout = timeout
+
+        # The session is created lazily as it must be created inside a running event loop
+        self._session: aiohttp.ClientSession | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._login_lock: asyncio.Lock | None = None
+        self._logged_in = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The underlying pooled session"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                # Cookies must be accepted from IP addresses for the login session to work
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._login_lock = asyncio.Lock()
+            self._logged_in = False
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the underlying session and its connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> APIResponse:
+        """Sends a request to the server, limited by the concurrency setting"""
+        session = self.session
+        async with self._semaphore:
+            async with session.request(method, self.url + endpoint, **kwargs) as response:
+                response.raise_for_status()
+                response = await response.json()
+
+        if not response["success"]:
+            raise Exception(response.get("errors") or response["message"])
+
+        return response
+
+    async def _get(self, endpoint: str) -> APIResponse:
+        """Sends a GET request to the server"""
+        return await self._request("GET", endpoint, json="")
+
+    async def _post(self, endpoint: str, json: dict[str, Any]) -> APIResponse:
+        """Sends a POST request to the server"""
+        return await self._request("POST", endpoint, json=json)
+
+    async def _post_form(self, endpoint: str, data: aiohttp.FormData) -> APIResponse:
+        """Sends a POST request to the server with form data"""
+        self.session # Ensures the session and its lock exist
+        async with self._login_lock:
+            if not self._logged_in:
+                # Auto login
+                if self.credentials is None:
+                    raise ValueError("Unable to auto login as credentials are not provided")
+                await self.login(*self.credentials)
+
+        return await self._request("POST", endpoint, data=data, allow_redirects=False)
+
+    async def _patch(self, endpoint: str, json: dict[str, Any]) -> APIResponse:
+        """Sends a PATCH request to the server"""
+        return await self._request("PATCH", endpoint, json=json)
+
+    async def _delete(self, endpoint: str) -> APIResponse:
+        """Sends a DELETE request to the server"""
+        return await self._request("DELETE", endpoint, json="")
+
+    async def _iter_pages(self, endpoint: str, per_page: int | None = None) -> AsyncIterator[list[Any]]:
+        """Yields the data of every page of a list endpoint, see `Client._iter_pages`"""
+        separator = "&" if "?" in endpoint else "?"
+        query = f"&per_page={per_page}" if per_page is not None else ""
+
+        page = 1
+        while page is not None:
+            response = await self._get(f"{endpoint}{separator}page={page}{query}")
+            yield response["data"]
+            page = ((response.get("meta") or {}).get("pagination") or {}).get("next")
+
+    async def _iter_bulk(
+        self,
+        func: Callable[[ItemT], Awaitable[ResultT]],
+        items: Iterable[ItemT]
+    ) -> AsyncIterator[BulkItemResult[ItemT, ResultT]]:
+        """Runs `func` over `items` concurrently, see `CTFdPy.bulk.iter_bulk`
+
+        Results are yielded in input order, with at most `concurrency * 2` items in flight
+        """
+        async def run(index: int, item: ItemT) -> BulkItemResult[ItemT, ResultT]:
+            try:
+                return BulkItemResult(index, item, await func(item))
+            except Exception as e:
+                return BulkItemResult(index, item, error=e)
+
+        pending: deque[asyncio.Task] = deque()
+        try:
+            for index, item in enumerate(items):
+                pending.append(asyncio.ensure_future(run(index, item)))
+                if len(pending) >= self.concurrency * 2:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _run_bulk(
+        self,
+        func: Callable[[ItemT], Awaitable[ResultT]],
+        items: Iterable[ItemT]
+    ) -> BulkResult[ItemT, ResultT]:
+        return BulkResult([result async for result in self._iter_bulk(func, items)])
+
+
+    async def login(self, username: str, password: str) -> None:
+        """Logs in to the server, see `Client.login`"""
+        session = self.session # Ensures the session and its semaphore exist
+        async with self._semaphore:
+            async with session.post(
+                f"{self.url}/login", data={"name": username, "password": password}
+            ) as r:
+                r.raise_for_status()
+        self._logged_in = True
+
+
+
+    # User related operations
+
+    async def get_user(self, user_id: int) -> User:
+        """Gets a user by id, see `Client.get_user`"""
+        res = await self._get(f"/api/v1/users/{user_id}")
+
+        return User.from_dict(res["data"])
+
+
+    async def iter_users(self, per_page: int | None = None) -> AsyncIterator[User]:
+        """Lazily yields all users, see `Client.iter_users`"""
+        async for page in self._iter_pages("/api/v1/users", per_page):
+            for user in page:
+                yield User.from_dict(user)
+
+
+    async def get_users(self) -> list[User]:
+        """Gets all users, see `Client.get_users`"""
+        return [user async for user in self.iter_users()]
+
+
+    async def _create_user(self, user: User) -> User:
+        if not user.password:
+            user.password = User._generate_password()
+        res = await self._post("/api/v1/users", user.to_payload())
+        created = User.from_dict(res["data"])
+        # The server never returns the password
+        created.password = user.password
+        return created
+
+    async def create_user(self, username: str, email: str, password: str | None = None) -> User:
+        """Creates a user, see `Client.create_user`"""
+        return await self._create_user(User(username, email, password))
+
+    async def create_users(self, users: Iterable[User | dict[str, str]]) -> BulkResult[User, User]:
+        """Creates many users concurrently, see `Client.create_users`"""
+        return BulkResult([result async for result in self.iter_create_users(users)])
+
+    def iter_create_users(self, users: Iterable[User | dict[str, str]]) -> AsyncIterator[BulkItemResult[User, User]]:
+        """Creates many users concurrently, yielding each result, see `Client.iter_create_users`"""
+        async def create(user: User | dict[str, str]) -> User:
+            if not isinstance(user, User):
+                user = User(**user)
+            return await self._create_user(user)
+
+        return self._iter_bulk(create, users)
+
+    async def update_user(self, user_or_id: User | int, /, **kwargs) -> User:
+        """Updates a user, see `Client.update_user`"""
+        if isinstance(user_or_id, User):
+            user_id = user_or_id.id
+            kwargs = {**user_or_id.to_changes(), **kwargs}
+        else:
+            user_id = user_or_id
+
+        res = await self._patch(f"/api/v1/users/{user_id}", kwargs)
+
+        updated = User.from_dict(res["data"])
+        # The server never returns the password
+        updated.password = kwargs.get("password")
+        return updated
+
+    async def delete_user(self, user_id: int) -> bool:
+        """Deletes a user, see `Client.delete_user`"""
+        res = await self._delete(f"/api/v1/users/{user_id}")
+        return res["success"]
+
+    async def _user_ids(self, users: Iterable[User | int] | Callable[[User], bool]) -> list[int]:
+        """Returns the ids of the given users, or of every user matching a predicate"""
+        if callable(users):
+            return [user.id async for user in self.iter_users() if users(user)]
+        return [user.id if isinstance(user, User) else user for user in users]
+
+    async def update_users(self, users: Iterable[User | int] | Callable[[User], bool], **kwargs) -> BulkResult[int, User]:
+        """Applies the same update to many users concurrently, see `Client.update_users`"""
+        return await self._run_bulk(lambda user_id: self.update_user(user_id, **kwargs), await self._user_ids(users))
+
+    async def delete_users(self, users: Iterable[User | int] | Callable[[User], bool]) -> BulkResult[int, bool]:
+        """Deletes many users concurrently, see `Client.delete_users`"""
+        return await self._run_bulk(self.delete_user, await self._user_ids(users))
+
+    async def ban_users(
+        self,
+        users: Iterable[User | int] | Callable[[User], bool],
+        banned: bool = True
+    ) -> BulkResult[int, User]:
+        """Bans or unbans many users concurrently, see `Client.ban_users`"""
+        return await self.update_users(users, banned=banned)
+
+    async def reset_passwords(self, users: Iterable[User | int] | Callable[[User], bool]) -> BulkResult[int, User]:
+        """Sets a new generated password for many users concurrently, see `Client.reset_passwords`"""
+        return await self._run_bulk(
+            lambda user_id: self.update_user(user_id, password=User._generate_password()),
+            await self._user_ids(users)
+        )
+
+
+    # Team related operations
+
+    async def get_team(self, team_id: int) -> Team:
+        """Gets a team by id, see `Client.get_team`"""
+        res = await self._get(f"/api/v1/teams/{team_id}")
+
+        return Team.from_dict(res["data"])
+
+
+    async def iter_teams(self, per_page: int | None = None) -> AsyncIterator[Team]:
+        """Lazily yields all teams, see `Client.iter_teams`"""
+        async for page in self._iter_pages("/api/v1/teams", per_page):
+            for team in page:
+                yield Team.from_dict(team)
+
+
+    async def get_teams(self) -> list[Team]:
+        """Gets all teams, see `Client.get_teams`"""
+        return [team async for team in self.iter_teams()]
+
+
+    async def _create_team(self, team: Team) -> Team:
+        res = await self._post("/api/v1/teams", team.to_payload())
+        created = Team.from_dict(res["data"])
+        # The server never returns the password
+        created.password = team.password
+        return created
+
+    async def create_team(self, name: str, email: str | None = None, password: str | None = None) -> Team:
+        """Creates a team, see `Client.create_team`"""
+        return await self._create_team(Team(name, email, password))
+
+    async def create_teams(self, teams: Iterable[Team]) -> BulkResult[Team, Team]:
+        """Creates many teams concurrently, see `Client.create_teams`"""
+        return await self._run_bulk(self._create_team, teams)
+
+    async def update_team(self, team_or_id: Team | int, /, **kwargs) -> Team:
+        """Updates a team, see `Client.update_team`"""
+        if isinstance(team_or_id, Team):
+            team_id = team_or_id.id
+            kwargs = {**team_or_id.to_changes(), **kwargs}
+        else:
+            team_id = team_or_id
+
+        res = await self._patch(f"/api/v1/teams/{team_id}", kwargs)
+
+        updated = Team.from_dict(res["data"])
+        updated.password = kwargs.get("password")
+        return updated
+
+    async def delete_team(self, team_id: int) -> bool:
+        """Deletes a team, see `Client.delete_team`"""
+        res = await self._delete(f"/api/v1/teams/{team_id}")
+        return res["success"]
+
+    async def get_team_members(self, team_id: int) -> list[int]:
+        """Gets the ids of the members of a team, see `Client.get_team_members`"""
+        res = await self._get(f"/api/v1/teams/{team_id}/members")
+        return res["data"]
+
+    async def add_team_member(self, team_id: int, user_id: int) -> list[int]:
+        """Adds a user to a team, see `Client.add_team_member`"""
+        res = await self._post(f"/api/v1/teams/{team_id}/members", {"user_id": user_id})
+        return res["data"]
+
+
+    # File related operations
+
+    async def get_file(self, file_id: int) -> File:
+        """Gets a file by id, see `Client.get_file`"""
+        res = await self._get(f"/api/v1/files/{file_id}")
+
+        return File.from_dict(res["data"])
+
+
+    async def iter_files(self, per_page: int | None = None) -> AsyncIterator[File]:
+        """Lazily yields all files, see `Client.iter_files`"""
+        async for page in self._iter_pages("/api/v1/files", per_page):
+            for file in page:
+                yield File.from_dict(file)
+
+
+    async def get_files(self) -> list[File]:
+        """Gets all files, see `Client.get_files`"""
+        return [file async for file in self.iter_files()]
+
+    async def _upload_files(self, challenge_id: int, files: list[os.PathLike[Any] | BufferedIOBase]) -> list[File]:
+        """Uploads files in one request, files given as paths are opened here and closed once sent"""
+        data = aiohttp.FormData()
+        data.add_field("challenge_id", str(challenge_id))
+        data.add_field("type", "challenge")
+
+        opened = []
+        try:
+            for f in files:
+                if isinstance(f, BufferedIOBase):
+                    if not f.readable():
+                        raise ValueError("File must be readable")
+                elif os.path.isfile(f):
+                    f = open(f, "rb")
+                    opened.append(f)
+                else:
+                    raise ValueError("File must be a path or a readable")
+
+                data.add_field("file", f, filename=os.path.basename(f.name))
+
+            res = await self._post_form("/api/v1/files", data)
+        finally:
+            for f in opened:
+                f.close()
+
+        return [File.from_dict(file) for file in res["data"]]
+
+    async def create_file(
+        self,
+        challenge_id: int,
+        *file: os.PathLike[Any] | BufferedIOBase,
+        deduplicate: bool = False,
+        manifest: HashManifest | None = None
+    ) -> bool:
+        """Creates a file, see `Client.create_file`
+
+        Files are hashed in a thread, so hashing large handouts does not block the event loop
+        """
+        try:
+            return await self._create_file(challenge_id, file, deduplicate, manifest)
+        finally:
+            # Saved once per call rather than after every file
+            if manifest is not None:
+                await asyncio.to_thread(manifest.flush)
+
+    async def _create_file(
+        self,
+        challenge_id: int,
+        file: tuple[os.PathLike[Any] | BufferedIOBase, ...],
+        deduplicate: bool,
+        manifest: HashManifest | None
+    ) -> bool:
+        """Uploads the files of `create_file`, leaving the manifest unsaved"""
+        hasher = manifest.hash if manifest is not None else hash_file
+
+        if not deduplicate:
+            # Hash before uploading, as uploading consumes file objects
+            hashes = [await asyncio.to_thread(manifest.hash, f) for f in file] if manifest is not None else []
+            created = await self._upload_files(challenge_id, list(file))
+            for sha1, c in zip(hashes, created):
+                manifest.record(c.location, sha1)
+            return True
+
+        existing = set()
+        for f in await self.get_challenge_files(challenge_id):
+            sha1 = f.sha1sum
+            if sha1 is None and manifest is not None:
+                sha1 = manifest.uploaded.get(f.location)
+            if sha1 is not None:
+                existing.add(sha1)
+
+        pending = []
+        for f in file:
+            sha1 = await asyncio.to_thread(hasher, f)
+            if sha1 in existing:
+                continue
+            # Also skip duplicates within the same call
+            existing.add(sha1)
+            pending.append((f, sha1))
+
+        if not pending:
+            return True
+
+        created = await self._upload_files(challenge_id, [f for f, _ in pending])
+        if manifest is not None:
+            for (_, sha1), c in zip(pending, created):
+                manifest.record(c.location, sha1)
+
+        return True
+
+    async def delete_file(self, file_id: int) -> bool:
+        """Deletes a file, see `Client.delete_file`"""
+        res = await self._delete(f"/api/v1/files/{file_id}")
+        return res["success"]
+
+
+    # Flag related operations
+
+    async def get_flag(self, flag_id: int) -> Flag:
+        """Gets a flag by id, see `Client.get_flag`"""
+        res = await self._get(f"/api/v1/flags/{flag_id}")
+
+        return Flag.from_dict(res["data"])
+
+
+    async def iter_flags(self, per_page: int | None = None) -> AsyncIterator[Flag]:
+        """Lazily yields all flags, see `Client.iter_flags`"""
+        async for page in self._iter_pages("/api/v1/flags", per_page):
+            for flag in page:
+                yield Flag.from_dict(flag)
+
+
+    async def get_flags(self) -> list[Flag]:
+        """Gets all flags, see `Client.get_flags`"""
+        return [flag async for flag in self.iter_flags()]
+
+
+    async def _create_flag(self, flag: Flag) -> Flag:
+        res = await self._post("/api/v1/flags", flag.to_payload())
+        return Flag.from_dict(res["data"])
+
+    async def create_flag(
+        self,
+        flag: str,
+        challenge_id: int,
+        type: str = FlagType.static,
+        case_insensitive: bool = False
+    ) -> Flag:
+        """Creates a flag, see `Client.create_flag`"""
+        data = CASE_INSENSITIVE if case_insensitive else CASE_SENSITIVE
+        return await self._create_flag(Flag(flag, data, type, challenge_id))
+
+
+    async def update_flag(self, flag_or_id: Flag | int, /, **kwargs) -> Flag:
+        """Updates a flag, see `Client.update_flag`"""
+        case_sensitive = kwargs.pop("case_sensitive", None)
+        if case_sensitive is not None:
+            kwargs["data"] = CASE_SENSITIVE if case_sensitive else CASE_INSENSITIVE
+
+        if isinstance(flag_or_id, Flag):
+            flag_id = flag_or_id.id
+            kwargs.update(flag_or_id.to_payload())
+        else:
+            flag_id = flag_or_id
+
+        res = await self._patch(f"/api/v1/flags/{flag_id}", kwargs)
+
+        return Flag.from_dict(res["data"])
+
+    async def delete_flag(self, flag_id: int) -> bool:
+        """Deletes a flag, see `Client.delete_flag`"""
+        res = await self._delete(f"/api/v1/flags/{flag_id}")
+        return res["success"]
+
+
+    # Hint related operations
+
+    async def get_hint(self, hint_id: int) -> Hint:
+        """Gets a hint by id, see `Client.get_hint`"""
+        res = await self._get(f"/api/v1/hints/{hint_id}")
+
+        return Hint.from_dict(res["data"])
+
+
+    async def iter_hints(self, per_page: int | None = None) -> AsyncIterator[PartialHint]:
+        """Lazily yields all hints, see `Client.iter_hints`"""
+        async for page in self._iter_pages("/api/v1/hints", per_page):
+            for hint in page:
+                yield PartialHint.from_dict(hint)
+
+
+    async def get_hints(self) -> list[PartialHint]:
+        """Gets all hints, see `Client.get_hints`"""
+        return [hint async for hint in self.iter_hints()]
+
+
+    async def _create_hint(self, hint: Hint) -> Hint:
+        res = await self._post("/api/v1/hints", hint.to_payload())
+        return Hint.from_dict(res["data"])
+
+    async def create_hint(
+        self,
+        challenge_or_id: Challenge | int,
+        content: str,
+        cost: int,
+        requirements: list[Hint] | None = None
+    ) -> Hint:
+        """Creates a hint, see `Client.create_hint`"""
+        if isinstance(challenge_or_id, BaseChallenge):
+            challenge_id = challenge_or_id.id
+        else:
+            challenge_id = challenge_or_id
+
+        hint = Hint(cost, content, challenge_id)
+
+        if requirements is not None:
+            hint.set_requirements(*requirements)
+
+        return await self._create_hint(hint)
+
+
+    async def create_hint_chains(
+        self,
+        chains: Iterable[list[Hint]],
+        ordered: bool = True
+    ) -> BulkResult[list[Hint], list[Hint]]:
+        """Creates several chains of hints at once, see `Client.create_hint_chains`
+
+        Every chain is created concurrently, each hint of an ordered chain after the previous one
+        """
+        chains = list(chains)
+        created: list[list[Hint]] = [[] for _ in chains]
+
+        async def run(index: int) -> BulkItemResult[list[Hint], list[Hint]]:
+            try:
+                await self._create_hint_chain(chains[index], ordered, created[index])
+                return BulkItemResult(index, chains[index], created[index])
+            except Exception as e:
+                return BulkItemResult(index, chains[index], created[index], e)
+
+        return BulkResult(list(await asyncio.gather(*(run(i) for i in range(len(chains))))))
+
+    async def _create_hint_chain(
+        self,
+        hints: list[Hint],
+        ordered: bool = True,
+        created: list[Hint] | None = None
+    ) -> list[Hint]:
+        """Creates hints, one after another each requiring the previous one if ordered, else at once
+
+        The created hints are appended to `created` as they are created
+        """
+        created = [] if created is None else created
+        if not ordered:
+            results = await asyncio.gather(*(self._create_hint(hint) for hint in hints), return_exceptions=True)
+            created.extend(result for result in results if not isinstance(result, BaseException))
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return created
+
+        for hint in hints:
+            if created:
+                hint.set_requirements(created[-1])
+            created.append(await self._create_hint(hint))
+        return created
+
+    async def update_hint(self, hint_or_id: Hint | int, /, **kwargs) -> Hint:
+        """Updates a hint, see `Client.update_hint`"""
+        requirements: list[Hint] = kwargs.pop("requirements", None)
+
+        if not isinstance(hint_or_id, Hint):
+            hint = Hint(id=hint_or_id, **kwargs)
+        else:
+            hint = hint_or_id
+
+        if requirements is not None:
+            hint.add_requirements(*requirements)
+
+        res = await self._patch(f"/api/v1/hints/{hint.id}", hint.to_payload())
+
+        return Hint.from_dict(res["data"])
+
+
+    async def delete_hint(self, hint_id: int) -> bool:
+        """Deletes a hint, see `Client.delete_hint`"""
+        res = await self._delete(f"/api/v1/hints/{hint_id}")
+        return res["success"]
+
+
+    # Tag related operations
+
+    async def get_tag(self, tag_id: int) -> Tag:
+        """Gets a tag by id, see `Client.get_tag`"""
+        res = await self._get(f"/api/v1/tags/{tag_id}")
+
+        return Tag.from_dict(res["data"])
+
+
+    async def iter_tags(self, per_page: int | None = None) -> AsyncIterator[Tag]:
+        """Lazily yields all tags, see `Client.iter_tags`"""
+        async for page in self._iter_pages("/api/v1/tags", per_page):
+            for tag in page:
+                yield Tag.from_dict(tag)
+
+
+    async def get_tags(self) -> list[Tag]:
+        """Gets all tags, see `Client.get_tags`"""
+        return [tag async for tag in self.iter_tags()]
+
+
+    async def _create_tag(self, tag: Tag) -> Tag:
+        res = await self._post("/api/v1/tags", tag.to_payload())
+        return Tag.from_dict(res["data"])
+
+    async def create_tag(self, challenge_or_id: BaseChallenge | int, value: str) -> Tag:
+        """Creates a tag, see `Client.create_tag`"""
+        if isinstance(challenge_or_id, BaseChallenge):
+            challenge_id = challenge_or_id.id
+        else:
+            challenge_id = challenge_or_id
+
+        return await self._create_tag(Tag(value, challenge_id))
+
+
+    async def update_tag(self, tag_or_id: Tag | int, value: str) -> Tag:
+        """Updates a tag, see `Client.update_tag`"""
+        if isinstance(tag_or_id, Tag):
+            tag = tag_or_id
+            tag.value = value
+        else:
+            tag = Tag(id=tag_or_id, value=value)
+
+        res = await self._patch(f"/api/v1/tags/{tag.id}", tag.to_payload())
+
+        return Tag.from_dict(res["data"])
+
+
+    async def delete_tag(self, tag_id: int) -> bool:
+        """Deletes a tag, see `Client.delete_tag`"""
+        res = await self._delete(f"/api/v1/tags/{tag_id}")
+        return res["success"]
+
+
+    # Topic related operations
+
+    async def get_topic(self, topic_id: int) -> Topic:
+        """Gets a topic by id, see `Client.get_topic`"""
+        res = await self._get(f"/api/v1/topics/{topic_id}")
+
+        return Topic.from_dict(res["data"])
+
+
+    async def iter_topics(self, per_page: int | None = None) -> AsyncIterator[Topic]:
+        """Lazily yields all topics, see `Client.iter_topics`"""
+        async for page in self._iter_pages("/api/v1/topics", per_page):
+            for topic in page:
+                yield Topic.from_dict(topic)
+
+
+    async def get_topics(self) -> list[Topic]:
+        """Gets all topics, see `Client.get_topics`"""
+        return [topic async for topic in self.iter_topics()]
+
+
+    async def _create_topic(self, topic: ChallengeTopic) -> TopicCreateResult:
+        res = await self._post("/api/v1/topics", topic.to_payload())
+        return TopicCreateResult.from_dict(res["data"])
+
+    async def create_topic(self, challenge_or_id: BaseChallenge | int, value: str) -> TopicCreateResult:
+        """Creates a topic, see `Client.create_topic`"""
+        if isinstance(challenge_or_id, BaseChallenge):
+            challenge_id = challenge_or_id.id
+        else:
+            challenge_id = challenge_or_id
+
+        return await self._create_topic(ChallengeTopic(value, challenge_id))
+
+
+    async def delete_topic(self, topic_id: int) -> bool:
+        """Deletes a topic, see `Client.delete_topic`"""
+        res = await self._delete(f"/api/v1/topics/{topic_id}")
+        return res["success"]
+
+    async def delete_challenge_topic(self, challenge_topic_id: int) -> bool:
+        """Removes a topic from a challenge, see `Client.delete_challenge_topic`"""
+        res = await self._delete(f"/api/v1/topics?type=challenge&target_id={challenge_topic_id}")
+        return res["success"]
+
+
+    # Challenge related operations
+
+    async def get_challenge(self, challenge_id: int) -> Challenge:
+        """Gets a challenge by id, see `Client.get_challenge`"""
+        res = await self._get(f"/api/v1/challenges/{challenge_id}")
+
+        return Challenge.from_dict(res["data"])
+
+
+    async def iter_visible_challenges(self, per_page: int | None = None) -> AsyncIterator[ChallengePreview]:
+        """Lazily yields all visible challenges, see `Client.iter_visible_challenges`"""
+        async for page in self._iter_pages("/api/v1/challenges", per_page):
+            for challenge in page:
+                yield ChallengePreview.from_dict(challenge)
+
+
+    async def get_visible_challenges(self) -> list[ChallengePreview]:
+        """Gets all visible challenges, see `Client.get_visible_challenges`"""
+        return [challenge async for challenge in self.iter_visible_challenges()]
+
+
+    async def iter_challenges(self, per_page: int | None = None) -> AsyncIterator[ChallengePreview]:
+        """Lazily yields all challenges, including hidden ones, see `Client.iter_challenges`"""
+        async for page in self._iter_pages("/api/v1/challenges?view=admin", per_page):
+            for challenge in page:
+                yield ChallengePreview.from_dict(challenge)
+
+
+    async def get_challenges(self) -> list[ChallengePreview]:
+        """Gets all challenges, including hidden ones, see `Client.get_challenges`"""
+        return [challenge async for challenge in self.iter_challenges()]
+
+
+    async def get_challenge_files(self, challenge_id: int) -> list[File]:
+        """Gets the files of a challenge, see `Client.get_challenge_files`"""
+        res = await self._get(f"/api/v1/challenges/{challenge_id}/files")
+
+        return [File.from_dict(file) for file in res["data"]]
+
+
+    async def get_challenge_hints(self, challenge_id: int) -> list[Hint]:
+        """Gets the full hints of a challenge, see `Client.get_challenge_hints`"""
+        res = await self._get(f"/api/v1/challenges/{challenge_id}/hints")
+
+        return [Hint.from_dict(hint) for hint in res["data"]]
+
+
+    async def get_challenge_topics(self, challenge_id: int) -> list[ChallengeTopic]:
+        """Gets the topics of a challenge, see `Client.get_challenge_topics`"""
+        res = await self._get(f"/api/v1/challenges/{challenge_id}/topics")
+
+        return [ChallengeTopic.from_dict(topic) for topic in res["data"]]
+
+
+    async def _create_challenge(
+        self,
+        challenge: Challenge,
+        flags: list[Flag],
+        hints: list[Hint] | None = None,
+        tags: list[Tag] | None = None,
+        topics: list[ChallengeTopic] | None = None,
+        files: list[os.PathLike | BufferedIOBase] | None = None,
+        *,
+        hints_ordered: bool = True,
+        delete_on_error: bool = True,
+        journal: "Journal | None" = None
+    ) -> ChallengeCreateResult:
+
+        key = (challenge.category, challenge.name)
+        if journal is not None:
+            journal.begin(key)
+
+        # Create challenge first
+        res = await self._post("/api/v1/challenges", challenge.to_payload())
+
+        challenge_result = ChallengeCreateResult.from_dict(res["data"])
+
+        if journal is not None:
+            journal.created("challenges", challenge_result.id, key)
+
+        # Every sub-resource is independent of the others, except ordered hints
+        # which have to be created as a chain
+        tasks: list[tuple[str, Awaitable[Any]]] = []
+
+        for flag in flags:
+            flag.challenge_id = challenge_result.id
+            tasks.append(("flags", self._create_flag(flag)))
+
+        if hints is not None:
+            for hint in hints:
+                hint.challenge_id = challenge_result.id
+            if hints_ordered:
+                tasks.append(("hints", self._create_hint_chain(hints)))
+            else:
+                tasks.extend(("hints", self._create_hint(hint)) for hint in hints)
+
+        if tags is not None:
+            for tag in tags:
+                tag.challenge_id = challenge_result.id
+                tasks.append(("tags", self._create_tag(tag)))
+
+        if topics is not None:
+            for topic in topics:
+                topic.challenge_id = challenge_result.id
+                tasks.append(("topics", self._create_topic(topic)))
+
+        if files is not None:
+            tasks.append(("files", self.create_file(challenge_result.id, *files)))
+
+        async def run(resource: str, task: Awaitable[Any]) -> Any:
+            result = await task
+            if journal is not None:
+                # Uploads only report success, their ids are not known
+                for created in (result if isinstance(result, list) else [result]):
+                    journal.created(resource, getattr(created, "id", None), key)
+            return result
+
+        # Wait for every request before rolling back, so nothing is created after the delete
+        results = await asyncio.gather(*(run(*task) for task in tasks), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            if delete_on_error:
+                await self.delete_challenge(challenge_result.id)
+                if journal is not None:
+                    journal.deleted("challenges", challenge_result.id, key)
+            raise errors[0]
+
+        if journal is not None:
+            journal.done(key)
+
+        return challenge_result
+
+    async def create_challenge(
+        self,
+        name: str,
+        category: str,
+        description: str,
+        type: str = ChallengeType.standard,
+        state: str = ChallengeState.visible,
+        flag: str | None = None,
+        flag_type = FlagType.static,
+        case_insensitive: bool = False,
+        flags: list[tuple[str, str, bool]] | None = None, # [(flag, type, case_insensitive)]
+        *,
+        value: int | None = None,
+        initial: int | None = None,
+        minimum: int | None = None,
+        decay: int | None = None,
+        connection_info: str | None = None,
+        max_attempts: int | None = None,
+        hints: list[tuple[str, int]] | None = None, # [(content, cost)]
+        hints_ordered: bool = True, # Whether hints require previous hints, from top to bottom
+        tags: list[str] | None = None,
+        topics: list[str] | None = None,
+        files: list[os.PathLike[Any] | BufferedIOBase] | None = None,
+        requirements: list[BaseChallenge] | None = None,
+        delete_on_error: bool = True, # Whether to delete the challenge if an error occurs
+        journal: "Journal | None" = None # Journal recording the created resources
+    ) -> ChallengeCreateResult:
+        """Creates a challenge, see `Client.create_challenge`
+
+        Flags, hints, tags, topics and files are created at once, ordered hints one after another
+        """
+        challenge = Challenge(
+            name,
+            category,
+            description,
+            type,
+            state,
+            value,
+            initial,
+            minimum,
+            decay,
+            connection_info,
+            max_attempts
+        )
+
+        if flag is not None and flags is not None:
+            raise ValueError("Cannot specify both flag and flags")
+
+        if flag is not None:
+            flags = [(flag, flag_type, case_insensitive)]
+        elif flags is None:
+            raise ValueError("Must specify either flag or flags")
+        flags = [Flag(flag, CASE_INSENSITIVE if case_insensitive else CASE_SENSITIVE, flag_type) for flag, flag_type, case_insensitive in flags]
+
+        if hints is not None:
+            hints = [Hint(cost, content) for content, cost in hints]
+
+        if tags is not None:
+            tags = [Tag(tag) for tag in tags]
+
+        if topics is not None:
+            topics = [ChallengeTopic(topic) for topic in topics]
+
+        if requirements is not None:
+            challenge.requirements = {"prerequisites": [c.id for c in requirements]}
+
+        return await self._create_challenge(
+            challenge, flags, hints, tags, topics, files, hints_ordered=hints_ordered, delete_on_error=delete_on_error,
+            journal=journal
+        )
+
+
+    async def update_challenge(self, challenge_or_id: Challenge | int, /, **kwargs) -> Challenge:
+        """Updates a challenge, see `Client.update_challenge`"""
+        if isinstance(challenge_or_id, Challenge):
+            challenge_id = challenge_or_id.id
+            kwargs = {**challenge_or_id.to_payload(), **kwargs}
+        else:
+            challenge_id = challenge_or_id
+
+        res = await self._patch(f"/api/v1/challenges/{challenge_id}", kwargs)
+
+        return Challenge.from_dict(res["data"])
+
+
+    async def delete_challenge(self, challenge_id: int) -> bool:
+        """Deletes a challenge, see `Client.delete_challenge`"""
+        res = await self._delete(f"/api/v1/challenges/{challenge_id}")
+        return res["success"]
+
+
+    # Scoreboard and submission related operations
+
+    async def get_scoreboard(self) -> list[ScoreboardEntry]:
+        """Gets the scoreboard, see `Client.get_scoreboard`"""
+        res = await self._get("/api/v1/scoreboard")
+
+        return [ScoreboardEntry.from_dict(entry) for entry in res["data"]]
+
+
+    async def get_challenge_solves(self, challenge_id: int) -> list[Solve]:
+        """Gets the solves of a challenge, see `Client.get_challenge_solves`"""
+        res = await self._get(f"/api/v1/challenges/{challenge_id}/solves")
+
+        return [Solve.from_dict(solve) for solve in res["data"]]
+
+
+    async def get_submission(self, submission_id: int) -> Submission:
+        """Gets a submission by id, see `Client.get_submission`"""
+        res = await self._get(f"/api/v1/submissions/{submission_id}")
+
+        return Submission.from_dict(res["data"])
+
+
+    async def iter_submissions(
+        self,
+        type: Literal["correct", "incorrect"] | None = None,
+        challenge_id: int | None = None,
+        user_id: int | None = None,
+        team_id: int | None = None,
+        per_page: int | None = None
+    ) -> AsyncIterator[Submission]:
+        """Lazily yields all submissions, see `Client.iter_submissions`"""
+        endpoint = Client._submissions_endpoint(
+            type=type, challenge_id=challenge_id, user_id=user_id, team_id=team_id
+        )
+        async for page in self._iter_pages(endpoint, per_page):
+            for submission in page:
+                yield Submission.from_dict(submission)
+
+
+    async def get_submissions(
+        self,
+        type: Literal["correct", "incorrect"] | None = None,
+        challenge_id: int | None = None,
+        user_id: int | None = None,
+        team_id: int | None = None
+    ) -> list[Submission]:
+        """Gets all submissions, see `Client.get_submissions`"""
+        return [
+            submission async for submission in self.iter_submissions(type, challenge_id, user_id, team_id)
+        ]
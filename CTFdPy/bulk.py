@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Iterable, Iterator, TypeVar
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+@dataclass
+class BulkItemResult(Generic[ItemT, ResultT]):
+    """Represents the outcome of a single item in a bulk operation"""
+    index: int                           # Position of the item in the input
+    item: ItemT                          # The input item
+    result: ResultT | None = None        # The return value if the operation succeeded
+    error: Exception | None = None       # The exception if the operation failed
+
+    @property
+    def ok(self) -> bool:
+        """Returns whether the operation succeeded"""
+        return self.error is None
+
+
+@dataclass
+class BulkResult(Generic[ItemT, ResultT]):
+    """Represents the outcome of a bulk operation, in input order"""
+    results: list[BulkItemResult[ItemT, ResultT]] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[BulkItemResult[ItemT, ResultT]]:
+        """Returns the items that succeeded"""
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> list[BulkItemResult[ItemT, ResultT]]:
+        """Returns the items that failed"""
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def ok(self) -> bool:
+        """Returns whether every item succeeded"""
+        return all(r.ok for r in self.results)
+
+    def __iter__(self) -> Iterator[BulkItemResult[ItemT, ResultT]]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+def iter_bulk(
+    func: Callable[[ItemT], ResultT],
+    items: Iterable[ItemT],
+    workers: int = 8
+) -> Iterator[BulkItemResult[ItemT, ResultT]]:
+    """Runs `func` over `items` with a pool of threads
+
+    Results are yielded in input order as soon as they are available.
+    Items are pulled from `items` lazily, with at most `workers * 2` in flight,
+    so arbitrarily large iterables can be processed in constant memory.
+    Exceptions are captured per item and never stop the other items.
+
+    Parameters
+    ----------
+    func : Callable[[ItemT], ResultT]
+        The operation to run on each item
+    items : Iterable[ItemT]
+        The items to process
+    workers : int, optional
+        The number of threads, by default 8
+
+    Yields
+    ------
+    BulkItemResult[ItemT, ResultT]
+        The outcome of each item
+    """
+    if workers < 1:
+        raise ValueError("Workers must be at least 1")
+
+    def run(index: int, item: ItemT) -> BulkItemResult[ItemT, ResultT]:
+        try:
+            return BulkItemResult(index, item, result=func(item))
+        except Exception as e:
+            return BulkItemResult(index, item, error=e)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[BulkItemResult[ItemT, ResultT]]] = deque()
+        for index, item in enumerate(items):
+            pending.append(executor.submit(run, index, item))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_bulk(
+    func: Callable[[ItemT], ResultT],
+    items: Iterable[ItemT],
+    workers: int = 8
+) -> BulkResult[ItemT, ResultT]:
+    """Runs `func` over `items` with a pool of threads and collects the results
+
+    See `iter_bulk` for details
+    """
+    return BulkResult(list(iter_bulk(func, items, workers)))
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from urllib.parse import urlsplit
+
+# Writing to one of these resources also changes what the challenge endpoints
+# return, e.g. /challenges/<id> lists its tags, hints and files
+RESOURCE_DEPENDENTS: dict[str, tuple[str, ...]] = {
+    "flags": ("challenges",),
+    "hints": ("challenges",),
+    "tags": ("challenges",),
+    "topics": ("challenges",),
+    "files": ("challenges",),
+    "challenges": ("flags", "hints", "tags", "topics", "files"),
+}
+
+
+def resource_of(endpoint: str) -> str:
+    """Returns the resource of an endpoint, e.g. `challenges` for `/api/v1/challenges/1/flags`"""
+    path = urlsplit(endpoint).path
+    parts = [part for part in path.split("/") if part]
+    if parts[:2] == ["api", "v1"]:
+        parts = parts[2:]
+    return parts[0] if parts else ""
+
+
+class ResponseCache:
+    """An in-memory cache of GET responses with expiry and LRU eviction
+
+    Responses are keyed by endpoint. Each resource (the first path segment after
+    `/api/v1`) can have its own time to live. Any write to a resource through the
+    client removes the cached responses of that resource and of the resources
+    that depend on it, and a response requested before such a write is not cached
+    when it arrives after it (see `generation`).
+
+    Responses are stored encoded, so every `get` returns a new copy and callers
+    can modify what they are given without changing the cache.
+
+    The cache is safe to share between threads.
+
+    Parameters
+    ----------
+    ttl : float, optional
+        The default time to live of a response in seconds, by default 30
+    ttls : dict[str, float], optional
+        The time to live of specific resources, e.g. `{"challenges": 300, "users": 10}`.
+        A time to live of 0 disables caching for that resource
+    max_entries : int, optional
+        The maximum number of cached responses, by default 1024
+    """
+
+    def __init__(self, ttl: float = 30, ttls: dict[str, float] | None = None, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("Max entries must be at least 1")
+
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict() # endpoint -> (expiry, encoded response)
+        self._lock = threading.Lock()
+
+        # Every invalidation takes the next generation, and records it for the resources it affected
+        self._generation = 0
+        self._invalidated: dict[str, int] = {}
+        self._cleared = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, endpoint: str) -> Any | None:
+        """Returns the cached response of an endpoint, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[endpoint]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(endpoint)
+            self.hits += 1
+            encoded = entry[1]
+        return json.loads(encoded)
+
+    def generation(self, endpoint: str) -> int:
+        """Returns the generation of an endpoint, to be taken before requesting it and passed to `set`"""
+        with self._lock:
+            return max(self._invalidated.get(resource_of(endpoint), 0), self._cleared)
+
+    def set(self, endpoint: str, response: Any, generation: int | None = None) -> None:
+        """Caches the response of an endpoint
+
+        If `generation` is given and the endpoint was invalidated since it was taken,
+        the response may be stale and is not cached
+        """
+        resource = resource_of(endpoint)
+        ttl = self.ttls.get(resource, self.ttl)
+        if ttl <= 0:
+            return
+
+        encoded = json.dumps(response)
+        with self._lock:
+            if generation is not None and generation != max(self._invalidated.get(resource, 0), self._cleared):
+                return
+            self._entries[endpoint] = (time.monotonic() + ttl, encoded)
+            self._entries.move_to_end(endpoint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str) -> None:
+        """Removes the cached responses affected by a write to an endpoint"""
+        resource = resource_of(endpoint)
+        resources = {resource, *RESOURCE_DEPENDENTS.get(resource, ())}
+
+        with self._lock:
+            self._generation += 1
+            for affected in resources:
+                self._invalidated[affected] = self._generation
+            for key in [key for key in self._entries if resource_of(key) in resources]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Removes every cached response"""
+        with self._lock:
+            self._generation += 1
+            self._cleared = self._generation
+            self._entries.clear()
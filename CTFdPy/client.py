@@ -1,8 +1,19 @@
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from io import BufferedIOBase
-from typing import Any, Literal, TypedDict, overload
+from typing import (TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal,
+                    TypedDict, overload)
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from CTFdPy.bulk import BulkItemResult, BulkResult, iter_bulk, run_bulk
+from CTFdPy.cache import ResponseCache
+from CTFdPy.hooks import RequestHook, RequestInfo, endpoint_template
 
 from CTFdPy.constants import (CASE_INSENSITIVE, CASE_SENSITIVE, ChallengeState,
                               ChallengeType, FlagType)
@@ -11,9 +22,18 @@ from CTFdPy.models.challenges import (BaseChallenge, Challenge,
 from CTFdPy.models.files import File
 from CTFdPy.models.flags import Flag
 from CTFdPy.models.hints import Hint, PartialHint
+from CTFdPy.models.scoreboard import ScoreboardEntry
+from CTFdPy.models.submissions import Solve, Submission
 from CTFdPy.models.tags import Tag
+from CTFdPy.models.teams import Team
 from CTFdPy.models.topics import ChallengeTopic, Topic, TopicCreateResult
 from CTFdPy.models.users import User
+from CTFdPy.transport import RetryPolicy, TokenBucket
+from CTFdPy.uploads import (HashManifest, MultipartEncoder, ProgressCallback,
+                            hash_file)
+
+if TYPE_CHECKING:
+    from CTFdPy.journal import Journal
 
 
 class APIResponse(TypedDict):
@@ -23,7 +43,18 @@ class APIResponse(TypedDict):
 
 
 class Client:
-    def __init__(self, url: str = "http://localhost:8080", token: str | None = None, credentials: tuple[str, str] | None = None):
+    def __init__(
+        self,
+        url: str = "http://localhost:8080",
+        token: str | None = None,
+        credentials: tuple[str, str] | None = None,
+        *,
+        max_connections: int = 10,
+        cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = RetryPolicy(),
+        rate_limit: float | TokenBucket | None = None,
+        hooks: Iterable[RequestHook] = ()
+    ):
         self.token = token
         self.credentials = credentials
 
@@ -37,68 +68,172 @@ class Client:
         self.session = requests.Session()
         self.session.headers.update(self.headers)
 
-    def _get(self, endpoint: str) -> APIResponse:
-        """Sends a GET request to the server"""
-        response = self.session.get(self.url + endpoint, json="")
-
+        # Size the connection pool so bulk operations can reuse connections across threads
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Only one thread should log in when uploading files concurrently
+        self._login_lock = threading.Lock()
+
+        # Opt-in cache of GET responses, invalidated by writes through this client
+        self.cache = cache
+
+        # Retries failed requests when it is safe to, set to None to never retry
+        self.retry = retry
+
+        # Limits the requests per second, a TokenBucket can be shared between clients
+        if isinstance(rate_limit, (int, float)):
+            rate_limit = TokenBucket(rate_limit)
+        self.rate_limiter = rate_limit
+
+        # Called around every request, e.g. a MetricsCollector
+        self.hooks: list[RequestHook] = list(hooks)
+
+    def _invalidate(self, endpoint: str) -> None:
+        """Removes the cached responses affected by a write to an endpoint"""
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Sends a request, rate limited and retried according to the client's policies"""
+        # A streamed body cannot be sent twice
+        replayable = not hasattr(kwargs.get("data"), "read")
+        retry = self.retry if replayable else None
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            info = RequestInfo(method, endpoint, endpoint_template(endpoint), attempt) if self.hooks else None
+            for hook in self.hooks:
+                hook.before_request(info)
+
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, self.url + endpoint, **kwargs)
+            except requests.RequestException as e:
+                if info is not None:
+                    info.duration = time.perf_counter() - start
+                    info.error = e
+                    for hook in self.hooks:
+                        hook.on_error(info)
+                if retry is None or not retry.should_retry(method, attempt, error=e):
+                    raise
+                time.sleep(retry.delay(attempt))
+            else:
+                if info is not None:
+                    info.duration = time.perf_counter() - start
+                    info.status = response.status_code
+                    body = response.request.body
+                    info.request_bytes = len(body) if body is not None else 0
+                    info.response_bytes = len(response.content)
+                    for hook in self.hooks:
+                        hook.after_response(info)
+
+                if retry is None or not retry.should_retry(method, attempt, response=response):
+                    return response
+                # Release the connection back to the pool before waiting
+                response.close()
+                time.sleep(retry.delay(attempt, response))
+
+            attempt += 1
+
+    @staticmethod
+    def _handle(response: requests.Response) -> APIResponse:
+        """Raises if the request failed, otherwise returns the decoded response"""
         response.raise_for_status()
         response = response.json()
         if not response["success"]:
             raise Exception(response.get("errors") or response["message"])
         
         return response
+
+    def _get(self, endpoint: str) -> APIResponse:
+        """Sends a GET request to the server"""
+        generation = None
+        if self.cache is not None:
+            cached = self.cache.get(endpoint)
+            if cached is not None:
+                return cached
+            # Taken before the request, so a write made while it is in flight is not undone
+            generation = self.cache.generation(endpoint)
+
+        response = self._handle(self._send("GET", endpoint, json=""))
+
+        if self.cache is not None:
+            self.cache.set(endpoint, response, generation)
+
+        return response
     
     def _post(self, endpoint: str, json: dict[str, Any]) -> APIResponse:
         """Sends a POST request to the server"""
-        response = self.session.post(self.url + endpoint, json=json)
+        response = self._send("POST", endpoint, json=json)
+        self._invalidate(endpoint)
 
-        response.raise_for_status()
-        response = response.json()
-        if not response["success"]:
-            raise Exception(response.get("errors") or response["message"])
-        
-        return response
+        return self._handle(response)
     
     def _post_form(self, endpoint: str, **kwargs) -> APIResponse:
         """Sends a POST request to the server with form data"""
-        if self.session.cookies.get("session") is None:
-            # Auto login
-            if self.credentials is None:
-                raise ValueError("Unable to auto login as credentials are not provided")
-            self.login(*self.credentials)
+        with self._login_lock:
+            if self.session.cookies.get("session") is None:
+                # Auto login
+                if self.credentials is None:
+                    raise ValueError("Unable to auto login as credentials are not provided")
+                self.login(*self.credentials)
 
-        response = self.session.post(self.url + endpoint, allow_redirects=False, **kwargs)
-        
-        # Error handling
-        response.raise_for_status()
-        response = response.json()
-        if not response["success"]:
-            raise Exception(response.get("errors") or response["message"])
-        
-        return response
+        response = self._send("POST", endpoint, allow_redirects=False, **kwargs)
+        self._invalidate(endpoint)
+
+        return self._handle(response)
 
     def _patch(self, endpoint: str, json: dict[str, Any]) -> APIResponse:
         """Sends a PATCH request to the server"""
-        response = self.session.patch(self.url + endpoint, json=json)
+        response = self._send("PATCH", endpoint, json=json)
+        self._invalidate(endpoint)
 
-        response.raise_for_status()
-        response = response.json()
-        if not response["success"]:
-            raise Exception(response.get("errors") or response["message"])
-        
-        return response
+        return self._handle(response)
     
     def _delete(self, endpoint: str) -> APIResponse:
         """Sends a DELETE request to the server"""
-        response = self.session.delete(self.url + endpoint, json="")
-        
-        response.raise_for_status()
-        response = response.json()
-        if not response["success"]:
-            raise Exception(response.get("errors") or response["message"])
-        
-        return response
-    
+        response = self._send("DELETE", endpoint, json="")
+        self._invalidate(endpoint)
+
+        return self._handle(response)
+
+    def _iter_pages(self, endpoint: str, per_page: int | None = None, prefetch: bool = False) -> Iterator[list[Any]]:
+        """Yields the data of every page of a list endpoint
+
+        Pages are followed through `meta.pagination.next`, endpoints that are not
+        paginated are yielded as a single page. With `prefetch`, the next page is
+        requested in the background while the current page is being processed.
+        """
+        separator = "&" if "?" in endpoint else "?"
+        query = f"&per_page={per_page}" if per_page is not None else ""
+
+        def fetch(page: int) -> APIResponse:
+            return self._get(f"{endpoint}{separator}page={page}{query}")
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            response = fetch(1)
+            while True:
+                pagination = (response.get("meta") or {}).get("pagination") or {}
+                next_page = pagination.get("next")
+
+                upcoming = None
+                if next_page is not None and executor is not None:
+                    upcoming = executor.submit(fetch, next_page)
+
+                yield response["data"]
+
+                if next_page is None:
+                    return
+                response = upcoming.result() if upcoming is not None else fetch(next_page)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
     def login(self, username: str, password: str) -> None:
         """Logs in to the server
@@ -152,6 +287,32 @@ class Client:
         return User.from_dict(res["data"])
     
 
+    def iter_users(self, per_page: int | None = None, prefetch: bool = False) -> Iterator[User]:
+        """Lazily yields all users, following pagination
+
+        Parameters
+        ----------
+        per_page : int, optional
+            The number of results per page, by default the server's default
+        prefetch : bool, optional
+            Whether to request the next page while the current one is processed, by default False
+
+        Yields
+        ------
+        User
+            The users
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        for page in self._iter_pages("/api/v1/users", per_page, prefetch):
+            for user in page:
+                yield User.from_dict(user)
+    
+
     def get_users(self) -> list[User]:
         """Gets all users
 
@@ -166,14 +327,17 @@ class Client:
             If the request fails
 
         """
-        res = self._get("users")
-            
-        return [User.from_dict(user) for user in res["data"]]
+        return list(self.iter_users())
     
 
     def _create_user(self, user: User) -> User:
+        if not user.password:
+            user.password = User._generate_password()
         res = self._post("/api/v1/users", user.to_payload()) 
-        return User.from_dict(res["data"])
+        created = User.from_dict(res["data"])
+        # The server never returns the password
+        created.password = user.password
+        return created
     
     def create_user(self, username: str, email: str, password: str | None = None) -> User:
         """Creates a user
@@ -200,7 +364,464 @@ class Client:
         """
         return self._create_user(User(username, email, password))
     
-    # TODO: Implement update_user, delete_user
+
+    def create_users(
+        self,
+        users: Iterable[User | dict[str, str]],
+        workers: int = 8
+    ) -> BulkResult[User, User]:
+        """Creates many users concurrently
+
+        Each user is sent as its own request from a pool of threads.
+        A failed user does not stop the others, every row gets its own result.
+        
+        Parameters
+        ----------
+        users : Iterable[User | dict[str, str]]
+            The users to create, either as users or as dictionaries with
+            `username`, `email` and optionally `password` (e.g. rows from `CSVHandler`)
+        workers : int, optional
+            The number of concurrent requests, by default 8
+
+        Returns
+        -------
+        BulkResult[User, User]
+            The result of every user, in input order. `item` is the input row
+            and `result` is the created user, with its password set
+
+        """
+        return BulkResult(list(self.iter_create_users(users, workers)))
+    
+
+    def iter_create_users(
+        self,
+        users: Iterable[User | dict[str, str]],
+        workers: int = 8
+    ) -> Iterator[BulkItemResult[User, User]]:
+        """Creates many users concurrently, yielding each result as soon as it is available
+
+        Unlike `create_users`, results are not collected, so any number of users can be
+        created in constant memory, e.g. streamed from `CSVHandler.iter_rows` into a
+        `CredentialWriter`. See `create_users` for the parameters
+
+        Yields
+        ------
+        BulkItemResult[User, User]
+            The result of every user, in input order
+
+        """
+        def create(user: User | dict[str, str]) -> User:
+            if not isinstance(user, User):
+                user = User(**user)
+            return self._create_user(user)
+
+        return iter_bulk(create, users, workers)
+    
+    def update_user(self, user_or_id: User | int, /, **kwargs) -> User:
+        """Updates a user
+        You can pass either a user object or a user id
+
+        Only the given fields are sent, so unchanged fields are left alone on the server
+
+        Parameters
+        ----------
+        user_or_id : User | int
+            The user or user id. If a user is passed, only the fields it explicitly
+            sets are sent, see `User.to_changes`, so a partially filled user does not
+            clear the email or unhide the account. Pass a field as a keyword argument
+            to set it back to its default
+        **kwargs
+            The fields to update, e.g. `name`, `email`, `password`, `type`,
+            `verified`, `hidden`, `banned`, `website`, `affiliation` or `country`
+
+        Returns
+        -------
+        User
+            The updated user, with its password set if it was changed
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        if isinstance(user_or_id, User):
+            user_id = user_or_id.id
+            kwargs = {**user_or_id.to_changes(), **kwargs}
+        else:
+            user_id = user_or_id
+
+        res = self._patch(f"/api/v1/users/{user_id}", kwargs)
+
+        updated = User.from_dict(res["data"])
+        # The server never returns the password
+        updated.password = kwargs.get("password")
+        return updated
+    
+
+    def delete_user(self, user_id: int) -> bool:
+        """Deletes a user
+
+        Parameters
+        ----------
+        user_id : int
+            The id of the user
+
+        Returns
+        -------
+        bool
+            Whether the user was successfully deleted
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._delete(f"/api/v1/users/{user_id}")
+        return res["success"]
+    
+
+    def _user_ids(self, users: Iterable[User | int] | Callable[[User], bool]) -> list[int]:
+        """Returns the ids of the given users, or of every user matching a predicate"""
+        if callable(users):
+            return [user.id for user in self.iter_users(prefetch=True) if users(user)]
+        return [user.id if isinstance(user, User) else user for user in users]
+    
+
+    def update_users(
+        self,
+        users: Iterable[User | int] | Callable[[User], bool],
+        workers: int = 8,
+        **kwargs
+    ) -> BulkResult[int, User]:
+        """Applies the same update to many users concurrently
+
+        Parameters
+        ----------
+        users : Iterable[User | int] | Callable[[User], bool]
+            The users or user ids, or a predicate selecting users from every user on the server
+        workers : int, optional
+            The number of concurrent requests, by default 8
+        **kwargs
+            The fields to update, see `update_user`
+
+        Returns
+        -------
+        BulkResult[int, User]
+            The result of every user, with the user id as the item
+
+        """
+        return run_bulk(lambda user_id: self.update_user(user_id, **kwargs), self._user_ids(users), workers)
+    
+
+    def delete_users(
+        self,
+        users: Iterable[User | int] | Callable[[User], bool],
+        workers: int = 8
+    ) -> BulkResult[int, bool]:
+        """Deletes many users concurrently
+
+        Parameters
+        ----------
+        users : Iterable[User | int] | Callable[[User], bool]
+            The users or user ids, or a predicate selecting users from every user on the server
+        workers : int, optional
+            The number of concurrent requests, by default 8
+
+        Returns
+        -------
+        BulkResult[int, bool]
+            The result of every user, with the user id as the item
+
+        """
+        return run_bulk(self.delete_user, self._user_ids(users), workers)
+    
+
+    def ban_users(
+        self,
+        users: Iterable[User | int] | Callable[[User], bool],
+        workers: int = 8,
+        banned: bool = True
+    ) -> BulkResult[int, User]:
+        """Bans or unbans many users concurrently
+
+        Parameters
+        ----------
+        users : Iterable[User | int] | Callable[[User], bool]
+            The users or user ids, or a predicate selecting users from every user on the server
+        workers : int, optional
+            The number of concurrent requests, by default 8
+        banned : bool, optional
+            False to unban the users, by default True
+
+        Returns
+        -------
+        BulkResult[int, User]
+            The result of every user, with the user id as the item
+
+        """
+        return self.update_users(users, workers, banned=banned)
+    
+
+    def reset_passwords(
+        self,
+        users: Iterable[User | int] | Callable[[User], bool],
+        workers: int = 8
+    ) -> BulkResult[int, User]:
+        """Sets a new generated password for many users concurrently
+
+        Parameters
+        ----------
+        users : Iterable[User | int] | Callable[[User], bool]
+            The users or user ids, or a predicate selecting users from every user on the server
+        workers : int, optional
+            The number of concurrent requests, by default 8
+
+        Returns
+        -------
+        BulkResult[int, User]
+            The result of every user, with the user id as the item and the new password set on the result
+
+        """
+        return run_bulk(
+            lambda user_id: self.update_user(user_id, password=User._generate_password()),
+            self._user_ids(users),
+            workers
+        )
+    
+
+    
+
+    # Team related operations
+
+    def get_team(self, team_id: int) -> Team:
+        """Gets a team by id
+
+        Parameters
+        ----------
+        team_id : int
+            The id of the team
+
+        Returns
+        -------
+        Team
+            The team
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._get(f"/api/v1/teams/{team_id}")
+
+        return Team.from_dict(res["data"])
+    
+
+    def iter_teams(self, per_page: int | None = None, prefetch: bool = False) -> Iterator[Team]:
+        """Lazily yields all teams, following pagination
+
+        Parameters
+        ----------
+        per_page : int, optional
+            The number of results per page, by default the server's default
+        prefetch : bool, optional
+            Whether to request the next page while the current one is processed, by default False
+
+        Yields
+        ------
+        Team
+            The teams
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        for page in self._iter_pages("/api/v1/teams", per_page, prefetch):
+            for team in page:
+                yield Team.from_dict(team)
+    
+
+    def get_teams(self) -> list[Team]:
+        """Gets all teams
+
+        Returns
+        -------
+        list[Team]
+            A list of teams
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        return list(self.iter_teams())
+    
+
+    def _create_team(self, team: Team) -> Team:
+        res = self._post("/api/v1/teams", team.to_payload())
+        created = Team.from_dict(res["data"])
+        # The server never returns the password
+        created.password = team.password
+        return created
+    
+    def create_team(self, name: str, email: str | None = None, password: str | None = None) -> Team:
+        """Creates a team
+
+        Parameters
+        ----------
+        name : str
+            The name of the team
+        email : str, optional
+            The email of the team
+        password : str, optional
+            The password members use to join the team, by default None
+
+        Returns
+        -------
+        Team
+            The created team
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        return self._create_team(Team(name, email, password))
+    
+
+    def create_teams(self, teams: Iterable[Team], workers: int = 8) -> BulkResult[Team, Team]:
+        """Creates many teams concurrently
+
+        Parameters
+        ----------
+        teams : Iterable[Team]
+            The teams to create
+        workers : int, optional
+            The number of concurrent requests, by default 8
+
+        Returns
+        -------
+        BulkResult[Team, Team]
+            The result of every team, in input order
+
+        """
+        return run_bulk(self._create_team, teams, workers)
+    
+
+    def update_team(self, team_or_id: Team | int, /, **kwargs) -> Team:
+        """Updates a team
+        You can pass either a team object or a team id
+
+        Parameters
+        ----------
+        team_or_id : Team | int
+            The team or team id. If a team is passed, only the fields it explicitly
+            sets are sent, see `Team.to_changes`
+        **kwargs
+            The fields to update, e.g. `name`, `email`, `password`, `captain_id`,
+            `hidden`, `banned`, `website`, `affiliation` or `country`
+
+        Returns
+        -------
+        Team
+            The updated team
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        if isinstance(team_or_id, Team):
+            team_id = team_or_id.id
+            kwargs = {**team_or_id.to_changes(), **kwargs}
+        else:
+            team_id = team_or_id
+
+        res = self._patch(f"/api/v1/teams/{team_id}", kwargs)
+
+        updated = Team.from_dict(res["data"])
+        updated.password = kwargs.get("password")
+        return updated
+    
+
+    def delete_team(self, team_id: int) -> bool:
+        """Deletes a team, its members are kept but leave the team
+
+        Parameters
+        ----------
+        team_id : int
+            The id of the team
+
+        Returns
+        -------
+        bool
+            Whether the team was successfully deleted
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._delete(f"/api/v1/teams/{team_id}")
+        return res["success"]
+    
+
+    def get_team_members(self, team_id: int) -> list[int]:
+        """Gets the ids of the members of a team
+
+        Parameters
+        ----------
+        team_id : int
+            The id of the team
+
+        Returns
+        -------
+        list[int]
+            The ids of the members
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._get(f"/api/v1/teams/{team_id}/members")
+        return res["data"]
+    
+
+    def add_team_member(self, team_id: int, user_id: int) -> list[int]:
+        """Adds a user to a team
+
+        A user can only be in one team, so this fails if the user already is
+
+        Parameters
+        ----------
+        team_id : int
+            The id of the team
+        user_id : int
+            The id of the user
+
+        Returns
+        -------
+        list[int]
+            The ids of the members of the team, including the new member
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._post(f"/api/v1/teams/{team_id}/members", {"user_id": user_id})
+        return res["data"]
     
 
     # File related operations
@@ -229,12 +850,38 @@ class Client:
         return File.from_dict(res["data"])
 
 
-    def get_files(self) -> list[dict[str, Any]]:
+    def iter_files(self, per_page: int | None = None, prefetch: bool = False) -> Iterator[File]:
+        """Lazily yields all files, following pagination
+
+        Parameters
+        ----------
+        per_page : int, optional
+            The number of results per page, by default the server's default
+        prefetch : bool, optional
+            Whether to request the next page while the current one is processed, by default False
+
+        Yields
+        ------
+        File
+            The files
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        for page in self._iter_pages("/api/v1/files", per_page, prefetch):
+            for file in page:
+                yield File.from_dict(file)
+    
+
+    def get_files(self) -> list[File]:
         """Gets all files
         
         Returns
         -------
-        list[dict[str, Any]]
+        list[File]
             A list of files
 
         Raises
@@ -243,12 +890,54 @@ class Client:
             If the request fails
     
         """
-        res = self._get("/api/v1/files")
+        return list(self.iter_files())
+
+    def _upload_files(
+        self,
+        challenge_id: int,
+        files: list[os.PathLike[Any] | BufferedIOBase],
+        progress: ProgressCallback | None = None
+    ) -> list[File]:
+        encoder = MultipartEncoder(
+            {"challenge_id": str(challenge_id), "type": "challenge"},
+            [("file", f) for f in files],
+            progress
+        )
+        try:
+            res = self._post_form("/api/v1/files", data=encoder, headers={"Content-Type": encoder.content_type})
+        finally:
+            encoder.close()
 
         return [File.from_dict(file) for file in res["data"]]
 
-    def create_file(self, challenge_id: int, *file: os.PathLike[Any] | BufferedIOBase) -> bool:
+    def _upload_files_parallel(
+        self,
+        challenge_id: int,
+        files: list[os.PathLike[Any] | BufferedIOBase],
+        progress: ProgressCallback | None = None,
+        parallel: int = 1
+    ) -> list[File]:
+        """Uploads each file in its own request, `parallel` at a time"""
+        if parallel <= 1 or len(files) <= 1:
+            return self._upload_files(challenge_id, files, progress)
+
+        with ThreadPoolExecutor(max_workers=min(parallel, len(files))) as executor:
+            futures = [executor.submit(self._upload_files, challenge_id, [f], progress) for f in files]
+        return [created for future in futures for created in future.result()]
+
+    def create_file(
+        self,
+        challenge_id: int,
+        *file: os.PathLike[Any] | BufferedIOBase,
+        deduplicate: bool = False,
+        manifest: HashManifest | None = None,
+        progress: ProgressCallback | None = None,
+        parallel: int = 1
+    ) -> bool:
         """Creates a file
+
+        Files are streamed in chunks, so memory use does not depend on their size.
+        Files given as paths are closed once sent, file objects are left open
         
         Parameters
         ----------
@@ -256,6 +945,19 @@ class Client:
             The id of the challenge
         file : os.PathLike[Any] | BufferedIOBase
             The files to upload. Can be a path or a file object
+        deduplicate : bool, optional
+            Whether to skip files whose content is already attached to the challenge, by default False.
+            Files are hashed in chunks and compared with the `sha1sum` of the challenge's files
+            and the hashes recorded in `manifest`
+        manifest : HashManifest, optional
+            A local manifest that caches the hashes of local files and remembers the hashes
+            of uploaded files, for servers that do not report `sha1sum`
+        progress : ProgressCallback, optional
+            Called as the files are sent with the file name, the bytes sent and the total bytes
+            of the request
+        parallel : int, optional
+            The number of files to upload at once, by default 1.
+            Above 1, each file is sent in its own request
 
         Returns
         -------
@@ -270,23 +972,59 @@ class Client:
             If the file is not readable
 
         """
+        try:
+            return self._create_file(challenge_id, file, deduplicate, manifest, progress, parallel)
+        finally:
+            # Saved once per call rather than after every file
+            if manifest is not None:
+                manifest.flush()
 
-        files = []
+    def _create_file(
+        self,
+        challenge_id: int,
+        file: tuple[os.PathLike[Any] | BufferedIOBase, ...],
+        deduplicate: bool,
+        manifest: HashManifest | None,
+        progress: ProgressCallback | None,
+        parallel: int
+    ) -> bool:
+        """Uploads the files of `create_file`, leaving the manifest unsaved"""
+        if not deduplicate:
+            # Hash before uploading, as uploading consumes file objects
+            hashes = [manifest.hash(f) for f in file] if manifest is not None else []
+            created = self._upload_files_parallel(challenge_id, list(file), progress, parallel)
+            for sha1, c in zip(hashes, created):
+                manifest.record(c.location, sha1)
+            return True
+
+        hasher = manifest.hash if manifest is not None else hash_file
+
+        existing = set()
+        for f in self.get_challenge_files(challenge_id):
+            sha1 = f.sha1sum
+            if sha1 is None and manifest is not None:
+                sha1 = manifest.uploaded.get(f.location)
+            if sha1 is not None:
+                existing.add(sha1)
+
+        pending = []
         for f in file:
-            if isinstance(f, BufferedIOBase):
-                if not f.readable():
-                    raise ValueError("File must be readable")
-            elif os.path.isfile(f):
-                f = open(f, "rb")
-            else:
-                raise ValueError("File must be a path or a readable")
-            
-            files.append(("file", (f.name, f)))
+            sha1 = hasher(f)
+            if sha1 in existing:
+                continue
+            # Also skip duplicates within the same call
+            existing.add(sha1)
+            pending.append((f, sha1))
 
-        print(files)
-        
-        res = self._post_form("/api/v1/files", data={"challenge_id": challenge_id, "type": "challenge"}, files=files)
-        return res["success"]
+        if not pending:
+            return True
+
+        created = self._upload_files_parallel(challenge_id, [f for f, _ in pending], progress, parallel)
+        if manifest is not None:
+            for (_, sha1), c in zip(pending, created):
+                manifest.record(c.location, sha1)
+
+        return True
 
     def delete_file(self, file_id: int) -> bool:
         """Deletes a file
@@ -337,6 +1075,32 @@ class Client:
         return Flag.from_dict(res["data"])
     
 
+    def iter_flags(self, per_page: int | None = None, prefetch: bool = False) -> Iterator[Flag]:
+        """Lazily yields all flags, following pagination
+
+        Parameters
+        ----------
+        per_page : int, optional
+            The number of results per page, by default the server's default
+        prefetch : bool, optional
+            Whether to request the next page while the current one is processed, by default False
+
+        Yields
+        ------
+        Flag
+            The flags
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        for page in self._iter_pages("/api/v1/flags", per_page, prefetch):
+            for flag in page:
+                yield Flag.from_dict(flag)
+    
+
     def get_flags(self) -> list[Flag]:
         """Gets all flags
         
@@ -351,9 +1115,7 @@ class Client:
             If the request fails
 
         """
-        res = self._get("/api/v1/flags")
-            
-        return [Flag(**flag) for flag in res["data"]]
+        return list(self.iter_flags())
     
 
     def _create_flag(self, flag: Flag) -> Flag:
@@ -395,7 +1157,7 @@ class Client:
         """
 
         data = CASE_INSENSITIVE if case_insensitive else CASE_SENSITIVE
-        return self._create_flag(Flag(flag, challenge_id, data, type))
+        return self._create_flag(Flag(flag, data, type, challenge_id))
     
 
     @overload
@@ -470,7 +1232,7 @@ class Client:
         
         res = self._patch(f"/api/v1/flags/{flag_id}", kwargs)
         
-        return Flag(**res["data"])
+        return Flag.from_dict(res["data"])
     
     def delete_flag(self, flag_id: int) -> bool:
         """Deletes a flag
@@ -521,6 +1283,32 @@ class Client:
         return Hint.from_dict(res["data"])
     
 
+    def iter_hints(self, per_page: int | None = None, prefetch: bool = False) -> Iterator[PartialHint]:
+        """Lazily yields all partial hints, following pagination
+
+        Parameters
+        ----------
+        per_page : int, optional
+            The number of results per page, by default the server's default
+        prefetch : bool, optional
+            Whether to request the next page while the current one is processed, by default False
+
+        Yields
+        ------
+        PartialHint
+            The partial hints
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        for page in self._iter_pages("/api/v1/hints", per_page, prefetch):
+            for hint in page:
+                yield PartialHint.from_dict(hint)
+    
+
     def get_hints(self) -> list[PartialHint]:
         """Gets all hints
 
@@ -531,9 +1319,7 @@ class Client:
         list[PartialHint]
             A list of partial hints
         """
-        res = self._get("/api/v1/hints")
-
-        return [PartialHint.from_dict(hint) for hint in res["data"]]
+        return list(self.iter_hints())
     
 
     def _create_hint(self, hint: Hint) -> Hint:
@@ -545,7 +1331,7 @@ class Client:
         challenge_or_id: Challenge | int,
         content: str,
         cost: int,
-        requirements: list[Hint] | None = None
+        requirements: list[Hint | int] | None = None
     ) -> Hint:
         """Creates a hint
         
@@ -557,8 +1343,8 @@ class Client:
             The content of the hint
         cost : int
             The cost of the hint
-        requirements : list[Hint], optional
-            The hints required to unlock this hint, by default None
+        requirements : list[Hint | int], optional
+            The hints or hint ids required to unlock this hint, by default None
 
         Returns
         -------
@@ -567,8 +1353,10 @@ class Client:
         """
         if isinstance(challenge_or_id, BaseChallenge):
             challenge_id = challenge_or_id.id
+        else:
+            challenge_id = challenge_or_id
 
-        hint = Hint(challenge_id, content, cost)
+        hint = Hint(cost, content, challenge_id)
 
         if requirements is not None:
             hint.set_requirements(*requirements)
@@ -576,6 +1364,63 @@ class Client:
         return self._create_hint(hint)
     
 
+    def create_hint_chains(
+        self,
+        chains: Iterable[list[Hint]],
+        ordered: bool = True,
+        workers: int = 8
+    ) -> BulkResult[list[Hint], list[Hint]]:
+        """Creates several chains of hints at once, e.g. the hints of many challenges
+
+        Each hint of an ordered chain requires the previous one, so chains are created
+        in waves: the first hint of every chain at once, then the second hint of every
+        chain with its requirement set to the first, and so on. This takes as many round
+        trips as the longest chain, instead of one per hint. Unordered chains are created
+        in a single wave.
+
+        Parameters
+        ----------
+        chains : Iterable[list[Hint]]
+            The chains of hints, with their challenge ids set
+        ordered : bool, optional
+            Whether hints require the previous hint of their chain, by default True
+        workers : int, optional
+            The number of hints to create at once, by default 8
+
+        Returns
+        -------
+        BulkResult[list[Hint], list[Hint]]
+            The outcome of every chain, with the created hints as the result. A chain stops
+            at its first failed hint, and keeps the hints created before it as the result
+        """
+        report = BulkResult([BulkItemResult(i, chain, []) for i, chain in enumerate(chains)])
+
+        if not ordered:
+            hints = [(item, hint) for item in report.results for hint in item.item]
+            for (item, _), outcome in zip(hints, run_bulk(lambda pair: self._create_hint(pair[1]), hints, workers)):
+                if outcome.ok:
+                    item.result.append(outcome.result)
+                elif item.error is None:
+                    item.error = outcome.error
+            return report
+
+        def create(item: BulkItemResult[list[Hint], list[Hint]]) -> Hint:
+            hint = item.item[len(item.result)]
+            if item.result:
+                hint.set_requirements(item.result[-1])
+            return self._create_hint(hint)
+
+        while True:
+            wave = [item for item in report.results if item.ok and len(item.result) < len(item.item)]
+            if not wave:
+                return report
+            for item, outcome in zip(wave, run_bulk(create, wave, workers)):
+                if outcome.ok:
+                    item.result.append(outcome.result)
+                else:
+                    item.error = outcome.error
+
+
     @overload
     def update_hint(
         self,
@@ -583,7 +1428,7 @@ class Client:
         /,
         content: str | None = None,
         cost: int | None = None,
-        requirements: list[Hint] | None = None
+        requirements: list[Hint | int] | None = None
     ) -> Hint:
         ...
 
@@ -594,7 +1439,7 @@ class Client:
         /,
         content: str | None = None,
         cost: int | None = None,
-        requirements: list[Hint] | None = None
+        requirements: list[Hint | int] | None = None
     ) -> Hint:
         ...
 
@@ -618,8 +1463,8 @@ class Client:
             The content of the hint, by default None
         cost : int, optional
             The cost of the hint, by default None
-        requirements : list[Hint], optional
-            The hints required to unlock this hint, by default None
+        requirements : list[Hint | int], optional
+            The hints or hint ids required to unlock this hint, by default None
 
         Returns
         -------
@@ -632,7 +1477,7 @@ class Client:
             If the request fails
 
         """
-        requirements: list[Hint] = kwargs.pop("requirements", None)
+        requirements: list[Hint | int] = kwargs.pop("requirements", None)
 
         if not isinstance(hint_or_id, Hint):
             hint = Hint(id=hint_or_id, **kwargs)
@@ -672,18 +1517,44 @@ class Client:
 
     # Tag related operations
 
-    def get_tag(self, tag_id: int) -> Tag:
-        """Gets a tag by id
-        
+    def get_tag(self, tag_id: int) -> Tag:
+        """Gets a tag by id
+        
+        Parameters
+        ----------
+        tag_id : int
+            The id of the tag
+
+        Returns
+        -------
+        Tag
+            The tag
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._get(f"/api/v1/tags/{tag_id}")
+
+        return Tag.from_dict(res["data"])
+
+
+    def iter_tags(self, per_page: int | None = None, prefetch: bool = False) -> Iterator[Tag]:
+        """Lazily yields all tags, following pagination
+
         Parameters
         ----------
-        tag_id : int
-            The id of the tag
+        per_page : int, optional
+            The number of results per page, by default the server's default
+        prefetch : bool, optional
+            Whether to request the next page while the current one is processed, by default False
 
-        Returns
-        -------
+        Yields
+        ------
         Tag
-            The tag
+            The tags
 
         Raises
         ------
@@ -691,10 +1562,10 @@ class Client:
             If the request fails
 
         """
-        res = self._get(f"/api/v1/tags/{tag_id}")
-
-        return Tag.from_dict(res["data"])
-
+        for page in self._iter_pages("/api/v1/tags", per_page, prefetch):
+            for tag in page:
+                yield Tag.from_dict(tag)
+    
 
     def get_tags(self) -> list[Tag]:
         """Gets all tags
@@ -709,9 +1580,7 @@ class Client:
         requests.HTTPError
             If the request fails
         """
-        res = self._get("/api/v1/tags")
-
-        return [Tag.from_dict(tag) for tag in res["data"]]
+        return list(self.iter_tags())
 
 
     def _create_tag(self, tag: Tag) -> Tag:
@@ -739,7 +1608,7 @@ class Client:
         else:
             challenge_id = challenge_or_id
         
-        return self._create_tag(Tag(challenge_id, value))
+        return self._create_tag(Tag(value, challenge_id))
     
 
     def update_tag(self, tag_or_id: Tag | int, value: str) -> Tag:
@@ -823,6 +1692,32 @@ class Client:
         return Topic.from_dict(res["data"])
     
 
+    def iter_topics(self, per_page: int | None = None, prefetch: bool = False) -> Iterator[Topic]:
+        """Lazily yields all topics, following pagination
+
+        Parameters
+        ----------
+        per_page : int, optional
+            The number of results per page, by default the server's default
+        prefetch : bool, optional
+            Whether to request the next page while the current one is processed, by default False
+
+        Yields
+        ------
+        Topic
+            The topics
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        for page in self._iter_pages("/api/v1/topics", per_page, prefetch):
+            for topic in page:
+                yield Topic.from_dict(topic)
+    
+
     def get_topics(self) -> list[Topic]:
         """Gets all topics
         
@@ -837,9 +1732,7 @@ class Client:
             If the request fails
 
         """
-        res = self._get("/api/v1/topics")
-
-        return [Topic.from_dict(topic) for topic in res["data"]]
+        return list(self.iter_topics())
     
 
     def _create_topic(self, topic: ChallengeTopic) -> TopicCreateResult:
@@ -872,7 +1765,7 @@ class Client:
         else:
             challenge_id = challenge_or_id
         
-        return self._create_topic(ChallengeTopic(challenge_id, value))
+        return self._create_topic(ChallengeTopic(value, challenge_id))
     
 
     def delete_topic(self, topic_id: int) -> bool:
@@ -896,6 +1789,31 @@ class Client:
         """
         res = self._delete(f"/api/v1/topics/{topic_id}")
         return res["success"]
+    
+
+    def delete_challenge_topic(self, challenge_topic_id: int) -> bool:
+        """Removes a topic from a challenge
+
+        Unlike `delete_topic`, this only removes the topic from one challenge
+        
+        Parameters
+        ----------
+        challenge_topic_id : int
+            The unique id of the topic in the challenge, i.e. `ChallengeTopic.id`
+
+        Returns
+        -------
+        bool
+            Whether the topic was successfully removed
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._delete(f"/api/v1/topics?type=challenge&target_id={challenge_topic_id}")
+        return res["success"]
 
 
     # Challenge related operations
@@ -924,6 +1842,32 @@ class Client:
         return Challenge.from_dict(res["data"])
     
 
+    def iter_visible_challenges(self, per_page: int | None = None, prefetch: bool = False) -> Iterator[ChallengePreview]:
+        """Lazily yields all visible challenge previews, following pagination
+
+        Parameters
+        ----------
+        per_page : int, optional
+            The number of results per page, by default the server's default
+        prefetch : bool, optional
+            Whether to request the next page while the current one is processed, by default False
+
+        Yields
+        ------
+        ChallengePreview
+            The visible challenge previews
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        for page in self._iter_pages("/api/v1/challenges", per_page, prefetch):
+            for challenge in page:
+                yield ChallengePreview.from_dict(challenge)
+    
+
     def get_visible_challenges(self) -> list[ChallengePreview]:
         """Gets all visible challenges
         
@@ -940,23 +1884,114 @@ class Client:
             If the request fails
 
         """
-        res = self._get("/api/v1/challenges")
+        return list(self.iter_visible_challenges())
+    
+
+    def iter_challenges(self, per_page: int | None = None, prefetch: bool = False) -> Iterator[ChallengePreview]:
+        """Lazily yields all challenge previews, following pagination
+
+        Parameters
+        ----------
+        per_page : int, optional
+            The number of results per page, by default the server's default
+        prefetch : bool, optional
+            Whether to request the next page while the current one is processed, by default False
+
+        Yields
+        ------
+        ChallengePreview
+            The challenge previews
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        for page in self._iter_pages("/api/v1/challenges?view=admin", per_page, prefetch):
+            for challenge in page:
+                yield ChallengePreview.from_dict(challenge)
+    
+
+    def get_challenges(self) -> list[ChallengePreview]:
+        """Gets all challenges, including hidden ones
+        
+        Returns
+        -------
+        list[ChallengePreview]
+            A list of challenge previews
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        return list(self.iter_challenges())
+    
+
+    def get_challenge_files(self, challenge_id: int) -> list[File]:
+        """Gets the files of a challenge
+        
+        Parameters
+        ----------
+        challenge_id : int
+            The id of the challenge
+
+        Returns
+        -------
+        list[File]
+            A list of files
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._get(f"/api/v1/challenges/{challenge_id}/files")
+
+        return [File.from_dict(file) for file in res["data"]]
+    
+
+    def get_challenge_hints(self, challenge_id: int) -> list[Hint]:
+        """Gets the hints of a challenge
+
+        Unlike `get_hints`, this returns full hints
+        
+        Parameters
+        ----------
+        challenge_id : int
+            The id of the challenge
+
+        Returns
+        -------
+        list[Hint]
+            A list of hints
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._get(f"/api/v1/challenges/{challenge_id}/hints")
 
-        return [ChallengePreview.from_dict(challenge) for challenge in res["data"]]
+        return [Hint.from_dict(hint) for hint in res["data"]]
     
 
-    def get_challenges(self) -> list[Challenge]:
-        """Gets all challenges
+    def get_challenge_topics(self, challenge_id: int) -> list[ChallengeTopic]:
+        """Gets the topics of a challenge
         
         Parameters
         ----------
-        view : str, optional
-            The view of the challenges, by default "admin"
+        challenge_id : int
+            The id of the challenge
 
         Returns
         -------
-        list[Challenge]
-            A list of challenges
+        list[ChallengeTopic]
+            A list of topics
 
         Raises
         ------
@@ -964,11 +1999,23 @@ class Client:
             If the request fails
 
         """
-        res = self._get("/api/v1/challenges?view=admin")
+        res = self._get(f"/api/v1/challenges/{challenge_id}/topics")
 
-        return [ChallengePreview.from_dict(challenge) for challenge in res["data"]]
+        return [ChallengeTopic.from_dict(topic) for topic in res["data"]]
     
 
+    def _create_hint_chain(self, hints: list[Hint], ordered: bool = True) -> list[Hint]:
+        """Creates hints one after another, each requiring the previous one if ordered"""
+        created = []
+        last_hint = None
+        for hint in hints:
+            if ordered:
+                if last_hint is not None:
+                    hint.set_requirements(last_hint)
+            last_hint = self._create_hint(hint)
+            created.append(last_hint)
+        return created
+
     def _create_challenge(
         self,
         challenge: Challenge,
@@ -979,52 +2026,81 @@ class Client:
         files: list[os.PathLike | BufferedIOBase] | None = None,
         *,
         hints_ordered: bool = True,
-        delete_on_error: bool = True
+        delete_on_error: bool = True,
+        workers: int = 1,
+        journal: "Journal | None" = None
     ) -> ChallengeCreateResult:
 
+        key = (challenge.category, challenge.name)
+        if journal is not None:
+            journal.begin(key)
+
         # Create challenge first
         res = self._post("/api/v1/challenges", challenge.to_payload())
 
         challenge_result = ChallengeCreateResult.from_dict(res["data"])
 
+        if journal is not None:
+            journal.created("challenges", challenge_result.id, key)
+
+        # Every sub-resource is independent of the others, except ordered hints
+        # which have to be created as a chain
+        tasks: list[tuple[str, Callable[[], Any]]] = []
+
+        for flag in flags:
+            flag.challenge_id = challenge_result.id
+            tasks.append(("flags", partial(self._create_flag, flag)))
+
+        if hints is not None:
+            for hint in hints:
+                hint.challenge_id = challenge_result.id
+            if hints_ordered:
+                tasks.append(("hints", partial(self._create_hint_chain, hints)))
+            else:
+                tasks.extend(("hints", partial(self._create_hint, hint)) for hint in hints)
+
+        if tags is not None:
+            for tag in tags:
+                tag.challenge_id = challenge_result.id
+                tasks.append(("tags", partial(self._create_tag, tag)))
+
+        if topics is not None:
+            for topic in topics:
+                topic.challenge_id = challenge_result.id
+                tasks.append(("topics", partial(self._create_topic, topic)))
+
+        if files is not None:
+            tasks.append(("files", partial(self.create_file, challenge_result.id, *files)))
+
+        def run(resource: str, task: Callable[[], Any]) -> Any:
+            result = task()
+            if journal is not None:
+                # Uploads only report success, their ids are not known
+                for created in (result if isinstance(result, list) else [result]):
+                    journal.created(resource, getattr(created, "id", None), key)
+            return result
+
         try:
-            # Create flags
-            for flag in flags:
-                flag.challenge_id = challenge_result.id
-                self._create_flag(flag)
-
-            # Create hints
-            last_hint = None
-            if hints is not None:
-                for hint in hints:
-                    if hints_ordered:
-                        if last_hint is not None:
-                            hint.set_requirements(last_hint)
-                    hint.challenge_id = challenge_result.id
-                    hint = self._create_hint(hint)
-                    last_hint = hint
-
-            # Create tags
-            if tags is not None:
-                for tag in tags:
-                    tag.challenge_id = challenge_result.id
-                    self._create_tag(tag)
-
-            # Create topics
-            if topics is not None:
-                for topic in topics:
-                    topic.challenge_id = challenge_result.id
-                    self._create_topic(topic)
-
-            # Create files
-            if files is not None:
-                self.create_file(challenge_result.id, *files)
+            if workers > 1 and len(tasks) > 1:
+                # Wait for every request before rolling back, so nothing is created after the delete
+                with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                    futures = [executor.submit(run, *task) for task in tasks]
+                for future in futures:
+                    future.result()
+            else:
+                for task in tasks:
+                    run(*task)
 
         except Exception as e:
             if delete_on_error:
                 self.delete_challenge(challenge_result.id)
+                if journal is not None:
+                    journal.deleted("challenges", challenge_result.id, key)
             raise e from e
-        
+
+        if journal is not None:
+            journal.done(key)
+
         return challenge_result
     
 
@@ -1050,7 +2126,9 @@ class Client:
         topics: list[str] | None = None,
         files: list[os.PathLike[Any] | BufferedIOBase] | None = None,
         requirements: list[BaseChallenge] | None = None,
-        delete_on_error: bool = True # Whether to delete the challenge if an error occurs
+        delete_on_error: bool = True, # Whether to delete the challenge if an error occurs
+        workers: int = 1, # Number of sub-resources to create at once
+        journal: "Journal | None" = None # Journal recording the created resources
     ) -> ChallengeCreateResult:
         ...
 
@@ -1078,7 +2156,9 @@ class Client:
         topics: list[str] | None = None,
         files: list[os.PathLike[Any] | BufferedIOBase] | None = None,
         requirements: list[BaseChallenge] | None = None,
-        delete_on_error: bool = True # Whether to delete the challenge if an error occurs
+        delete_on_error: bool = True, # Whether to delete the challenge if an error occurs
+        workers: int = 1, # Number of sub-resources to create at once
+        journal: "Journal | None" = None # Journal recording the created resources
     ) -> ChallengeCreateResult:
         ...
 
@@ -1106,7 +2186,9 @@ class Client:
         topics: list[str] | None = None,
         files: list[os.PathLike[Any] | BufferedIOBase] | None = None,
         requirements: list[BaseChallenge] | None = None,
-        delete_on_error: bool = True # Whether to delete the challenge if an error occurs
+        delete_on_error: bool = True, # Whether to delete the challenge if an error occurs
+        workers: int = 1, # Number of sub-resources to create at once
+        journal: "Journal | None" = None # Journal recording the created resources
     ) -> ChallengeCreateResult:
         """Creates a challenge
         
@@ -1156,6 +2238,12 @@ class Client:
             A list of requirements, by default None
         delete_on_error : bool, optional
             Whether to delete the challenge if an error occurs, by default True
+        workers : int, optional
+            The number of flags, hints, tags, topics and files to create at once, by default 1.
+            Ordered hints are always created one after another
+        journal : Journal, optional
+            A journal to record the challenge and its resources in as they are created,
+            so an interrupted creation can be resumed or rolled back, by default None
 
         Returns
         -------
@@ -1192,33 +2280,68 @@ class Client:
         
         if flag is not None:
             flags = [(flag, flag_type, case_insensitive)]
-        elif flags is not None:
-            flags = []
-        else:
+        elif flags is None:
             raise ValueError("Must specify either flag or flags")
         flags = [Flag(flag, CASE_INSENSITIVE if case_insensitive else CASE_SENSITIVE, flag_type) for flag, flag_type, case_insensitive in flags]
 
         # Create hints
         if hints is not None:
-            hints = [Hint(None, content, cost) for content, cost in hints]
+            hints = [Hint(cost, content) for content, cost in hints]
 
         # Create tags
         if tags is not None:
-            tags = [Tag(None, tag) for tag in tags]
+            tags = [Tag(tag) for tag in tags]
 
         # Create topics
         if topics is not None:
-            topics = [ChallengeTopic(None, topic) for topic in topics]
+            topics = [ChallengeTopic(topic) for topic in topics]
 
         # Create requirements
         if requirements is not None:
-            requirements = [Hint(challenge.id) for challenge in requirements]
+            challenge.requirements = {"prerequisites": [c.id for c in requirements]}
 
         return self._create_challenge(
-            challenge, flags, hints, tags, topics, files, hints_ordered=hints_ordered, delete_on_error=delete_on_error
+            challenge, flags, hints, tags, topics, files, hints_ordered=hints_ordered, delete_on_error=delete_on_error,
+            workers=workers, journal=journal
         )
     
 
+    def update_challenge(self, challenge_or_id: Challenge | int, /, **kwargs) -> Challenge:
+        """Updates a challenge
+        You can pass either a challenge object or a challenge id
+
+        Only the given fields are sent, so unchanged fields are left alone on the server
+        
+        Parameters
+        ----------
+        challenge_or_id : Challenge | int
+            The challenge or challenge id. If a challenge is passed, its whole payload is sent
+        **kwargs
+            The fields to update, e.g. `name`, `description`, `value`, `state`,
+            `connection_info`, `max_attempts`, `requirements` or `next_id`
+
+        Returns
+        -------
+        Challenge
+            The updated challenge
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        if isinstance(challenge_or_id, Challenge):
+            challenge_id = challenge_or_id.id
+            kwargs = {**challenge_or_id.to_payload(), **kwargs}
+        else:
+            challenge_id = challenge_or_id
+
+        res = self._patch(f"/api/v1/challenges/{challenge_id}", kwargs)
+
+        return Challenge.from_dict(res["data"])
+    
+
     def delete_challenge(self, challenge_id: int) -> bool:
         """Deletes a challenge
         
@@ -1242,3 +2365,148 @@ class Client:
         return res["success"]
     
 
+    
+
+    # Scoreboard and submission related operations
+
+    def get_scoreboard(self) -> list[ScoreboardEntry]:
+        """Gets the scoreboard, users or teams depending on the CTF mode
+
+        Returns
+        -------
+        list[ScoreboardEntry]
+            The scoreboard, ordered by position
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._get("/api/v1/scoreboard")
+
+        return [ScoreboardEntry.from_dict(entry) for entry in res["data"]]
+    
+
+    def get_challenge_solves(self, challenge_id: int) -> list[Solve]:
+        """Gets the solves of a challenge
+
+        Parameters
+        ----------
+        challenge_id : int
+            The id of the challenge
+
+        Returns
+        -------
+        list[Solve]
+            The solves of the challenge
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._get(f"/api/v1/challenges/{challenge_id}/solves")
+
+        return [Solve.from_dict(solve) for solve in res["data"]]
+    
+
+    def get_submission(self, submission_id: int) -> Submission:
+        """Gets a submission by id
+
+        Parameters
+        ----------
+        submission_id : int
+            The id of the submission
+
+        Returns
+        -------
+        Submission
+            The submission
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        res = self._get(f"/api/v1/submissions/{submission_id}")
+
+        return Submission.from_dict(res["data"])
+    
+
+    @staticmethod
+    def _submissions_endpoint(**filters: Any) -> str:
+        query = urlencode({k: v for k, v in filters.items() if v is not None})
+        return f"/api/v1/submissions?{query}" if query else "/api/v1/submissions"
+    
+
+    def iter_submissions(
+        self,
+        type: Literal["correct", "incorrect"] | None = None,
+        challenge_id: int | None = None,
+        user_id: int | None = None,
+        team_id: int | None = None,
+        per_page: int | None = None,
+        prefetch: bool = False
+    ) -> Iterator[Submission]:
+        """Lazily yields all submissions, following pagination
+
+        To follow new submissions as they come in, use `CTFdPy.poller.SubmissionPoller`
+
+        Parameters
+        ----------
+        type : str, optional
+            Only yield correct or incorrect submissions, by default all
+        challenge_id : int, optional
+            Only yield submissions of a challenge, by default all
+        user_id : int, optional
+            Only yield submissions of a user, by default all
+        team_id : int, optional
+            Only yield submissions of a team, by default all
+        per_page : int, optional
+            The number of results per page, by default the server's default
+        prefetch : bool, optional
+            Whether to request the next page while the current one is processed, by default False
+
+        Yields
+        ------
+        Submission
+            The submissions
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        endpoint = self._submissions_endpoint(
+            type=type, challenge_id=challenge_id, user_id=user_id, team_id=team_id
+        )
+        for page in self._iter_pages(endpoint, per_page, prefetch):
+            for submission in page:
+                yield Submission.from_dict(submission)
+    
+
+    def get_submissions(
+        self,
+        type: Literal["correct", "incorrect"] | None = None,
+        challenge_id: int | None = None,
+        user_id: int | None = None,
+        team_id: int | None = None
+    ) -> list[Submission]:
+        """Gets all submissions, see `iter_submissions` for the filters
+
+        Returns
+        -------
+        list[Submission]
+            The submissions
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+
+        """
+        return list(self.iter_submissions(type, challenge_id, user_id, team_id))
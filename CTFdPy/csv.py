@@ -1,6 +1,15 @@
+from __future__ import annotations
+
 import csv
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterable, Iterator
+
+from CTFdPy.bulk import BulkItemResult
+from CTFdPy.models.teams import Team
+from CTFdPy.models.users import User
+from CTFdPy.teams import TeamRoster, group_roster
 
 
 @dataclass
@@ -12,36 +21,30 @@ class CSVHandler:
 
     def __post_init__(self):
         self.csv_path = Path(self.csv_path_str)
+        self._required = frozenset(self.required_fields)
+        self._allowed = self._required | frozenset(self.optional_fields)
 
     def _check_csv_exists(self) -> bool:
         return self.csv_path.is_file()
 
     def _get_missing_fields(self, headers: list[str]) -> list[str]:
-        stripped_headers = [field.strip() for field in headers]
+        stripped_headers = {field.strip() for field in headers}
         missing_fields = [
             field for field in self.required_fields if field not in stripped_headers]
         return missing_fields
 
     def _get_unexpected_fields(self, headers: list[str]) -> list[str]:
         stripped_headers = [field.strip() for field in headers if field != ""]
-        unexpected_fields = []
-        for field in stripped_headers:
-            if field not in self.required_fields and field not in self.optional_fields:
-                unexpected_fields.append(field)
-        return unexpected_fields
+        return [field for field in stripped_headers if field not in self._allowed]
 
-    def _strip_values(self, row: dict[str, str]) -> dict[str]:
-        stripped_row = {key.strip(): value.strip()
-                        for key, value in row.items()}
-        return stripped_row
-
-    def read_csv(self) -> list[dict[str, str]]:
+    def _iter_dicts(self) -> Iterator[dict[str, str]]:
+        """Validates the headers once, then yields each row with its values stripped"""
         if not self._check_csv_exists():
             raise FileNotFoundError("CSV file does not exist.")
 
         with open(self.csv_path, newline='') as csvfile:
             reader = csv.DictReader(csvfile)
-            headers = reader.fieldnames
+            headers = reader.fieldnames or []
 
             missing_fields = self._get_missing_fields(headers)
             if missing_fields:
@@ -50,11 +53,301 @@ class CSVHandler:
             unexpected_fields = self._get_unexpected_fields(headers)
             if unexpected_fields:
                 raise UnexpectedFieldsError(unexpected_fields)
-            users = [self._strip_values(row) for row in reader]
 
-        return users
+            # Strip the headers once instead of the keys of every row
+            headers = [header.strip() for header in headers]
+            rows = reader.reader
+            for values in rows:
+                if not values:
+                    continue
+                if len(values) != len(headers):
+                    raise InvalidRowError(rows.line_num, len(headers), len(values))
+                yield {
+                    header: value.strip() for header, value in zip(headers, values)
+                }
+
+    def read_csv(self) -> list[dict[str, str]]:
+        """Reads every row of the CSV file into a list"""
+        return list(self._iter_dicts())
+
+    def iter_rows(self) -> Iterator[User]:
+        """Lazily yields a user for each row of the CSV file
+
+        Headers are validated before the first user is yielded, and only one
+        row is held in memory at a time, so the users can be fed straight into
+        `Client.create_users`.
+
+        Yields
+        ------
+        User
+            The user of each row, which gets a generated password when created if none is given
+
+        Raises
+        ------
+        FileNotFoundError
+            If the CSV file does not exist
+        MissingFieldsError
+            If a required field is missing from the headers
+        UnexpectedFieldsError
+            If a header is not a required or optional field
+        InvalidRowError
+            If a row does not have a value for every header
+        """
+        for row in self._iter_dicts():
+            yield User(**row)
+
+    @staticmethod
+    def write_csv(
+        output_path: str,
+        results: Iterable[BulkItemResult[User, User]],
+        batch_size: int = 256
+    ) -> int:
+        """Appends the credentials of created users to a CSV file as the results arrive
+
+        The output has the columns of `CredentialWriter`, not those of the handler, so
+        this does not depend on a handler and can be called as `CSVHandler.write_csv`.
+        See `CredentialWriter` to also resume an interrupted creation
+
+        Parameters
+        ----------
+        output_path : str
+            The credentials file, appended to if it exists
+        results : Iterable[BulkItemResult[User, User]]
+            The results of creating users, e.g. from `Client.iter_create_users`
+        batch_size : int, optional
+            The number of rows written between flushes, by default 256
+
+        Returns
+        -------
+        int
+            The number of users created
+        """
+        with CredentialWriter(output_path, batch_size) as writer:
+            return writer.write_results(results)
+
+
+class CredentialWriter:
+    """Streams the credentials of created users to a CSV file
+
+    Every row has the `id`, `username`, `email`, `password`, `status` and `error` of
+    a user, and the `team` it joins in team mode. A user may have several rows, the
+    last being its current state:
+
+    - `pending` rows are written by `pending` before the user is sent to the server,
+      so a password is on disk before it can be issued, even if the process is killed
+    - `created` and `failed` rows are written by `write` as results arrive
+
+    Teams are written by `write_team`, with their name in `team` and no `username`.
+    Files written before the `team` column existed keep their columns when appended to.
+
+    Rows are flushed, and synced to disk if `sync`, once per batch rather than per row.
+    Reopening the file resumes: `pending` skips users already created and gives users
+    that were pending or failed the password they were written with, so a user that was
+    created without its outcome being written still gets the recorded password.
+
+        with CredentialWriter("credentials.csv") as writer:
+            users = writer.pending(CSVHandler("users.csv").iter_rows())
+            writer.write_results(client.iter_create_users(users, workers=16))
+
+    Parameters
+    ----------
+    path : str
+        The credentials file, appended to if it exists
+    batch_size : int, optional
+        The number of rows written between flushes, by default 256
+    sync : bool, optional
+        Whether to fsync after every flush, by default True
+    """
+    FIELDS = ["id", "username", "email", "password", "status", "error", "team"]
+
+    def __init__(self, path: str, batch_size: int = 256, sync: bool = True):
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.sync = sync
+
+        # Only the outcome of each username is kept, not the rows
+        self.created: set[str] = set()
+        self._passwords: dict[str, str] = {}
+        for row in self.read(path):
+            if not row["username"]:
+                continue
+            if row["status"] == "created":
+                self.created.add(row["username"])
+                self._passwords.pop(row["username"], None)
+            elif row["password"]:
+                self._passwords[row["username"]] = row["password"]
+
+        is_new = not self.path.is_file() or self.path.stat().st_size == 0
+        fields = self.FIELDS
+        if not is_new:
+            with open(self.path, newline="") as f:
+                fields = next(csv.reader(f), None) or self.FIELDS
+        self._file = open(self.path, "a", newline="")
+        self._writer = csv.DictWriter(self._file, fields, extrasaction="ignore")
+        if is_new:
+            self._writer.writeheader()
+        self._unflushed = 0
+
+    @staticmethod
+    def read(path: str) -> Iterator[dict[str, str]]:
+        """Lazily yields the rows of a credentials file, nothing if it does not exist"""
+        if not os.path.isfile(path):
+            return
+        with open(path, newline="") as f:
+            yield from csv.DictReader(f)
+
+    def _write_row(
+        self,
+        user: User | Team,
+        status: str,
+        error: Exception | None = None,
+        team: str | None = None
+    ) -> None:
+        self._writer.writerow({
+            "id": "" if user.id is None else user.id,
+            "username": user.username if isinstance(user, User) else "",
+            "email": user.email or "",
+            "password": user.password or "",
+            "status": status,
+            "error": "" if error is None else str(error),
+            "team": user.name if isinstance(user, Team) else team or ""
+        })
+        self._unflushed += 1
+
+    def pending(self, users: Iterable[User | dict[str, str]]) -> Iterator[User]:
+        """Lazily yields the users that still have to be created, with their passwords
 
-    # TODO: write_csv method
+        Users are taken a batch at a time, given a password if they have none, and
+        written as `pending` and flushed before any of the batch is yielded
+
+        Parameters
+        ----------
+        users : Iterable[User | dict[str, str]]
+            Every user to create, including the ones created before resuming
+
+        Yields
+        ------
+        User
+            The users that were not created yet
+        """
+        batch: list[User] = []
+        for user in users:
+            if not isinstance(user, User):
+                user = User(**user)
+            if user.username in self.created:
+                continue
+            self.write_pending(user)
+            batch.append(user)
+
+            if len(batch) >= self.batch_size:
+                self.flush()
+                yield from batch
+                batch = []
+
+        self.flush()
+        yield from batch
+
+    def write_pending(self, user: User, team: str | None = None) -> None:
+        """Gives a user its recorded or a generated password if it has none, and writes it as `pending`
+
+        The row is only flushed with its batch, call `flush` before sending the user to the server
+        """
+        if not user.password:
+            user.password = self._passwords.get(user.username) or User._generate_password()
+        self._write_row(user, "pending", team=team)
+
+    def write(self, result: BulkItemResult[User, User], team: str | None = None) -> None:
+        """Writes the outcome of creating a user, flushing once a batch is written
+
+        `team` is the name of the team the user is created for, if any
+        """
+        if result.ok:
+            self._write_row(result.result, "created", team=team)
+            self.created.add(result.result.username)
+            self._passwords.pop(result.result.username, None)
+        else:
+            item = result.item if isinstance(result.item, User) else User(**result.item)
+            self._write_row(item, "failed", result.error, team)
+            if item.password:
+                self._passwords[item.username] = item.password
+
+        if self._unflushed >= self.batch_size:
+            self.flush()
+
+    def write_team(self, result: BulkItemResult[Team, Team]) -> None:
+        """Writes the outcome of creating a team, flushing once a batch is written"""
+        if result.ok:
+            self._write_row(result.result, "created")
+        else:
+            self._write_row(result.item, "failed", result.error)
+
+        if self._unflushed >= self.batch_size:
+            self.flush()
+
+    def write_results(self, results: Iterable[BulkItemResult[User, User]]) -> int:
+        """Writes the outcome of every result as it arrives
+
+        Returns
+        -------
+        int
+            The number of users created
+        """
+        created = 0
+        for result in results:
+            self.write(result)
+            created += result.ok
+        return created
+
+    def flush(self) -> None:
+        if not self._unflushed:
+            return
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+        self._unflushed = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> CredentialWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@dataclass
+class RosterCSVHandler(CSVHandler):
+    """Reads a team roster, a row per user with the name of their team
+
+    See `CTFdPy.teams` for the format
+    """
+    required_fields: list[str] = field(default_factory=lambda: ['team', 'username', 'email'])
+    optional_fields: list[str] = field(default_factory=lambda: ['password', 'team_email', 'team_password'])
+
+    def read_rosters(self) -> list[TeamRoster]:
+        """Reads the CSV file and groups its users by team
+
+        Returns
+        -------
+        list[TeamRoster]
+            The teams with their members, in the order teams first appear
+
+        Raises
+        ------
+        FileNotFoundError
+            If the CSV file does not exist
+        MissingFieldsError
+            If a required field is missing from the headers
+        UnexpectedFieldsError
+            If a header is not a required or optional field
+        InvalidRowError
+            If a row does not have a value for every header
+        """
+        return group_roster(self._iter_dicts())
 
 
 class MissingFieldsError(Exception):
@@ -76,3 +369,13 @@ class UnexpectedFieldsError(Exception):
         else: 
             unexpected_fields_str = ', '.join(self.unexpected_fields)
             return f"Unexpected fields found in the CSV file: {unexpected_fields_str}"
+
+
+class InvalidRowError(Exception):
+    def __init__(self, line_num: int, expected: int, found: int):
+        self.line_num = line_num
+        self.expected = expected
+        self.found = found
+
+    def __str__(self):
+        return f"Line {self.line_num} of the CSV file has {self.found} fields, expected {self.expected}"
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from CTFdPy.client import Client
+
+INT64 = "int64"
+FLOAT64 = "float64"
+BOOL = "bool"
+STRING = "string"
+
+# The array typecode and NumPy dtype of every numeric kind
+_NUMERIC = {INT64: ("q", "<i8"), FLOAT64: ("d", "<f8"), BOOL: ("B", "|b1")}
+_CASTS = {INT64: int, FLOAT64: float, BOOL: bool}
+
+# The .npy header is padded to a fixed size, so it can be rewritten once the length is known
+HEADER_SIZE = 128
+
+# The list endpoint and the columns exported of every resource, other keys are ignored.
+# Only columns of the listings, the details of every record would cost a request each
+SCHEMAS: dict[str, tuple[str, dict[str, str]]] = {
+    "challenges": ("/api/v1/challenges?view=admin", {
+        "id": INT64, "name": STRING, "category": STRING, "type": STRING, "value": INT64, "solves": INT64
+    }),
+    "flags": ("/api/v1/flags", {
+        "id": INT64, "challenge_id": INT64, "type": STRING, "content": STRING, "data": STRING
+    }),
+    "hints": ("/api/v1/hints", {"id": INT64, "challenge_id": INT64, "cost": INT64}),
+    "tags": ("/api/v1/tags", {"id": INT64, "challenge_id": INT64, "value": STRING}),
+    "topics": ("/api/v1/topics", {"id": INT64, "value": STRING}),
+    "files": ("/api/v1/files", {"id": INT64, "type": STRING, "location": STRING, "sha1sum": STRING}),
+    "users": ("/api/v1/users", {
+        "id": INT64, "name": STRING, "email": STRING, "type": STRING,
+        "verified": BOOL, "hidden": BOOL, "banned": BOOL, "website": STRING,
+        "affiliation": STRING, "country": STRING, "team_id": INT64, "created": STRING
+    }),
+}
+
+
+class _NpyFile:
+    """A one-dimensional .npy file written incrementally
+
+    The header is rewritten with the final length when the file is closed.
+    """
+
+    def __init__(self, path: str, descr: str):
+        self.descr = descr
+        self.length = 0
+        self.file = open(path, "wb")
+        self.file.write(self._header())
+
+    def _header(self) -> bytes:
+        header = f"{{'descr': '{self.descr}', 'fortran_order': False, 'shape': ({self.length},), }}"
+        # Magic, version 1.0, header length, then the header padded with spaces and ending with a newline
+        return (
+            b"\x93NUMPY\x01\x00" + struct.pack("<H", HEADER_SIZE - 10)
+            + header.encode().ljust(HEADER_SIZE - 11) + b"\n"
+        )
+
+    def write(self, data: array | bytes) -> None:
+        if isinstance(data, array) and data.itemsize > 1 and sys.byteorder == "big":
+            data = array(data.typecode, data)
+            data.byteswap()
+        self.file.write(data)
+        self.length += len(data)
+
+    def close(self) -> None:
+        self.file.seek(0)
+        self.file.write(self._header())
+        self.file.close()
+
+
+class _ColumnWriter:
+    """Writes a column of a table to disk, a page at a time
+
+    Numeric columns are written to `<name>.npy`. String columns are written like
+    Arrow large strings, as the UTF-8 bytes of all values in `<name>.data.npy` and
+    the start of every value in `<name>.offsets.npy`, which has one more item than
+    there are rows. Values that are not strings are written as JSON. Missing values
+    are marked in `<name>.validity.npy`, which is removed if there are none.
+    """
+
+    def __init__(self, directory: str, name: str, kind: str):
+        self.name = name
+        self.kind = kind
+        self.null_count = 0
+        self._validity_path = os.path.join(directory, f"{name}.validity.npy")
+        self._validity = _NpyFile(self._validity_path, "|b1")
+
+        if kind == STRING:
+            self._offset = 0
+            self._offsets = _NpyFile(os.path.join(directory, f"{name}.offsets.npy"), "<i8")
+            self._data = _NpyFile(os.path.join(directory, f"{name}.data.npy"), "|u1")
+            self._offsets.write(array("q", [0]))
+        elif kind in _NUMERIC:
+            self._values = _NpyFile(os.path.join(directory, f"{name}.npy"), _NUMERIC[kind][1])
+        else:
+            raise ValueError(f"Unknown column kind {kind}")
+
+    def append(self, values: list[Any]) -> None:
+        validity = array("B", [value is not None for value in values])
+        self.null_count += len(validity) - sum(validity)
+        self._validity.write(validity)
+
+        if self.kind == STRING:
+            chunks = []
+            offsets = array("q")
+            for value in values:
+                if value is not None:
+                    encoded = (value if isinstance(value, str) else json.dumps(value)).encode()
+                    chunks.append(encoded)
+                    self._offset += len(encoded)
+                offsets.append(self._offset)
+            self._data.write(b"".join(chunks))
+            self._offsets.write(offsets)
+        else:
+            cast = _CASTS[self.kind]
+            self._values.write(array(
+                _NUMERIC[self.kind][0], [0 if value is None else cast(value) for value in values]
+            ))
+
+    def close(self) -> dict[str, Any]:
+        self._validity.close()
+        if self.null_count == 0:
+            os.remove(self._validity_path)
+
+        if self.kind == STRING:
+            self._offsets.close()
+            self._data.close()
+        else:
+            self._values.close()
+        return {"kind": self.kind, "null_count": self.null_count}
+
+
+def write_table(directory: str, columns: dict[str, str], pages: Iterable[list[dict[str, Any]]]) -> dict[str, Any]:
+    """Writes pages of records as a columnar table, holding a single page in memory
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the table, created if needed
+    columns : dict[str, str]
+        The kind of every column, any of `int64`, `float64`, `bool` or `string`
+    pages : Iterable[list[dict[str, Any]]]
+        The records, missing keys are written as missing values
+
+    Returns
+    -------
+    dict[str, Any]
+        The number of rows and the kind and null count of every column
+    """
+    os.makedirs(directory, exist_ok=True)
+    writers = [_ColumnWriter(directory, name, kind) for name, kind in columns.items()]
+    rows = 0
+    try:
+        for page in pages:
+            rows += len(page)
+            for writer in writers:
+                writer.append([record.get(writer.name) for record in page])
+    finally:
+        schema = {writer.name: writer.close() for writer in writers}
+    return {"rows": rows, "columns": schema}
+
+
+def export(
+    client: Client,
+    directory: str,
+    resources: Iterable[str] | None = None,
+    *,
+    per_page: int | None = None,
+    workers: int = 4
+) -> dict[str, int]:
+    """Exports the state of CTFd as columnar tables, one per resource
+
+    Every resource is streamed page by page into `<directory>/<resource>/`, and
+    their schemas are written to `<directory>/schema.json`. The tables can be
+    loaded with `load_numpy`, `load_arrow` or `load_pandas`.
+
+    Parameters
+    ----------
+    client : Client
+        The client to export with
+    directory : str
+        The directory to export to, created if needed
+    resources : Iterable[str], optional
+        The resources to export, any of the keys of `SCHEMAS`, by default all
+    per_page : int, optional
+        The number of records requested per page, by default the server's default
+    workers : int, optional
+        The number of resources exported concurrently, by default 4
+
+    Returns
+    -------
+    dict[str, int]
+        The number of rows exported of every resource
+    """
+    resources = list(resources) if resources is not None else list(SCHEMAS)
+    unknown = set(resources) - set(SCHEMAS)
+    if unknown:
+        raise ValueError(f"Unknown resources: {', '.join(sorted(unknown))}")
+
+    def export_resource(resource: str) -> dict[str, Any]:
+        endpoint, columns = SCHEMAS[resource]
+        pages = client._iter_pages(endpoint, per_page, prefetch=True)
+        return write_table(os.path.join(directory, resource), columns, pages)
+
+    os.makedirs(directory, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        schema = dict(zip(resources, executor.map(export_resource, resources)))
+
+    with open(os.path.join(directory, "schema.json"), "w") as f:
+        json.dump(schema, f, indent=2)
+    return {resource: table["rows"] for resource, table in schema.items()}
+
+
+def _read_schema(directory: str, resource: str) -> dict[str, Any]:
+    with open(os.path.join(directory, "schema.json")) as f:
+        schema = json.load(f)
+    if resource not in schema:
+        raise ValueError(f"{resource} was not exported to {directory}")
+    return schema[resource]
+
+
+def load_numpy(directory: str, resource: str) -> dict[str, Any]:
+    """Loads an exported table as NumPy arrays
+
+    Numeric columns are memory-mapped without copying, and are masked arrays if they
+    have missing values. String columns are decoded into object arrays, use `load_arrow`
+    to keep them memory-mapped. Requires `numpy`.
+
+    Parameters
+    ----------
+    directory : str
+        The directory passed to `export`
+    resource : str
+        The resource to load
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        The arrays of every column
+    """
+    import numpy as np
+
+    table = _read_schema(directory, resource)
+    path = os.path.join(directory, resource)
+    arrays = {}
+    for name, column in table["columns"].items():
+        validity = None
+        if column["null_count"]:
+            validity = np.load(os.path.join(path, f"{name}.validity.npy"), mmap_mode="r")
+
+        if column["kind"] == STRING:
+            offsets = np.load(os.path.join(path, f"{name}.offsets.npy"), mmap_mode="r")
+            data = np.load(os.path.join(path, f"{name}.data.npy"), mmap_mode="r")
+            raw = data.tobytes()
+            values = np.array([
+                raw[offsets[i]:offsets[i + 1]].decode() if validity is None or validity[i] else None
+                for i in range(table["rows"])
+            ], dtype=object)
+        else:
+            values = np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            if validity is not None:
+                values = np.ma.masked_array(values, mask=~validity)
+        arrays[name] = values
+    return arrays
+
+
+def load_arrow(directory: str, resource: str):
+    """Loads an exported table as a `pyarrow.Table`
+
+    Every column except booleans, which Arrow packs into bits, is memory-mapped
+    without copying. Requires `numpy` and `pyarrow`.
+
+    Parameters
+    ----------
+    directory : str
+        The directory passed to `export`
+    resource : str
+        The resource to load
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    types = {INT64: pa.int64(), FLOAT64: pa.float64(), STRING: pa.large_string()}
+
+    table = _read_schema(directory, resource)
+    path = os.path.join(directory, resource)
+    rows = table["rows"]
+    columns = {}
+    for name, column in table["columns"].items():
+        bitmap = None
+        validity = None
+        if column["null_count"]:
+            validity = np.load(os.path.join(path, f"{name}.validity.npy"), mmap_mode="r")
+            bitmap = pa.py_buffer(np.packbits(validity, bitorder="little"))
+
+        kind = column["kind"]
+        if kind == BOOL:
+            values = np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            columns[name] = pa.array(values, mask=None if validity is None else ~validity)
+        elif kind == STRING:
+            offsets = np.load(os.path.join(path, f"{name}.offsets.npy"), mmap_mode="r")
+            data = np.load(os.path.join(path, f"{name}.data.npy"), mmap_mode="r")
+            columns[name] = pa.Array.from_buffers(
+                types[kind], rows, [bitmap, pa.py_buffer(offsets), pa.py_buffer(data)], column["null_count"]
+            )
+        else:
+            values = np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            columns[name] = pa.Array.from_buffers(
+                types[kind], rows, [bitmap, pa.py_buffer(values)], column["null_count"]
+            )
+    return pa.table(columns)
+
+
+def load_pandas(directory: str, resource: str):
+    """Loads an exported table as a `pandas.DataFrame`
+
+    With `pyarrow`, the columns are backed by Arrow and memory-mapped, otherwise they
+    are built from `load_numpy`. Requires `numpy` and `pandas`.
+
+    Parameters
+    ----------
+    directory : str
+        The directory passed to `export`
+    resource : str
+        The resource to load
+    """
+    import pandas as pd
+
+    try:
+        table = load_arrow(directory, resource)
+    except ImportError:
+        return pd.DataFrame(load_numpy(directory, resource))
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def write_parquet(directory: str, output: str, resources: Iterable[str] | None = None) -> None:
+    """Converts exported tables to Parquet files, `<output>/<resource>.parquet`
+
+    Requires `numpy` and `pyarrow`.
+
+    Parameters
+    ----------
+    directory : str
+        The directory passed to `export`
+    output : str
+        The directory to write to, created if needed
+    resources : Iterable[str], optional
+        The resources to convert, by default all exported ones
+    """
+    import pyarrow.parquet as pq
+
+    if resources is None:
+        with open(os.path.join(directory, "schema.json")) as f:
+            resources = list(json.load(f))
+
+    os.makedirs(output, exist_ok=True)
+    for resource in resources:
+        pq.write_table(load_arrow(directory, resource), os.path.join(output, f"{resource}.parquet"))
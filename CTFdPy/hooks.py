@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Returns the endpoint with ids replaced and the query removed,
+    e.g. `/api/v1/challenges/<id>/flags` for `/api/v1/challenges/12/flags?page=1`
+    """
+    return _ID_SEGMENT.sub("/<id>", urlsplit(endpoint).path)
+
+
+@dataclass
+class RequestInfo:
+    """Represents a single HTTP request sent by the client
+
+    Retries are sent as separate requests, with an increasing `attempt`.
+    """
+    method: str
+    endpoint: str
+    template: str
+    attempt: int = 0
+    status: int | None = None              # Set once a response is received
+    request_bytes: int | None = None       # Set once a response is received
+    response_bytes: int | None = None      # Set once a response is received
+    duration: float | None = None          # In seconds, set once the request completes or fails
+    error: Exception | None = None         # Set if the request could not be sent
+
+
+class RequestHook:
+    """The base class of request hooks
+
+    Override any of the callbacks, they are called from the thread sending the request
+    and must be thread safe if the client is used from several threads.
+    """
+
+    def before_request(self, info: RequestInfo) -> None:
+        """Called before a request is sent"""
+
+    def after_response(self, info: RequestInfo) -> None:
+        """Called after a response is received, whatever its status"""
+
+    def on_error(self, info: RequestInfo) -> None:
+        """Called when a request fails without a response, e.g. on a connection error"""
+
+
+@dataclass
+class EndpointMetrics:
+    """The metrics of a single method and endpoint template"""
+    buckets: tuple[float, ...]
+    requests: int = 0
+    errors: int = 0                        # Requests without a response or with a status of 400 and above
+    request_bytes: int = 0
+    response_bytes: int = 0
+    duration_sum: float = 0.0
+    bucket_counts: list[int] = field(default_factory=list)     # Non-cumulative, the last one is +Inf
+    statuses: Counter[int] = field(default_factory=Counter)
+
+    def __post_init__(self):
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, duration: float) -> None:
+        self.duration_sum += duration
+        self.bucket_counts[bisect.bisect_left(self.buckets, duration)] += 1
+
+    def quantile(self, q: float) -> float | None:
+        """Estimates a latency quantile from the histogram, e.g. `0.99` for p99"""
+        total = sum(self.bucket_counts)
+        if total == 0:
+            return None
+
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(self.bucket_counts):
+            if seen + count >= rank and count > 0:
+                if i == len(self.buckets):
+                    # Nothing is known above the largest bucket
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+
+class MetricsCollector(RequestHook):
+    """Collects request counters and latency histograms per method and endpoint template
+
+    Parameters
+    ----------
+    buckets : tuple[float, ...], optional
+        The upper bounds of the latency histogram buckets in seconds
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _metrics(self, info: RequestInfo) -> EndpointMetrics:
+        key = (info.method, info.template)
+        metrics = self.endpoints.get(key)
+        if metrics is None:
+            metrics = self.endpoints[key] = EndpointMetrics(self.buckets)
+        return metrics
+
+    def after_response(self, info: RequestInfo) -> None:
+        with self._lock:
+            metrics = self._metrics(info)
+            metrics.requests += 1
+            metrics.statuses[info.status] += 1
+            if info.status >= 400:
+                metrics.errors += 1
+            metrics.request_bytes += info.request_bytes or 0
+            metrics.response_bytes += info.response_bytes or 0
+            metrics.observe(info.duration)
+
+    def on_error(self, info: RequestInfo) -> None:
+        with self._lock:
+            metrics = self._metrics(info)
+            metrics.requests += 1
+            metrics.errors += 1
+            metrics.observe(info.duration)
+
+    @property
+    def total_requests(self) -> int:
+        """Returns the number of requests sent, including retries"""
+        with self._lock:
+            return sum(metrics.requests for metrics in self.endpoints.values())
+
+    def reset(self) -> None:
+        """Removes all collected metrics"""
+        with self._lock:
+            self.endpoints.clear()
+
+    def to_prometheus(self, prefix: str = "ctfdpy") -> str:
+        """Returns the metrics in the Prometheus text exposition format"""
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+
+        lines = [
+            f"# HELP {prefix}_requests_total Requests sent to CTFd by status.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        for (method, template), metrics in endpoints:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(f'{prefix}_requests_total{{method="{method}",endpoint="{template}",status="{status}"}} {count}')
+
+        lines += [
+            f"# HELP {prefix}_request_errors_total Requests that failed or returned a status of 400 and above.",
+            f"# TYPE {prefix}_request_errors_total counter",
+        ]
+        for (method, template), metrics in endpoints:
+            lines.append(f'{prefix}_request_errors_total{{method="{method}",endpoint="{template}"}} {metrics.errors}')
+
+        for name, attribute, description in (
+            ("request_bytes_total", "request_bytes", "Bytes sent in request bodies."),
+            ("response_bytes_total", "response_bytes", "Bytes received in response bodies."),
+        ):
+            lines += [f"# HELP {prefix}_{name} {description}", f"# TYPE {prefix}_{name} counter"]
+            for (method, template), metrics in endpoints:
+                lines.append(f'{prefix}_{name}{{method="{method}",endpoint="{template}"}} {getattr(metrics, attribute)}')
+
+        lines += [
+            f"# HELP {prefix}_request_duration_seconds Request latency.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for (method, template), metrics in endpoints:
+            labels = f'method="{method}",endpoint="{template}"'
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), metrics.bucket_counts):
+                cumulative += count
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {metrics.duration_sum}")
+            lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {cumulative}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,327 @@
+"""A write-ahead journal of the resources created on CTFd
+
+Every step of creating a challenge is appended to a JSON lines file and synced
+to disk before the next step, so a deploy that is killed or fails to clean up
+after itself can be resumed or rolled back from the journal alone:
+
+    python -m CTFdPy.journal status deploy.journal
+    python -m CTFdPy.journal rollback deploy.journal --url https://ctf.example.com --token $CTFD_TOKEN
+    python -m CTFdPy.journal resume deploy.journal pack/ --url https://ctf.example.com --token $CTFD_TOKEN
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable
+from urllib.parse import quote
+
+from CTFdPy.bulk import BulkResult, run_bulk
+from CTFdPy.sync import ChallengeKey
+
+if TYPE_CHECKING:
+    from CTFdPy.client import Client
+    from CTFdPy.loader import PackChallenge
+    from CTFdPy.models.challenges import ChallengeCreateResult
+
+
+class Journal:
+    """Appends the steps of creating challenges to a file
+
+    Records are flushed, and synced to disk if `sync`, before the method recording them
+    returns, so a record is never lost once the step it describes has been taken.
+    The journal is safe to share between threads.
+
+    Parameters
+    ----------
+    path : str
+        The journal file, appended to if it exists
+    sync : bool, optional
+        Whether to fsync after every record, by default True
+    """
+
+    def __init__(self, path: str, sync: bool = True):
+        self.path = path
+        self.sync = sync
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def record(self, op: str, **fields: Any) -> None:
+        line = json.dumps({"op": op, "time": time.time(), **fields})
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            if self.sync:
+                os.fsync(self._file.fileno())
+
+    def begin(self, key: ChallengeKey) -> None:
+        """Records that a challenge is about to be created"""
+        self.record("begin", key=list(key))
+
+    def created(self, resource: str, id: int | None, key: ChallengeKey) -> None:
+        """Records that a resource of a challenge, or the challenge itself, was created"""
+        self.record("created", resource=resource, id=id, key=list(key))
+
+    def done(self, key: ChallengeKey) -> None:
+        """Records that a challenge and everything attached to it was created"""
+        self.record("done", key=list(key))
+
+    def deleted(self, resource: str, id: int, key: ChallengeKey) -> None:
+        """Records that a resource was deleted"""
+        self.record("deleted", resource=resource, id=id, key=list(key))
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> Journal:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@dataclass
+class JournalChallenge:
+    """Represents what a journal knows about a challenge"""
+    key: ChallengeKey
+    ids: list[int] = field(default_factory=list)                          # Created and not deleted, the last is the latest attempt
+    resources: list[tuple[str, int | None]] = field(default_factory=list)  # Created for the latest attempt
+    pending: bool = False                                                 # Whether its creation began without a recorded id
+    done: bool = False                                                    # Whether the latest attempt completed
+
+    @property
+    def incomplete(self) -> bool:
+        return not self.done and (self.pending or bool(self.ids))
+
+
+@dataclass
+class JournalState:
+    """Represents the state of the challenges recorded in a journal"""
+    challenges: dict[ChallengeKey, JournalChallenge] = field(default_factory=dict)
+
+    @classmethod
+    def read(cls, path: str) -> JournalState:
+        """Replays a journal, ignoring a last record truncated by a crash"""
+        state = cls()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                key = tuple(record["key"])
+                challenge = state.challenges.setdefault(key, JournalChallenge(key))
+                op = record["op"]
+                if op == "begin":
+                    challenge.pending = True
+                    challenge.done = False
+                    challenge.resources = []
+                elif op == "created" and record["resource"] == "challenges":
+                    challenge.pending = False
+                    challenge.ids.append(record["id"])
+                elif op == "created":
+                    challenge.resources.append((record["resource"], record["id"]))
+                elif op == "done":
+                    challenge.done = True
+                elif op == "deleted" and record["resource"] == "challenges":
+                    if record["id"] in challenge.ids:
+                        challenge.ids.remove(record["id"])
+                    if not challenge.ids:
+                        challenge.done = False
+                elif op == "rolled_back":
+                    challenge.pending = False
+                    challenge.done = False
+        return state
+
+    @property
+    def completed(self) -> list[JournalChallenge]:
+        return [c for c in self.challenges.values() if c.done]
+
+    @property
+    def incomplete(self) -> list[JournalChallenge]:
+        return [c for c in self.challenges.values() if c.incomplete]
+
+
+def _find_challenge_ids(client: Client, key: ChallengeKey) -> list[int]:
+    """Finds a challenge whose creation was interrupted before its id was recorded"""
+    category, name = key
+    ids = []
+    for page in client._iter_pages(f"/api/v1/challenges?view=admin&field=name&q={quote(name)}"):
+        ids.extend(c["id"] for c in page if c["name"] == name and c["category"] == category)
+    return ids
+
+
+def _delete_challenges(
+    client: Client,
+    journal: Journal,
+    challenges: list[JournalChallenge],
+    workers: int
+) -> BulkResult[JournalChallenge, list[int]]:
+    def delete(challenge: JournalChallenge) -> list[int]:
+        ids = list(challenge.ids)
+        if challenge.pending:
+            # The challenge may have been created before the process died
+            ids.extend(id for id in _find_challenge_ids(client, challenge.key) if id not in ids)
+        # Flags, hints, tags, topics and files are deleted with their challenge
+        for id in reversed(ids):
+            try:
+                client.delete_challenge(id)
+            except Exception as e:
+                response = getattr(e, "response", None)
+                if response is None or response.status_code != 404:
+                    raise
+            journal.deleted("challenges", id, challenge.key)
+        journal.record("rolled_back", key=list(challenge.key))
+        return ids
+
+    return run_bulk(delete, challenges, workers)
+
+
+def rollback(
+    client: Client,
+    path: str,
+    *,
+    incomplete_only: bool = False,
+    workers: int = 8
+) -> BulkResult[JournalChallenge, list[int]]:
+    """Deletes the challenges created in a journal, without listing the whole server
+
+    Challenges whose creation was interrupted before their id was recorded are looked
+    up by name. Deletions are recorded in the journal, so a rollback can be rerun.
+
+    Parameters
+    ----------
+    client : Client
+        The client to delete with
+    path : str
+        The journal file
+    incomplete_only : bool, optional
+        Whether to only delete challenges whose creation did not complete, by default False
+    workers : int, optional
+        The number of challenges to delete at once, by default 8
+
+    Returns
+    -------
+    BulkResult[JournalChallenge, list[int]]
+        The deleted ids of every challenge
+    """
+    state = JournalState.read(path)
+    challenges = state.incomplete if incomplete_only else [
+        c for c in state.challenges.values() if c.ids or c.pending
+    ]
+    with Journal(path) as journal:
+        return _delete_challenges(client, journal, challenges, workers)
+
+
+def resume(
+    client: Client,
+    path: str,
+    challenges: Iterable[PackChallenge],
+    *,
+    workers: int = 8,
+    sub_workers: int = 1
+) -> BulkResult[PackChallenge, ChallengeCreateResult]:
+    """Completes an interrupted deploy of challenges
+
+    Challenges the journal records as done are kept. Challenges whose creation was
+    interrupted are deleted and created again, since what was created of them may be
+    incomplete, and the remaining challenges are created, see `deploy_challenges`.
+
+    Parameters
+    ----------
+    client : Client
+        The client to deploy with
+    path : str
+        The journal of the interrupted deploy, which the resumed deploy is recorded in
+    challenges : Iterable[PackChallenge]
+        Every challenge of the deploy, including the completed ones
+    workers : int, optional
+        The number of challenges to create at once, by default 8
+    sub_workers : int, optional
+        The number of flags, tags, topics and files of a challenge to create at once, by default 1
+
+    Returns
+    -------
+    BulkResult[PackChallenge, ChallengeCreateResult]
+        The outcome of every challenge that was not completed before
+
+    Raises
+    ------
+    Exception
+        The first error deleting an interrupted challenge, before anything is created
+    """
+    from CTFdPy.scheduler import deploy_challenges
+
+    state = JournalState.read(path)
+    with Journal(path) as journal:
+        cleanup = _delete_challenges(client, journal, state.incomplete, workers)
+        for item in cleanup.failed:
+            raise item.error
+
+        existing = {c.key: c.ids[-1] for c in state.completed if c.ids}
+        return deploy_challenges(
+            client, challenges, workers=workers, sub_workers=sub_workers, journal=journal, existing=existing
+        )
+
+
+def main() -> None:
+    from CTFdPy.loader import (add_credential_arguments, check_credentials,
+                               credentials, load_pack)
+
+    parser = argparse.ArgumentParser(
+        prog="python -m CTFdPy.journal", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("command", choices=("status", "rollback", "resume"))
+    parser.add_argument("journal", help="the journal file")
+    parser.add_argument("pack", nargs="?", help="the challenge pack to resume")
+    parser.add_argument("--url", default=os.environ.get("CTFD_URL"), help="the CTFd URL, by default $CTFD_URL")
+    parser.add_argument("--token", default=os.environ.get("CTFD_TOKEN"), help="an admin API token, by default $CTFD_TOKEN")
+    add_credential_arguments(parser)
+    parser.add_argument("--incomplete-only", action="store_true", help="only roll back challenges that were not completed")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    if args.command == "status":
+        state = JournalState.read(args.journal)
+        for challenge in state.challenges.values():
+            status = "done" if challenge.done else "incomplete" if challenge.incomplete else "rolled back"
+            category, name = challenge.key
+            print(f"{status:<12} {category}/{name} {' '.join(map(str, challenge.ids))}")
+        print(f"{len(state.completed)} done, {len(state.incomplete)} incomplete")
+        return
+
+    if not args.url or not args.token:
+        parser.error(f"--url and --token are required to {args.command}")
+    if args.command == "resume" and args.pack is None:
+        parser.error("the challenge pack is required to resume")
+
+    challenges = None
+    if args.command == "resume":
+        challenges = load_pack(args.pack)
+        check_credentials(parser, args, challenges)
+
+    from CTFdPy.client import Client
+
+    client = Client(args.url, args.token, credentials=credentials(args), max_connections=args.workers)
+    if args.command == "rollback":
+        report = rollback(client, args.journal, incomplete_only=args.incomplete_only, workers=args.workers)
+        for item in report.failed:
+            print(f"Failed {'/'.join(item.item.key)}: {item.error}", file=sys.stderr)
+        print(f"{sum(len(item.result) for item in report.succeeded)} challenges deleted")
+    else:
+        report = resume(client, args.journal, challenges, workers=args.workers)
+        for item in report.failed:
+            print(f"Failed {item.item.path}: {item.error}", file=sys.stderr)
+        print(f"{len(report.succeeded)}/{len(report)} remaining challenges deployed")
+
+    if not report.ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
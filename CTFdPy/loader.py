@@ -0,0 +1,414 @@
+"""Loads challenge packs, directories of challenges described by metadata files
+
+Every challenge is a directory containing a `challenge.json` (or `challenge.yml`
+if PyYAML is installed) and optionally a `handouts` directory, whose files are
+uploaded unless `files` is given:
+
+    pack/
+        web/baby-xss/challenge.json
+        web/baby-xss/handouts/app.zip
+        pwn/ret2win/challenge.yml
+
+    {
+        "name": "baby-xss",
+        "category": "web",
+        "description": "...",
+        "value": 100,
+        "flags": ["flag{...}", {"content": "^flag{.*}$", "type": "regex", "case_insensitive": true}],
+        "hints": ["Look at the cookies", {"content": "document.cookie", "cost": 50}],
+        "tags": ["easy"],
+        "topics": ["XSS"],
+        "requirements": ["sanity-check"],
+        "next": "xss-2"
+    }
+
+Requirements and `next` refer to other challenges of the pack by name, or by
+`category/name` if the name is not unique.
+
+    python -m CTFdPy.loader pack/ --validate-only
+    python -m CTFdPy.loader pack/ --url https://ctf.example.com --token $CTFD_TOKEN --journal deploy.journal
+    python -m CTFdPy.loader pack/ --url ... --token ... --username admin --password $CTFD_PASSWORD  # packs with handouts
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable
+
+from CTFdPy.bulk import BulkResult
+from CTFdPy.constants import (CASE_INSENSITIVE, CASE_SENSITIVE, ChallengeState,
+                              ChallengeType, FlagType)
+from CTFdPy.models.challenges import Challenge, ChallengeCreateResult
+from CTFdPy.models.flags import Flag
+from CTFdPy.models.hints import Hint
+from CTFdPy.scheduler import (CycleError, DependencyGraph, deploy_challenges,
+                              resolve_reference)
+from CTFdPy.sync import ChallengeKey, ChallengeSpec
+
+if TYPE_CHECKING:
+    from CTFdPy.client import Client
+    from CTFdPy.journal import Journal
+
+METADATA_FILES = ("challenge.json", "challenge.yml", "challenge.yaml")
+HANDOUTS_DIR = "handouts"
+
+_KEYS = frozenset({
+    "name", "category", "description", "type", "state", "value", "initial", "minimum",
+    "decay", "extra", "connection_info", "max_attempts", "flags", "hints", "hints_ordered",
+    "tags", "topics", "files", "requirements", "anonymize", "next"
+})
+
+
+@dataclass
+class PackChallenge:
+    """Represents a challenge of a pack, before its references are resolved"""
+    path: str
+    spec: ChallengeSpec
+    requirements: list[str] = field(default_factory=list)  # Names of the prerequisites
+    anonymize: bool = False                                # Whether locked challenges are shown anonymized
+    next: str | None = None                                # Name of the next challenge
+
+    @property
+    def key(self) -> ChallengeKey:
+        return self.spec.key
+
+
+class PackValidationError(Exception):
+    def __init__(self, errors: dict[str, list[str]]):
+        self.errors = errors
+
+    def __str__(self):
+        lines = [f"{len(self.errors)} challenges are invalid:"]
+        for path, errors in sorted(self.errors.items()):
+            lines.extend(f"  {path}: {error}" for error in errors)
+        return "\n".join(lines)
+
+
+def find_challenges(directory: str) -> list[str]:
+    """Returns the directories containing a metadata file, without looking inside them"""
+    found = []
+    for root, dirs, files in os.walk(directory):
+        if any(name in files for name in METADATA_FILES):
+            found.append(root)
+            dirs.clear()
+        else:
+            dirs.sort()
+    return sorted(found)
+
+
+def _read_metadata(path: str) -> dict[str, Any]:
+    for name in METADATA_FILES:
+        file = os.path.join(path, name)
+        if not os.path.isfile(file):
+            continue
+        with open(file, encoding="utf-8") as f:
+            if name.endswith(".json"):
+                return json.load(f)
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError(f"PyYAML is required to read {name}") from None
+            return yaml.safe_load(f)
+    raise ValueError("No metadata file found")
+
+
+def _parse_flag(flag: Any) -> Flag:
+    if isinstance(flag, str):
+        return Flag(flag, CASE_SENSITIVE, FlagType.static)
+    if not isinstance(flag, dict):
+        raise ValueError(f"Invalid flag {flag!r}")
+
+    content = flag.get("content", flag.get("flag"))
+    if not isinstance(content, str) or not content:
+        raise ValueError(f"Flag {flag!r} has no content")
+    type = flag.get("type", FlagType.static)
+    if type not in (FlagType.static, FlagType.regex):
+        raise ValueError(f"Invalid flag type {type!r}")
+    case_insensitive = flag.get("case_insensitive", flag.get("data") == CASE_INSENSITIVE)
+    return Flag(content, CASE_INSENSITIVE if case_insensitive else CASE_SENSITIVE, type)
+
+
+def _parse_hint(hint: Any) -> Hint:
+    if isinstance(hint, str):
+        return Hint(0, hint)
+    if not isinstance(hint, dict) or not isinstance(hint.get("content"), str):
+        raise ValueError(f"Invalid hint {hint!r}")
+    cost = hint.get("cost", 0)
+    if not isinstance(cost, int) or cost < 0:
+        raise ValueError(f"Invalid hint cost {cost!r}")
+    return Hint(cost, hint["content"])
+
+
+def _string_list(data: dict[str, Any], key: str) -> list[str]:
+    values = data.get(key) or []
+    if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+        raise ValueError(f"{key} must be a list of strings")
+    return values
+
+
+def _parse_files(path: str, data: dict[str, Any]) -> list[str]:
+    root = os.path.realpath(path)
+    if "files" not in data:
+        handouts = os.path.join(path, HANDOUTS_DIR)
+        return sorted(
+            os.path.join(directory, name)
+            for directory, _, names in os.walk(handouts)
+            for name in names
+        )
+
+    files = []
+    for name in _string_list(data, "files"):
+        file = os.path.join(path, name)
+        if not os.path.realpath(file).startswith(root + os.sep):
+            raise ValueError(f"File {name} is outside of the challenge directory")
+        if not os.path.isfile(file):
+            raise ValueError(f"File {name} does not exist")
+        files.append(file)
+    return files
+
+
+def parse_challenge(path: str) -> PackChallenge:
+    """Parses and validates the challenge in a directory
+
+    Raises
+    ------
+    ValueError
+        If the challenge is invalid, with the first error found
+    """
+    data = _read_metadata(path)
+    if not isinstance(data, dict):
+        raise ValueError("Metadata must be a mapping")
+
+    unknown = set(data) - _KEYS
+    if unknown:
+        raise ValueError(f"Unknown keys: {', '.join(sorted(unknown))}")
+    for key in ("name", "category", "description"):
+        if not isinstance(data.get(key), str) or not data[key]:
+            raise ValueError(f"{key} is required")
+
+    state = data.get("state", ChallengeState.visible)
+    if state not in (ChallengeState.visible, ChallengeState.hidden):
+        raise ValueError(f"Invalid state {state!r}")
+
+    # Dynamic challenge parameters can be nested in `extra`, as ctfcli does
+    extra = data.get("extra") or {}
+    challenge = Challenge(
+        data["name"],
+        data["category"],
+        data["description"],
+        data.get("type", ChallengeType.standard),
+        state,
+        data.get("value"),
+        data.get("initial", extra.get("initial")),
+        data.get("minimum", extra.get("minimum")),
+        data.get("decay", extra.get("decay")),
+        data.get("connection_info"),
+        data.get("max_attempts")
+    )
+
+    flags = data.get("flags")
+    if not isinstance(flags, list) or not flags:
+        raise ValueError("At least one flag is required")
+    hints = data.get("hints") or []
+    if not isinstance(hints, list):
+        raise ValueError("hints must be a list")
+    next = data.get("next")
+    if next is not None and not isinstance(next, str):
+        raise ValueError("next must be a challenge name")
+
+    spec = ChallengeSpec(
+        challenge,
+        [_parse_flag(flag) for flag in flags],
+        [_parse_hint(hint) for hint in hints],
+        _string_list(data, "tags"),
+        _string_list(data, "topics"),
+        _parse_files(path, data),
+        bool(data.get("hints_ordered", True))
+    )
+    return PackChallenge(path, spec, _string_list(data, "requirements"), bool(data.get("anonymize", False)), next)
+
+
+def _parse_or_error(path: str) -> tuple[PackChallenge | None, str | None]:
+    try:
+        return parse_challenge(path), None
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+
+
+def load_pack(directory: str, *, processes: int | None = None) -> list[PackChallenge]:
+    """Parses and validates every challenge of a pack
+
+    Challenges are parsed concurrently in a process pool, then checked against each other
+
+    Parameters
+    ----------
+    directory : str
+        The root directory of the pack
+    processes : int, optional
+        The number of processes, by default the number of CPUs. 1 parses in this process
+
+    Returns
+    -------
+    list[PackChallenge]
+        The challenges, sorted by path
+
+    Raises
+    ------
+    PackValidationError
+        With every error of every invalid challenge
+    """
+    paths = find_challenges(directory)
+    if processes == 1 or len(paths) < 2:
+        parsed = [_parse_or_error(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            parsed = list(executor.map(_parse_or_error, paths, chunksize=8))
+
+    errors: dict[str, list[str]] = {}
+    challenges = []
+    for path, (challenge, error) in zip(paths, parsed):
+        if error is not None:
+            errors[path] = [error]
+        else:
+            challenges.append(challenge)
+
+    seen: dict[ChallengeKey, str] = {}
+    for challenge in challenges:
+        if challenge.key in seen:
+            errors.setdefault(challenge.path, []).append(f"Duplicate of {seen[challenge.key]}")
+        seen.setdefault(challenge.key, challenge.path)
+
+        for reference in challenge.requirements + ([challenge.next] if challenge.next else []):
+            try:
+                resolve_reference(challenges, reference)
+            except ValueError as e:
+                errors.setdefault(challenge.path, []).append(str(e))
+
+    if not errors:
+        try:
+            DependencyGraph.from_challenges(challenges).levels()
+        except CycleError as e:
+            paths = {c.key: c.path for c in challenges}
+            for key in set(e.cycle):
+                errors[paths[key]] = [str(e)]
+
+    if errors:
+        raise PackValidationError(errors)
+    return challenges
+
+
+def deploy_pack(
+    client: Client,
+    challenges: Iterable[PackChallenge],
+    *,
+    workers: int = 8,
+    sub_workers: int = 1,
+    delete_on_error: bool = True,
+    journal: Journal | None = None
+) -> BulkResult[PackChallenge, ChallengeCreateResult]:
+    """Creates the challenges of a pack in dependency order, see `deploy_challenges`
+
+    Parameters
+    ----------
+    client : Client
+        The client to create the challenges with
+    challenges : Iterable[PackChallenge]
+        The challenges, usually from `load_pack`
+    workers : int, optional
+        The number of challenges to create at once, by default 8
+    sub_workers : int, optional
+        The number of flags, hints, tags, topics and files of a challenge to create at once, by default 1
+    delete_on_error : bool, optional
+        Whether to delete a challenge if its flags, hints, tags, topics or files fail, by default True
+    journal : Journal, optional
+        A journal to record every created resource in, to resume or roll back the deploy, by default None
+
+    Returns
+    -------
+    BulkResult[PackChallenge, ChallengeCreateResult]
+        The outcome of every challenge. Challenges requiring a challenge that failed are not created
+    """
+    return deploy_challenges(
+        client, challenges, workers=workers, sub_workers=sub_workers,
+        delete_on_error=delete_on_error, journal=journal
+    )
+
+
+def add_credential_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the options of the admin account files are uploaded with, as uploads need a login"""
+    parser.add_argument("--username", default=os.environ.get("CTFD_USERNAME"), help="an admin username to upload files with, by default $CTFD_USERNAME")
+    parser.add_argument("--password", default=os.environ.get("CTFD_PASSWORD"), help="the password of the admin, by default $CTFD_PASSWORD")
+
+
+def credentials(args: argparse.Namespace) -> tuple[str, str] | None:
+    return (args.username, args.password) if args.username and args.password else None
+
+
+def check_credentials(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    challenges: Iterable[PackChallenge]
+) -> None:
+    """Exits before anything is created if challenges have files but no login was given"""
+    with_files = [challenge for challenge in challenges if challenge.spec.files]
+    if with_files and credentials(args) is None:
+        parser.error(
+            f"{len(with_files)} challenges have files, which can only be uploaded with a login: "
+            "--username and --password are required"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m CTFdPy.loader", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("directory", help="the root directory of the pack")
+    parser.add_argument("--url", default=os.environ.get("CTFD_URL"), help="the CTFd URL, by default $CTFD_URL")
+    parser.add_argument("--token", default=os.environ.get("CTFD_TOKEN"), help="an admin API token, by default $CTFD_TOKEN")
+    add_credential_arguments(parser)
+    parser.add_argument("--validate-only", action="store_true", help="only parse and validate the pack")
+    parser.add_argument("--processes", type=int, default=None, help="processes parsing the pack, by default the number of CPUs")
+    parser.add_argument("--workers", type=int, default=8, help="challenges created at once")
+    parser.add_argument("--sub-workers", type=int, default=1, help="flags, hints, tags, topics and files of a challenge created at once")
+    parser.add_argument("--journal", help="a journal file to resume or roll back the deploy with `python -m CTFdPy.journal`")
+    args = parser.parse_args()
+
+    try:
+        challenges = load_pack(args.directory, processes=args.processes)
+    except PackValidationError as e:
+        sys.exit(str(e))
+    print(f"{len(challenges)} challenges are valid")
+    if args.validate_only:
+        return
+
+    if not args.url or not args.token:
+        parser.error("--url and --token are required to deploy")
+    check_credentials(parser, args, challenges)
+
+    from CTFdPy.client import Client
+    from CTFdPy.journal import Journal
+
+    client = Client(
+        args.url, args.token, credentials=credentials(args), max_connections=args.workers * args.sub_workers
+    )
+    journal = Journal(args.journal) if args.journal else None
+    try:
+        report = deploy_pack(
+            client, challenges, workers=args.workers, sub_workers=args.sub_workers, journal=journal
+        )
+    finally:
+        if journal is not None:
+            journal.close()
+    for item in report.failed:
+        print(f"Failed {item.item.path}: {item.error}", file=sys.stderr)
+    print(f"{len(report.succeeded)}/{len(report)} challenges deployed")
+    if not report.ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
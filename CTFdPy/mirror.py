@@ -0,0 +1,444 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable
+
+from CTFdPy.bulk import run_bulk
+from CTFdPy.models.challenges import Challenge, ChallengePreview
+from CTFdPy.models.files import File
+from CTFdPy.models.flags import Flag
+from CTFdPy.models.hints import Hint
+from CTFdPy.models.tags import Tag
+from CTFdPy.models.topics import Topic
+from CTFdPy.models.users import User
+
+if TYPE_CHECKING:
+    from CTFdPy.client import Client
+
+
+@dataclass
+class _Resource:
+    endpoint: str
+    name_key: str | None = None      # The key stored in the indexed name column
+    detail: str | None = None        # The endpoint of a single record, if the listing is partial
+    volatile: tuple[str, ...] = ()   # Keys of the listing that change without the details changing
+
+
+_RESOURCES: dict[str, _Resource] = {
+    "challenges": _Resource(
+        "/api/v1/challenges?view=admin", "name", "/api/v1/challenges/{id}", ("solves", "solved_by_me")
+    ),
+    "flags": _Resource("/api/v1/flags", "content"),
+    "hints": _Resource("/api/v1/hints", None, "/api/v1/hints/{id}"),
+    "tags": _Resource("/api/v1/tags", "value"),
+    "topics": _Resource("/api/v1/topics", "value"),
+    "files": _Resource("/api/v1/files", "location"),
+    "users": _Resource("/api/v1/users", "name"),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    resource TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    challenge_id INTEGER,
+    name TEXT,
+    hash TEXT NOT NULL,
+    detail_hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    detail TEXT,
+    detail_at REAL,
+    PRIMARY KEY (resource, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS records_challenge_id ON records (resource, challenge_id);
+CREATE INDEX IF NOT EXISTS records_name ON records (resource, name);
+CREATE TABLE IF NOT EXISTS refreshes (
+    resource TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+
+def _hash(record: dict[str, Any], exclude: tuple[str, ...] = ()) -> str:
+    if exclude:
+        record = {k: v for k, v in record.items() if k not in exclude}
+    return hashlib.sha1(json.dumps(record, sort_keys=True).encode()).hexdigest()
+
+
+# Details older than this many seconds are fetched again, see `LocalMirror.refresh`
+DETAIL_MAX_AGE = 600.0
+
+
+@dataclass
+class RefreshResult:
+    """Represents the changes of a resource found by a refresh"""
+    resource: str
+    added: list[int] = field(default_factory=list)
+    changed: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+    failed: dict[int, Exception] = field(default_factory=dict)    # Records whose details could not be fetched
+    skipped: bool = False                                          # Whether the resource was fresh enough
+
+    @property
+    def unchanged(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+
+class LocalMirror:
+    """A local copy of the state of CTFd, stored in SQLite
+
+    `refresh` lists every resource and diffs it against the stored copy by hashing
+    each record, so only records that were added or changed are written, and only
+    those whose listing is partial (challenges and hints) have their details fetched.
+    Listings leave out fields such as the description, state or connection info of
+    challenges and the content of hints, so editing those does not change the listing:
+    details are also fetched again once they are older than `detail_max_age`.
+    Lookups are then served locally, without any request to CTFd.
+
+    The database can be shared: one process refreshes a mirror file while any number
+    of dashboards and bots read it, by opening it without a client.
+
+    Parameters
+    ----------
+    client : Client, optional
+        The client to refresh with, not needed to only read the mirror
+    path : str, optional
+        The SQLite database, by default in memory
+    workers : int, optional
+        The number of concurrent requests while refreshing, by default 8
+    per_page : int, optional
+        The number of records requested per page, by default the server's default
+    """
+
+    def __init__(
+        self,
+        client: Client | None = None,
+        path: str = ":memory:",
+        *,
+        workers: int = 8,
+        per_page: int | None = None
+    ):
+        self.client = client
+        self.path = path
+        self.workers = workers
+        self.per_page = per_page
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            # Readers in other processes do not block refreshes, and the reverse
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(records)")}
+        if "detail_at" not in columns:
+            # Mirrors created before details expired
+            self._conn.execute("ALTER TABLE records ADD COLUMN detail_at REAL")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> LocalMirror:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Refreshing
+
+    def refresh(
+        self,
+        resources: Iterable[str] | None = None,
+        max_age: float | None = None,
+        detail_max_age: float | None = DETAIL_MAX_AGE
+    ) -> dict[str, RefreshResult]:
+        """Updates the mirror from CTFd
+
+        Parameters
+        ----------
+        resources : Iterable[str], optional
+            The resources to refresh, any of challenges, flags, hints, tags, topics,
+            files and users, by default all
+        max_age : float, optional
+            Skip resources refreshed less than this many seconds ago, by default none are skipped
+        detail_max_age : float, optional
+            Fetch the details of challenges and hints again if they were fetched at least this
+            many seconds ago, even if their listing did not change, by default 600.
+            0 always fetches them, None only fetches them when their listing changes
+
+        Returns
+        -------
+        dict[str, RefreshResult]
+            The changes found of every resource
+
+        Raises
+        ------
+        ValueError
+            If the mirror has no client, or a resource is unknown
+        requests.HTTPError
+            If listing a resource fails
+        """
+        if self.client is None:
+            raise ValueError("A client is required to refresh the mirror")
+
+        resources = list(resources) if resources is not None else list(_RESOURCES)
+        unknown = set(resources) - set(_RESOURCES)
+        if unknown:
+            raise ValueError(f"Unknown resources: {', '.join(sorted(unknown))}")
+
+        results = {}
+        for resource in resources:
+            if max_age is not None and time.time() - self.refreshed_at(resource) < max_age:
+                results[resource] = RefreshResult(resource, skipped=True)
+            else:
+                results[resource] = self._refresh_resource(resource, detail_max_age)
+        return results
+
+    def _refresh_resource(self, resource: str, detail_max_age: float | None = None) -> RefreshResult:
+        spec = _RESOURCES[resource]
+        started = time.time()
+        records = [
+            record
+            for page in self.client._iter_pages(spec.endpoint, self.per_page, prefetch=True)
+            for record in page
+        ]
+
+        with self._lock:
+            stored = {
+                id: (hash, detail_hash, detail_at)
+                for id, hash, detail_hash, detail_at in self._conn.execute(
+                    "SELECT id, hash, detail_hash, detail_at FROM records WHERE resource = ?", (resource,)
+                )
+            }
+        # Details fetched before this are fetched again
+        expired = started - detail_max_age if spec.detail is not None and detail_max_age is not None else None
+
+        result = RefreshResult(resource)
+        rows = []
+        # Records whose details must be fetched, (index in rows, id)
+        fetches: list[tuple[int, int]] = []
+        # Records whose listing did not change but whose details expired
+        rechecks: set[int] = set()
+        for record in records:
+            id = record["id"]
+            hash = _hash(record)
+            detail_hash = _hash(record, spec.volatile)
+            previous = stored.get(id)
+            stale = previous is not None and expired is not None and (previous[2] or 0) <= expired
+            if previous is not None and previous[0] == hash:
+                if not stale:
+                    continue
+                rechecks.add(id)
+            else:
+                (result.added if previous is None else result.changed).append(id)
+
+            refetch = spec.detail is not None and (previous is None or previous[1] != detail_hash or stale)
+            if refetch:
+                fetches.append((len(rows), id))
+            rows.append([
+                resource, id, record.get("challenge_id"),
+                record.get(spec.name_key) if spec.name_key else None,
+                hash, detail_hash, json.dumps(record), refetch
+            ])
+
+        if fetches:
+            def fetch(id: int) -> dict[str, Any]:
+                return self.client._get(spec.detail.format(id=id))["data"]
+
+            report = run_bulk(fetch, [id for _, id in fetches], self.workers)
+            stored_details = self._details(resource, rechecks)
+            for (index, id), item in zip(fetches, report):
+                if item.ok:
+                    rows[index][-1] = json.dumps(item.result)
+                    if id in rechecks and stored_details.get(id) != item.result:
+                        result.changed.append(id)
+                else:
+                    # Not stored, so it is fetched again on the next refresh
+                    result.failed[id] = item.error
+                    rows[index] = None
+
+        seen = {record["id"] for record in records}
+        result.removed = [id for id in stored if id not in seen]
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for row in rows:
+                    if row is None:
+                        continue
+                    if row[-1] is False:
+                        # The details did not change, keep the stored ones
+                        self._conn.execute(
+                            "INSERT INTO records (resource, id, challenge_id, name, hash, detail_hash, data) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (resource, id) DO UPDATE SET "
+                            "challenge_id = excluded.challenge_id, name = excluded.name, "
+                            "hash = excluded.hash, detail_hash = excluded.detail_hash, data = excluded.data",
+                            row[:-1]
+                        )
+                    else:
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", (*row, started)
+                        )
+                self._conn.executemany(
+                    "DELETE FROM records WHERE resource = ? AND id = ?",
+                    [(resource, id) for id in result.removed]
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO refreshes VALUES (?, ?)", (resource, started)
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        for id in result.failed:
+            if id in result.added:
+                result.added.remove(id)
+            elif id in result.changed:
+                result.changed.remove(id)
+        return result
+
+    def _details(self, resource: str, ids: Iterable[int]) -> dict[int, Any]:
+        """Returns the stored details of records"""
+        ids = list(ids)
+        details = {}
+        # Stay under SQLite's limit on the number of parameters
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT id, detail FROM records WHERE resource = ? AND id IN ({', '.join('?' * len(chunk))})",
+                    (resource, *chunk)
+                ).fetchall()
+            details.update((id, json.loads(detail)) for id, detail in rows if detail is not None)
+        return details
+
+    def refreshed_at(self, resource: str) -> float:
+        """Returns when a resource was last refreshed as a UNIX timestamp, 0 if never"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT refreshed_at FROM refreshes WHERE resource = ?", (resource,)
+            ).fetchone()
+        return row[0] if row is not None else 0.0
+
+    # Lookups
+
+    def _select(self, resource: str, where: str = "", params: tuple[Any, ...] = ()) -> list[dict[str, Any]]:
+        """Returns the stored records of a resource, their details merged over their listing"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data, detail FROM records WHERE resource = ? {where} ORDER BY id",
+                (resource, *params)
+            ).fetchall()
+
+        records = []
+        for data, detail in rows:
+            record = json.loads(data)
+            if detail is not None:
+                record = {**json.loads(detail), **record}
+            records.append(record)
+        return records
+
+    def _one(self, resource: str, id: int) -> dict[str, Any]:
+        records = self._select(resource, "AND id = ?", (id,))
+        if not records:
+            raise KeyError(f"{resource} {id} is not in the mirror")
+        return records[0]
+
+    def get_challenge(self, challenge_id: int) -> Challenge:
+        """Gets a challenge by id, see `Client.get_challenge`
+
+        Raises
+        ------
+        KeyError
+            If the challenge is not in the mirror
+        """
+        return Challenge.from_dict(self._one("challenges", challenge_id))
+
+    def get_challenge_by_name(self, name: str, category: str | None = None) -> Challenge:
+        """Gets a challenge by name, and optionally category
+
+        Raises
+        ------
+        KeyError
+            If the challenge is not in the mirror
+        """
+        for record in self._select("challenges", "AND name = ?", (name,)):
+            if category is None or record.get("category") == category:
+                return Challenge.from_dict(record)
+        raise KeyError(f"Challenge {name} is not in the mirror")
+
+    def get_challenges(self) -> list[ChallengePreview]:
+        """Gets all challenges, including hidden ones, see `Client.get_challenges`"""
+        return [ChallengePreview.from_dict(record) for record in self._select("challenges")]
+
+    def get_flag(self, flag_id: int) -> Flag:
+        """Gets a flag by id, see `Client.get_flag`"""
+        return Flag.from_dict(self._one("flags", flag_id))
+
+    def get_flags(self, challenge_id: int | None = None) -> list[Flag]:
+        """Gets all flags, or the flags of a challenge"""
+        if challenge_id is None:
+            return [Flag.from_dict(record) for record in self._select("flags")]
+        return [Flag.from_dict(record) for record in self._select("flags", "AND challenge_id = ?", (challenge_id,))]
+
+    def get_hint(self, hint_id: int) -> Hint:
+        """Gets a hint by id, see `Client.get_hint`"""
+        return Hint.from_dict(self._one("hints", hint_id))
+
+    def get_hints(self, challenge_id: int | None = None) -> list[Hint]:
+        """Gets all hints, or the hints of a challenge"""
+        if challenge_id is None:
+            return [Hint.from_dict(record) for record in self._select("hints")]
+        return [Hint.from_dict(record) for record in self._select("hints", "AND challenge_id = ?", (challenge_id,))]
+
+    def get_tag(self, tag_id: int) -> Tag:
+        """Gets a tag by id, see `Client.get_tag`"""
+        return Tag.from_dict(self._one("tags", tag_id))
+
+    def get_tags(self, challenge_id: int | None = None) -> list[Tag]:
+        """Gets all tags, or the tags of a challenge"""
+        if challenge_id is None:
+            return [Tag.from_dict(record) for record in self._select("tags")]
+        return [Tag.from_dict(record) for record in self._select("tags", "AND challenge_id = ?", (challenge_id,))]
+
+    def get_topic(self, topic_id: int) -> Topic:
+        """Gets a topic by id, see `Client.get_topic`"""
+        return Topic.from_dict(self._one("topics", topic_id))
+
+    def get_topics(self) -> list[Topic]:
+        """Gets all topics"""
+        return [Topic.from_dict(record) for record in self._select("topics")]
+
+    def get_file(self, file_id: int) -> File:
+        """Gets a file by id, see `Client.get_file`"""
+        return File.from_dict(self._one("files", file_id))
+
+    def get_files(self) -> list[File]:
+        """Gets all files"""
+        return [File.from_dict(record) for record in self._select("files")]
+
+    def get_user(self, user_id: int) -> User:
+        """Gets a user by id, see `Client.get_user`"""
+        return User.from_dict(self._one("users", user_id))
+
+    def get_user_by_name(self, name: str) -> User:
+        """Gets a user by name
+
+        Raises
+        ------
+        KeyError
+            If the user is not in the mirror
+        """
+        records = self._select("users", "AND name = ?", (name,))
+        if not records:
+            raise KeyError(f"User {name} is not in the mirror")
+        return User.from_dict(records[0])
+
+    def get_users(self) -> list[User]:
+        """Gets all users"""
+        return [User.from_dict(record) for record in self._select("users")]
@@ -20,6 +20,8 @@ class BaseChallenge:
     """Represents a base challenge
     This should never be created, and is only meant for inheritance
     """
+    __slots__ = ()
+
     id: int
     name: str
     category: str
@@ -27,7 +29,7 @@ class BaseChallenge:
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ChallengePreview(Model[ChallengePreviewDict], BaseChallenge):
     """Represents a challenge preview
 
@@ -43,7 +45,7 @@ class ChallengePreview(Model[ChallengePreviewDict], BaseChallenge):
     tags: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ChallengeCreateResult(Model[ChallengeCreateDict | DynamicChallengeCreateDict], BaseChallenge):
     """Represents the result of creating a challenge"""
 
@@ -71,7 +73,7 @@ class ChallengeCreateResult(Model[ChallengeCreateDict | DynamicChallengeCreateDi
     files: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Challenge(Model[ChallengeDict | DynamicChallengeDict], BaseChallenge):
     """Represents a challenge"""
     name: str
@@ -118,11 +120,14 @@ class Challenge(Model[ChallengeDict | DynamicChallengeDict], BaseChallenge):
             raise ValueError("Invalid challenge type")
         
 
-    def set_requirements(self, prerequisites: list[Challenge], anonymize: Literal[True] | None = None):
+    def set_requirements(self, prerequisites: list[Challenge | int], anonymize: Literal[True] | None = None):
         requirements = {"prerequisites": []}
         for prerequisite in prerequisites:
+            if isinstance(prerequisite, int):
+                requirements["prerequisites"].append(prerequisite)
+                continue
             if not isinstance(prerequisite, Challenge):
-                raise ValueError("Prerequisites must be of type Challenge")
+                raise ValueError("Prerequisites must be of type Challenge or challenge ids")
             if prerequisite.id is None:
                 raise ValueError("Challenge must be created before it can be used as a prerequisite")
             requirements["prerequisites"].append(prerequisite.id)
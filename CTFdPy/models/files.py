@@ -6,9 +6,10 @@ from CTFdPy.models import Model
 from CTFdPy.types.files import FileDict
 
 
-@dataclass
+@dataclass(slots=True)
 class File(Model[FileDict]):
     """Represents a file"""
     id: int
     location: str
-    type: str
\ No newline at end of file
+    type: str
+    sha1sum: str | None = None # Only given by CTFd 3.6 and above
\ No newline at end of file
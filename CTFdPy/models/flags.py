@@ -5,7 +5,7 @@ from CTFdPy.models import Model
 from CTFdPy.types.flags import FlagDict
 
 
-@dataclass
+@dataclass(slots=True)
 class Flag(Model[FlagDict]):
     content: str
     
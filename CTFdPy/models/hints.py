@@ -6,7 +6,7 @@ from CTFdPy.models import Model
 from CTFdPy.types.hints import PartialHintDict, HintDict, HintRequirementsDict
 
 
-@dataclass
+@dataclass(slots=True)
 class PartialHint(Model[PartialHintDict]):
     """Represents a partial hint"""
     id: int = None
@@ -14,7 +14,7 @@ class PartialHint(Model[PartialHintDict]):
     cost: int = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Hint(Model[HintDict]):
     """Represents a hint"""
     cost: int
@@ -24,62 +24,55 @@ class Hint(Model[HintDict]):
     type: str = None
     requirements: HintRequirementsDict = None
 
-    # TODO: support IDs as a requirement
+    @staticmethod
+    def _requirement_id(hint: Hint | PartialHint | int) -> int:
+        """Returns the id of a hint used as a requirement"""
+        if isinstance(hint, int):
+            return hint
+        if not isinstance(hint, (Hint, PartialHint)):
+            raise TypeError(
+                f"Expected Hint, PartialHint or int, got {type(hint)}"
+            )
+        if hint.id is None:
+            raise ValueError(
+                f"Hint {hint} must be created before it can be used as a requirement"
+            )
+        return hint.id
 
-    def set_requirements(self, *hints: Hint | PartialHint):
-        """Sets the requirements of the hint"""
-        for h in hints:
-            if not isinstance(h, (Hint, PartialHint)):
-                raise TypeError(
-                    f"Expected Hint or PartialHint, got {type(h)}"
-                )
-            if h.id is None:
-                raise ValueError(
-                    f"Hint {h} must be created before it can be used as a requirement"
-                )
-            
+    def set_requirements(self, *hints: Hint | PartialHint | int):
+        """Sets the requirements of the hint, given as hints or hint ids"""
         self.requirements = {
-            "prerequisites": [h.id for h in hints],
+            "prerequisites": [self._requirement_id(h) for h in hints],
         }
 
         return self.requirements
 
-    def add_requirements(self, *hints: Hint | PartialHint):
-        """Adds requirements to the hint"""
+    def add_requirements(self, *hints: Hint | PartialHint | int):
+        """Adds requirements to the hint, given as hints or hint ids"""
         if self.requirements is None:
             return self.set_requirements(*hints)
         else:
             for h in hints:
-                if not isinstance(h, (Hint, PartialHint)):
-                    raise TypeError(
-                        f"Expected Hint or PartialHint, got {type(h)}"
-                    )
-                if h.id is None:
-                    raise ValueError(
-                        f"Hint {h} must be created before it can be used as a requirement"
-                    )
-                if h.id not in self.requirements["prerequisites"]:
-                    self.requirements["prerequisites"].append(h.id)
+                hint_id = self._requirement_id(h)
+                if hint_id not in self.requirements["prerequisites"]:
+                    self.requirements["prerequisites"].append(hint_id)
 
         return self.requirements
                 
-    def remove_requirements(self, *hints: Hint | PartialHint):
-        """Removes requirements from the hint"""
+    def remove_requirements(self, *hints: Hint | PartialHint | int):
+        """Removes requirements from the hint, given as hints or hint ids"""
         if self.requirements is None:
             raise ValueError(
                 f"Hint {self} does not have any requirements"
             )
         else:
             for h in hints:
-                if not isinstance(h, (Hint, PartialHint)):
-                    raise TypeError(
-                        f"Expected Hint or PartialHint, got {type(h)}"
-                    )
-                if h.id not in self.requirements["prerequisites"]:
+                hint_id = self._requirement_id(h)
+                if hint_id not in self.requirements["prerequisites"]:
                     raise ValueError(
                         f"Hint {self} does not have requirement {h}"
                     )
-                self.requirements["prerequisites"].remove(h.id)
+                self.requirements["prerequisites"].remove(hint_id)
 
         return self.requirements
 
@@ -1,40 +1,90 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-
-from typing import Any, Generic, TypeVar
+from dataclasses import MISSING, fields
+from typing import Any, ClassVar, Generic, TypeVar
 
 
 DictT = TypeVar("DictT", bound=dict[str, Any])
 
 
 class Model(Generic[DictT]):
-    """The base model for all models"""
-    _raw: DictT | None = None
+    """The base model for all models
+
+    Models are slotted dataclasses, so they only hold their fields and
+    optionally the raw dictionary they were created from.
+    """
+    __slots__ = ("_raw",)
+
+    # Whether `from_dict` keeps the raw dictionary, set to False on a model
+    # (or on `Model` for all of them) to only keep the typed fields in memory
+    keep_raw: ClassVar[bool] = True
+
+    # Keys of the server's dictionaries that map to a differently named field
+    _aliases: ClassVar[dict[str, str]] = {}
 
     @classmethod
-    def from_dict(cls, d: DictT):
-        """Creates a model from a dictionary, and ingnores any extra keys"""
-        c = cls(
-            **{
-                k: v for k, v in d.items()
-                if k in cls.__dataclass_fields__.keys()
-            }
-        )
-        c._raw = d
+    def _decoder(cls) -> tuple[tuple[str, str], ...]:
+        """Returns the (key, field) pairs read by `from_dict`, computed once per class"""
+        decoder = cls.__dict__.get("_decoder_cache")
+        if decoder is None:
+            fields = cls.__dataclass_fields__
+            # Aliases come first so a key named after the field takes precedence
+            decoder = tuple(
+                [(key, name) for key, name in cls._aliases.items() if name in fields]
+                + [(name, name) for name, f in fields.items() if f.init and not name.startswith("_")]
+            )
+            cls._decoder_cache = decoder
+        return decoder
+
+    @classmethod
+    def from_dict(cls, d: DictT, keep_raw: bool | None = None):
+        """Creates a model from a dictionary, and ingnores any extra keys
+
+        Parameters
+        ----------
+        d : DictT
+            The dictionary, usually from the server
+        keep_raw : bool, optional
+            Whether to keep `d` as the raw representation, by default `keep_raw` of the class
+        """
+        c = cls(**{name: d[key] for key, name in cls._decoder() if key in d})
+        if keep_raw if keep_raw is not None else cls.keep_raw:
+            c._raw = d
         return c
-    
+
+    def _explicit(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Returns the entries of a payload that were explicitly set, to update a
+        resource without overwriting what was not
+
+        For a model decoded from the server, these are the entries changed since,
+        otherwise the entries set to something other than their field's default.
+        Empty entries are never included.
+        """
+        server = getattr(self, "_raw", None)
+        if server is not None:
+            return {
+                key: value for key, value in payload.items()
+                if value is not None and server.get(key) != value
+            }
+
+        defaults = {f.name: f.default for f in fields(self) if f.default is not MISSING}
+        return {
+            key: value for key, value in payload.items()
+            if value is not None and value != defaults.get(self._aliases.get(key, key), MISSING)
+        }
+
     @property
     def _to_dict(self) -> DictT:
-        """Returns a dictionary representation of the model 
+        """Returns a dictionary representation of the model
         excluding private attributes
         """
         return {
-            k: v for k, v in self.__dataclass_fields__.items()
+            k: getattr(self, k) for k in self.__dataclass_fields__
             if not k.startswith("_")
         }
 
     @property
     def raw(self) -> DictT:
         """Returns the raw dictionary representation of the model"""
-        return self._raw if self._raw is not None else self._to_dict
\ No newline at end of file
+        raw = getattr(self, "_raw", None)
+        return raw if raw is not None else self._to_dict
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from CTFdPy.models import Model
+from CTFdPy.types.scoreboard import ScoreboardEntryDict, ScoreboardMemberDict
+
+
+@dataclass(slots=True)
+class ScoreboardMember(Model[ScoreboardMemberDict]):
+    """Represents a member of a team on the scoreboard"""
+    id: int = None
+    name: str = None
+    score: int = None
+    oauth_id: int | None = None
+    bracket_id: int | None = None
+    bracket_name: str | None = None
+
+
+@dataclass(slots=True)
+class ScoreboardEntry(Model[ScoreboardEntryDict]):
+    """Represents a user or team on the scoreboard"""
+    pos: int = None
+    account_id: int = None
+    account_type: str = None              # user or team, depending on the CTF mode
+    name: str = None
+    score: int = None
+    account_url: str = None
+    oauth_id: int | None = None
+    bracket_id: int | None = None
+    bracket_name: str | None = None
+    members: list[ScoreboardMember] = None
+
+    @classmethod
+    def from_dict(cls, d: ScoreboardEntryDict, keep_raw: bool | None = None) -> ScoreboardEntry:
+        entry = super(ScoreboardEntry, cls).from_dict(d, keep_raw)
+        entry.members = [ScoreboardMember.from_dict(m, keep_raw) for m in d.get("members") or []]
+        return entry
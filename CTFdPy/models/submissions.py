@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from CTFdPy.models import Model
+from CTFdPy.types.submissions import SolveDict, SubmissionDict
+
+
+@dataclass(slots=True)
+class Submission(Model[SubmissionDict]):
+    """Represents a flag submission"""
+    id: int = None
+    challenge_id: int = None
+    user_id: int = None
+    team_id: int | None = None
+    type: str = None                      # correct, incorrect or discard
+    provided: str = None
+    ip: str = None
+    date: str = None
+    challenge: dict = None                # id, name, category and value of the challenge
+    user: dict = None                     # id and name of the user
+    team: dict | None = None              # id and name of the team, in team mode
+
+    @property
+    def correct(self) -> bool:
+        return self.type == "correct"
+
+
+@dataclass(slots=True)
+class Solve(Model[SolveDict]):
+    """Represents a solve of a challenge"""
+    account_id: int = None
+    name: str = None
+    date: str = None
+    account_url: str = None
@@ -6,7 +6,7 @@ from CTFdPy.models import Model
 from CTFdPy.types.tags import TagDict
 
 
-@dataclass
+@dataclass(slots=True)
 class Tag(Model[TagDict]):
     """Represents a tag"""
     value: str
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from CTFdPy.models import Model
+from CTFdPy.types.teams import TeamDict
+
+
+@dataclass(slots=True)
+class Team(Model[TeamDict]):
+    """Represents a team, for CTFs in team mode
+
+    Like users, the password is only known for teams created through the client.
+    """
+    name: str
+    email: str | None = None
+    password: str | None = None
+
+    # Optional parameters
+    hidden: bool = False
+    banned: bool = False
+    website: str | None = None
+    affiliation: str | None = None
+    country: str | None = None
+    bracket_id: int | None = None
+
+    # Parameters only set by the server
+    # DO NOT manually set these if not bad things will happen
+    id: int = None
+    oauth_id: int | None = None
+    captain_id: int | None = None
+    members: list[int] = field(default_factory=list)   # The ids of the members
+    created: str = None
+
+    def to_payload(self) -> TeamDict:
+        """Returns a dictionary representation of the team that
+        can be used to create or modify a team
+
+        The password is only included if it is set
+        """
+        d = {
+            "name": self.name,
+            "banned": self.banned,
+            "hidden": self.hidden
+        }
+
+        # Add optional parameters
+        for key in ("email", "password", "website", "affiliation", "country", "bracket_id"):
+            value = getattr(self, key)
+            if value is not None:
+                d[key] = value
+
+        return d
+
+    def to_changes(self) -> TeamDict:
+        """Returns the part of the payload that was explicitly set, see `Model._explicit`"""
+        return self._explicit(self.to_payload())
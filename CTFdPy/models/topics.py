@@ -6,14 +6,14 @@ from CTFdPy.models import Model
 from CTFdPy.types.topics import ChallengeTopicDict, TopicCreateDict, TopicDict
 
 
-@dataclass
+@dataclass(slots=True)
 class Topic(Model[TopicDict]):
     """Represents a topic"""
     id: int = None
     value: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChallengeTopic(Model[ChallengeTopicDict]):
     """Represents a topic for a challenge"""
     value: str
@@ -32,7 +32,7 @@ class ChallengeTopic(Model[ChallengeTopicDict]):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicCreateResult(Model[TopicCreateDict]):
     """Represents the result of creating a topic"""
     id: int
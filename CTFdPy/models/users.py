@@ -1,36 +1,75 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-import random
-import string
 
 from CTFdPy.models.models import Model
+from CTFdPy.passwords import generate_password
+from CTFdPy.types.users import UserDict
+
 
+@dataclass(slots=True)
+class User(Model[UserDict]):
+    """Represents a user
 
-@dataclass
-class User(Model[dict[str, str]]):
+    A password is only known for users created or reset through the client,
+    the server never returns it. Users without one get a generated password
+    when they are created, see `CTFdPy.passwords.set_default_policy`.
+    """
     username: str
-    email: str
+    email: str | None = None
     password: str | None = None
 
-    # TODO: Add all parameters
+    # Optional parameters
+    type: str = "user"                   # user or admin
+    verified: bool = True
+    hidden: bool = False
+    banned: bool = False
+    website: str | None = None
+    affiliation: str | None = None
+    country: str | None = None
+    bracket_id: int | None = None
+    language: str | None = None
 
-    def __post_init__(self):
-        if self.password is None or self.password == "":
-            self.password = self._generate_password()
+    # Parameters only set by the server
+    # DO NOT manually set these if not bad things will happen
+    id: int = None
+    oauth_id: int | None = None
+    team_id: int | None = None
+    created: str = None
+
+    # The server calls the username `name`
+    _aliases = {"name": "username"}
 
     @staticmethod
     def _generate_password() -> str:
-        return ''.join(random.choice(string.ascii_letters) for _ in range(10))
+        """Returns a secure password of the default policy, see `CTFdPy.passwords`"""
+        return generate_password()
 
-    def to_payload(self) -> dict[str, str]:
+    def to_payload(self) -> UserDict:
         """Returns a dictionary representation of the user that
         can be used to create or modify a user
+
+        The password is only included if it is set
         """
-        return {
+        d = {
             "name": self.username,
             "email": self.email,
-            "password": self.password,
-            "type": "user",
-            "verified": "true",
-            "banned": "false",
-            "hidden": "false"
-        }
\ No newline at end of file
+            "type": self.type,
+            "verified": self.verified,
+            "banned": self.banned,
+            "hidden": self.hidden
+        }
+
+        # Add optional parameters
+        if self.password is not None:
+            d["password"] = self.password
+        for key in ("website", "affiliation", "country", "bracket_id", "language"):
+            value = getattr(self, key)
+            if value is not None:
+                d[key] = value
+
+        return d
+
+    def to_changes(self) -> UserDict:
+        """Returns the part of the payload that was explicitly set, see `Model._explicit`"""
+        return self._explicit(self.to_payload())
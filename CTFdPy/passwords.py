@@ -0,0 +1,206 @@
+"""Generates passwords from the operating system's secure random source
+
+Random bytes are drawn in blocks and mapped to characters with translation tables,
+so generating a large batch costs a few C-level passes over a buffer instead of a
+Python call per character. Bytes that would bias the mapping are rejected, so every
+character of the alphabet is equally likely.
+
+    from CTFdPy.passwords import CharacterPolicy, PassphrasePolicy, set_default_policy
+
+    CharacterPolicy(length=20).generate(100_000)
+    set_default_policy(PassphrasePolicy.from_file("/usr/share/dict/words", count=5))
+"""
+from __future__ import annotations
+
+import os
+import secrets
+import string
+import threading
+import weakref
+from array import array
+from dataclasses import dataclass, field
+from math import log2
+from typing import Protocol, Sequence
+
+DEFAULT_ALPHABET = string.ascii_letters + string.digits
+
+
+class PasswordPolicy(Protocol):
+    """Anything that can generate passwords in bulk"""
+
+    def generate(self, count: int = 1) -> list[str]:
+        ...
+
+
+def _random_indices(count: int, size: int) -> bytes:
+    """Returns `count` unbiased random numbers below `size` (at most 256), one per byte"""
+    limit = 256 - 256 % size # Bytes from `limit` up would favour the lowest numbers
+    table = bytes(i % size for i in range(256))
+    rejected = bytes(range(limit, 256))
+
+    indices = b""
+    while len(indices) < count:
+        missing = count - len(indices)
+        # Draw enough that a single block is usually sufficient
+        block = secrets.token_bytes(missing * 256 // limit + 16)
+        indices += block.translate(table, rejected)
+    return indices[:count]
+
+
+@dataclass
+class CharacterPolicy:
+    """Passwords of `length` characters drawn uniformly from `alphabet`
+
+    Parameters
+    ----------
+    length : int, optional
+        The number of characters, by default 16
+    alphabet : str, optional
+        The characters to use, at most 256 distinct ones, by default letters and digits
+    """
+    length: int = 16
+    alphabet: str = DEFAULT_ALPHABET
+    _table: dict[int, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.length < 1:
+            raise ValueError("Length must be at least 1")
+        if len(set(self.alphabet)) != len(self.alphabet):
+            raise ValueError("Alphabet must not repeat characters")
+        if not 2 <= len(self.alphabet) <= 256:
+            raise ValueError("Alphabet must have between 2 and 256 characters")
+        # Maps the latin-1 character of each index to its character in the alphabet
+        self._table = {i: c for i, c in enumerate(self.alphabet)}
+
+    @property
+    def entropy(self) -> float:
+        """Returns the entropy of a password, in bits"""
+        return self.length * log2(len(self.alphabet))
+
+    def generate(self, count: int = 1) -> list[str]:
+        """Generates `count` passwords from a single block of random bytes"""
+        chars = _random_indices(count * self.length, len(self.alphabet)).decode("latin-1").translate(self._table)
+        length = self.length
+        return [chars[i:i + length] for i in range(0, len(chars), length)]
+
+
+@dataclass
+class PassphrasePolicy:
+    """Passphrases of `count` words drawn uniformly from `words`
+
+    Parameters
+    ----------
+    words : Sequence[str]
+        The words to use, without duplicates
+    count : int, optional
+        The number of words, by default 4
+    separator : str, optional
+        The string joining words, by default "-"
+    """
+    words: Sequence[str]
+    count: int = 4
+    separator: str = "-"
+
+    def __post_init__(self):
+        self.words = tuple(self.words)
+        if self.count < 1:
+            raise ValueError("Count must be at least 1")
+        if len(set(self.words)) != len(self.words):
+            raise ValueError("Words must not repeat")
+        if len(self.words) < 2:
+            raise ValueError("Words must have at least 2 words")
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> PassphrasePolicy:
+        """Reads the words from a file with a word per line, e.g. a diceware list
+
+        Lines are stripped, and blank lines, duplicates and words containing the
+        separator are skipped. Diceware lines (`11111 word`) keep only the word.
+        """
+        separator = kwargs.get("separator", "-")
+        words: dict[str, None] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                word = line.split()[-1] if line.strip() else ""
+                if word and separator not in word:
+                    words[word] = None
+        return cls(list(words), **kwargs)
+
+    @property
+    def entropy(self) -> float:
+        """Returns the entropy of a passphrase, in bits"""
+        return self.count * log2(len(self.words))
+
+    def generate(self, count: int = 1) -> list[str]:
+        """Generates `count` passphrases from blocks of random 32-bit numbers"""
+        size = len(self.words)
+        span = 2 ** (8 * array("I").itemsize)
+        limit = span - span % size
+        needed = count * self.count
+
+        indices: list[int] = []
+        while len(indices) < needed:
+            block = array("I")
+            block.frombytes(secrets.token_bytes((needed - len(indices) + 16) * block.itemsize))
+            indices.extend(n % size for n in block if n < limit)
+
+        words = [self.words[i] for i in indices[:needed]]
+        return [self.separator.join(words[i:i + self.count]) for i in range(0, needed, self.count)]
+
+
+_pools: weakref.WeakSet[PasswordPool] = weakref.WeakSet()
+
+
+def _clear_pools() -> None:
+    # A forked process must not hand out the passwords its parent will
+    for pool in _pools:
+        pool._lock = threading.Lock()
+        pool._passwords = []
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_clear_pools)
+
+
+class PasswordPool:
+    """Hands out passwords one at a time from batches generated in advance
+
+    Parameters
+    ----------
+    policy : PasswordPolicy, optional
+        The policy to generate with, by default a `CharacterPolicy`
+    batch_size : int, optional
+        The number of passwords generated at once, by default 1024
+    """
+
+    def __init__(self, policy: PasswordPolicy | None = None, batch_size: int = 1024):
+        self.policy = policy if policy is not None else CharacterPolicy()
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._passwords: list[str] = []
+        _pools.add(self)
+
+    def get(self) -> str:
+        with self._lock:
+            if not self._passwords:
+                self._passwords = self.policy.generate(self.batch_size)
+            return self._passwords.pop()
+
+
+_default_pool = PasswordPool()
+
+
+def set_default_policy(policy: PasswordPolicy, batch_size: int = 1024) -> None:
+    """Sets the policy of the passwords generated for users created without one"""
+    global _default_pool
+    _default_pool = PasswordPool(policy, batch_size)
+
+
+def generate_password() -> str:
+    """Returns a password of the default policy, from the next pregenerated batch"""
+    return _default_pool.get()
+
+
+def generate_passwords(count: int, policy: PasswordPolicy | None = None) -> list[str]:
+    """Generates `count` passwords at once, with the default policy if none is given"""
+    return (policy or _default_pool.policy).generate(count)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Literal
+
+from CTFdPy.models.scoreboard import ScoreboardEntry
+from CTFdPy.models.submissions import Submission
+
+if TYPE_CHECKING:
+    from CTFdPy.client import APIResponse, Client
+
+
+class _ConditionalGet:
+    """Sends GET requests with `If-None-Match` when the server sent an ETag
+
+    Only the ETag of the last endpoint is kept, as pollers request the same endpoint over and over.
+    """
+
+    def __init__(self, client: Client):
+        self.client = client
+        self._endpoint: str | None = None
+        self._etag: str | None = None
+
+    def get(self, endpoint: str) -> APIResponse | None:
+        """Returns the response, or None if it did not change since the last request"""
+        headers = {}
+        if endpoint == self._endpoint and self._etag is not None:
+            headers["If-None-Match"] = self._etag
+
+        response = self.client._send("GET", endpoint, headers=headers)
+        if response.status_code == 304:
+            return None
+
+        data = self.client._handle(response)
+        self._endpoint = endpoint
+        self._etag = response.headers.get("ETag")
+        return data
+
+
+class SubmissionPoller:
+    """Follows new submissions, only fetching what changed since the last poll
+
+    Submissions are listed in ascending id order, so new submissions are always on the
+    last pages. The poller remembers the last submission id it returned and the page it
+    was on, and each poll only requests that page and any following it. Requests are
+    conditional when the server sends ETags, so a poll without new submissions costs a
+    single request answered with 304 Not Modified.
+
+        poller = SubmissionPoller(client, type="correct")
+        poller.seek_end()
+        async for solve in poller.stream():
+            print(f"{solve.user['name']} solved {solve.challenge['name']}")
+
+    Parameters
+    ----------
+    client : Client
+        The client to poll with
+    type : str, optional
+        Only follow correct or incorrect submissions, by default all
+    last_id : int, optional
+        Only return submissions after this id, by default all
+    per_page : int, optional
+        The number of submissions requested per page, by default 100
+    interval : float, optional
+        The seconds between polls of `watch` and `stream`, by default 5
+    max_pages : int, optional
+        The most pages requested by a single poll, the next poll carries on from
+        where it stopped, by default 10
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        type: Literal["correct", "incorrect"] | None = None,
+        *,
+        last_id: int = 0,
+        per_page: int = 100,
+        interval: float = 5,
+        max_pages: int = 10
+    ):
+        if max_pages < 1:
+            raise ValueError("Max pages must be at least 1")
+        self.client = client
+        self.type = type
+        self.last_id = last_id
+        self.per_page = per_page
+        self.interval = interval
+        self.max_pages = max_pages
+
+        self._page = 1
+        self._resume = False # Whether `_page` is the unseen page after the last poll's limit
+        self._request = _ConditionalGet(client)
+
+    def _endpoint(self, page: int) -> str:
+        return self.client._submissions_endpoint(type=self.type, page=page, per_page=self.per_page)
+
+    def seek_end(self) -> None:
+        """Skips every existing submission, so only new ones are returned"""
+        first = self.client._get(self._endpoint(1))
+        pagination = (first.get("meta") or {}).get("pagination") or {}
+        self._page = pagination.get("pages") or 1
+        last = first if self._page == 1 else self.client._get(self._endpoint(self._page))
+        ids = [submission["id"] for submission in last["data"]]
+        self.last_id = max(ids, default=self.last_id)
+
+    def poll(self) -> list[Submission]:
+        """Returns the submissions made since the last poll, in id order
+
+        Raises
+        ------
+        requests.HTTPError
+            If a request fails
+        """
+        new: list[Submission] = []
+        page = self._page
+        moved_forward = self._resume
+        self._resume = False
+        for _ in range(self.max_pages):
+            response = self._request.get(self._endpoint(page))
+            if response is None:
+                break
+
+            submissions = sorted(response["data"], key=lambda submission: submission["id"])
+            if (
+                not moved_forward and page > 1
+                and (not submissions or submissions[0]["id"] > self.last_id)
+            ):
+                # Only the page the poll started from, or the pages before it, can lack the last
+                # seen submission because submissions were deleted and unseen ones moved back
+                page -= 1
+                continue
+
+            new.extend(Submission.from_dict(s) for s in submissions if s["id"] > self.last_id)
+            self._page = page
+            pagination = (response.get("meta") or {}).get("pagination") or {}
+            next_page = pagination.get("next")
+            if next_page is None:
+                break
+            page = next_page
+            moved_forward = True
+        else:
+            # The page limit was reached, the next poll starts from the page not requested yet
+            if moved_forward:
+                self._page = page
+                self._resume = True
+
+        if new:
+            self.last_id = new[-1].id
+        return new
+
+    def watch(self) -> Iterator[Submission]:
+        """Yields new submissions forever, polling every `interval` seconds"""
+        while True:
+            yield from self.poll()
+            time.sleep(self.interval)
+
+    async def stream(self) -> AsyncIterator[Submission]:
+        """Yields new submissions forever, polling every `interval` seconds without blocking the event loop"""
+        while True:
+            for submission in await asyncio.to_thread(self.poll):
+                yield submission
+            await asyncio.sleep(self.interval)
+
+
+class ScoreboardPoller:
+    """Follows the scoreboard, only returning it when it changed
+
+    Requests are conditional when the server sends ETags. Otherwise the scoreboard is
+    still downloaded, but only decoded and returned when its content changed.
+
+    Parameters
+    ----------
+    client : Client
+        The client to poll with
+    interval : float, optional
+        The seconds between polls of `watch` and `stream`, by default 5
+    """
+
+    def __init__(self, client: Client, interval: float = 5):
+        self.client = client
+        self.interval = interval
+
+        self._request = _ConditionalGet(client)
+        self._digest: bytes | None = None
+
+    def poll(self) -> list[ScoreboardEntry] | None:
+        """Returns the scoreboard, or None if it did not change since the last poll
+
+        Raises
+        ------
+        requests.HTTPError
+            If the request fails
+        """
+        response = self._request.get("/api/v1/scoreboard")
+        if response is None:
+            return None
+
+        digest = hashlib.sha1(repr(response["data"]).encode()).digest()
+        if digest == self._digest:
+            return None
+        self._digest = digest
+        return [ScoreboardEntry.from_dict(entry) for entry in response["data"]]
+
+    def watch(self) -> Iterator[list[ScoreboardEntry]]:
+        """Yields the scoreboard whenever it changes, polling every `interval` seconds"""
+        while True:
+            scoreboard = self.poll()
+            if scoreboard is not None:
+                yield scoreboard
+            time.sleep(self.interval)
+
+    async def stream(self) -> AsyncIterator[list[ScoreboardEntry]]:
+        """Yields the scoreboard whenever it changes, without blocking the event loop"""
+        while True:
+            scoreboard = await asyncio.to_thread(self.poll)
+            if scoreboard is not None:
+                yield scoreboard
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Iterable
+
+from CTFdPy.bulk import BulkItemResult, BulkResult, run_bulk
+from CTFdPy.models.challenges import ChallengeCreateResult
+from CTFdPy.models.tags import Tag
+from CTFdPy.models.topics import ChallengeTopic
+from CTFdPy.sync import ChallengeKey
+
+if TYPE_CHECKING:
+    from CTFdPy.client import Client
+    from CTFdPy.journal import Journal
+    from CTFdPy.loader import PackChallenge
+
+
+def _name(key: ChallengeKey) -> str:
+    return f"{key[0]}/{key[1]}"
+
+
+def resolve_reference(challenges: Iterable[PackChallenge], reference: str) -> PackChallenge:
+    """Finds the challenge a requirement or next refers to, by name or `category/name`
+
+    Raises
+    ------
+    ValueError
+        If no challenge or several challenges match
+    """
+    if "/" in reference:
+        category, _, name = reference.rpartition("/")
+        matches = [c for c in challenges if c.key == (category, name)]
+    else:
+        matches = [c for c in challenges if c.spec.challenge.name == reference]
+
+    if not matches:
+        raise ValueError(f"Unknown challenge {reference}")
+    if len(matches) > 1:
+        raise ValueError(f"Ambiguous challenge {reference}, use category/name")
+    return matches[0]
+
+
+class CycleError(ValueError):
+    def __init__(self, cycle: list[ChallengeKey]):
+        self.cycle = cycle
+
+    def __str__(self):
+        return f"Requirements form a cycle: {' -> '.join(_name(key) for key in self.cycle)}"
+
+
+@dataclass
+class DependencyGraph:
+    """Represents the requirements between challenges
+
+    `next` challenges are not dependencies, as they can be set once every challenge exists.
+    """
+    prerequisites: dict[ChallengeKey, list[ChallengeKey]] = field(default_factory=dict)
+
+    @classmethod
+    def from_challenges(cls, challenges: Iterable[PackChallenge]) -> DependencyGraph:
+        """Builds the graph of challenges, resolving their requirements by name
+
+        Raises
+        ------
+        ValueError
+            If a requirement is unknown or ambiguous
+        """
+        challenges = list(challenges)
+        return cls({
+            challenge.key: [resolve_reference(challenges, reference).key for reference in challenge.requirements]
+            for challenge in challenges
+        })
+
+    def dependents(self) -> dict[ChallengeKey, list[ChallengeKey]]:
+        """Returns the challenges requiring each challenge"""
+        dependents: dict[ChallengeKey, list[ChallengeKey]] = {key: [] for key in self.prerequisites}
+        for key, prerequisites in self.prerequisites.items():
+            for prerequisite in prerequisites:
+                dependents[prerequisite].append(key)
+        return dependents
+
+    def levels(self) -> list[list[ChallengeKey]]:
+        """Returns the challenges grouped by depth, each level only requires earlier levels
+
+        Raises
+        ------
+        CycleError
+            If requirements form a cycle
+        """
+        dependents = self.dependents()
+        remaining = {key: len(set(prerequisites)) for key, prerequisites in self.prerequisites.items()}
+        level = [key for key, count in remaining.items() if count == 0]
+        levels = []
+        while level:
+            levels.append(level)
+            upcoming = []
+            for key in level:
+                for dependent in set(dependents[key]):
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        upcoming.append(dependent)
+            level = upcoming
+
+        if sum(len(level) for level in levels) < len(self.prerequisites):
+            raise CycleError(self._find_cycle({key for key, count in remaining.items() if count > 0}))
+        return levels
+
+    def _find_cycle(self, keys: set[ChallengeKey]) -> list[ChallengeKey]:
+        """Returns a cycle among challenges that could not be ordered"""
+        # Every one of these challenges has a prerequisite among them, so walking
+        # prerequisites from any of them must come back to a challenge already seen
+        path: list[ChallengeKey] = []
+        seen: dict[ChallengeKey, int] = {}
+        key = next(iter(sorted(keys)))
+        while key not in seen:
+            seen[key] = len(path)
+            path.append(key)
+            key = next(p for p in self.prerequisites[key] if p in keys)
+        return path[seen[key]:] + [key]
+
+
+def deploy_challenges(
+    client: Client,
+    challenges: Iterable[PackChallenge],
+    *,
+    workers: int = 8,
+    sub_workers: int = 1,
+    delete_on_error: bool = True,
+    journal: Journal | None = None,
+    existing: dict[ChallengeKey, int] | None = None
+) -> BulkResult[PackChallenge, ChallengeCreateResult]:
+    """Creates challenges in dependency order, then links their next challenges
+
+    A challenge is created as soon as all of its requirements exist, with its requirements
+    set, so challenges of the same topological level are created concurrently and nothing
+    waits on unrelated challenges. A challenge is only created once its flags, hints, tags,
+    topics and files are, so hint chains of different challenges are created concurrently,
+    and a challenge deleted because of them fails its dependents before they are created.
+    Once every challenge exists, `next_id` is set with PATCHes.
+
+    Parameters
+    ----------
+    client : Client
+        The client to create the challenges with
+    challenges : Iterable[PackChallenge]
+        The challenges, with requirements and next challenges referring to each other by name
+    workers : int, optional
+        The number of challenges to create at once, by default 8
+    sub_workers : int, optional
+        The number of flags, hints, tags, topics and files of a challenge to create at once, by default 1
+    delete_on_error : bool, optional
+        Whether to delete a challenge if its flags, hints, tags, topics or files fail, by default True
+    journal : Journal, optional
+        A journal to record every created resource in, by default None
+    existing : dict[ChallengeKey, int], optional
+        The ids of challenges that already exist, which are not created again, by default None
+
+    Returns
+    -------
+    BulkResult[PackChallenge, ChallengeCreateResult]
+        The outcome of every challenge that did not exist. Challenges requiring a challenge that
+        failed are not created
+
+    Raises
+    ------
+    CycleError
+        If requirements form a cycle, before anything is created
+    ValueError
+        If a requirement or next challenge is unknown or ambiguous
+    """
+    challenges = list(challenges)
+    graph = DependencyGraph.from_challenges(challenges)
+    graph.levels()
+    dependents = graph.dependents()
+    next_keys = {
+        challenge.key: resolve_reference(challenges, challenge.next).key
+        for challenge in challenges if challenge.next
+    }
+
+    if len(graph.prerequisites) < len(challenges):
+        raise ValueError("Challenges must have a unique category and name")
+
+    ids: dict[ChallengeKey, int] = dict(existing or {})
+    results = {
+        challenge.key: BulkItemResult(i, challenge)
+        for i, challenge in enumerate(challenges) if challenge.key not in ids
+    }
+    remaining = {
+        key: len({prerequisite for prerequisite in graph.prerequisites[key] if prerequisite not in ids})
+        for key in results
+    }
+
+    def create(challenge: PackChallenge) -> ChallengeCreateResult:
+        spec = challenge.spec
+        created = spec.challenge
+        if challenge.requirements:
+            requirements: dict[str, Any] = {
+                "prerequisites": [ids[key] for key in graph.prerequisites[challenge.key]]
+            }
+            if challenge.anonymize:
+                requirements["anonymize"] = True
+            # A copy, so the caller's challenges can be deployed again, e.g. to another server
+            created = replace(created, requirements=requirements)
+        # Hints are created before the challenge counts as created, so a challenge deleted
+        # because of its hints never has dependents requiring it
+        return client._create_challenge(
+            created,
+            spec.flags,
+            spec.hints or None,
+            [Tag(tag) for tag in spec.tags],
+            [ChallengeTopic(topic) for topic in spec.topics],
+            spec.files or None,
+            hints_ordered=spec.hints_ordered,
+            delete_on_error=delete_on_error,
+            workers=sub_workers,
+            journal=journal
+        )
+
+    def fail_dependents(key: ChallengeKey) -> None:
+        stack = list(dependents[key])
+        while stack:
+            dependent = stack.pop()
+            if dependent in results and results[dependent].error is None:
+                results[dependent].error = ValueError(f"Requirement {_name(key)} was not created")
+                stack.extend(dependents[dependent])
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        pending: dict[Future[ChallengeCreateResult], ChallengeKey] = {
+            executor.submit(create, results[key].item): key
+            for key, count in remaining.items() if count == 0
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                item = results[key]
+                try:
+                    item.result = future.result()
+                except Exception as e:
+                    item.error = e
+                    fail_dependents(key)
+                    continue
+
+                ids[key] = item.result.id
+                for dependent in set(dependents[key]):
+                    if dependent not in results:
+                        continue
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0 and results[dependent].error is None:
+                        pending[executor.submit(create, results[dependent].item)] = dependent
+
+    def link(key: ChallengeKey) -> None:
+        next_key = next_keys[key]
+        if next_key not in ids:
+            raise ValueError(f"Next challenge {_name(next_key)} was not created")
+        client.update_challenge(ids[key], next_id=ids[next_key])
+
+    # Existing challenges are only linked again if their next challenge was created
+    links = [key for key in next_keys if key in ids and (key in results or next_keys[key] in results)]
+    linked = run_bulk(link, links, workers)
+    for item in linked.failed:
+        if item.item in results:
+            results[item.item].error = item.error
+
+    return BulkResult(sorted(results.values(), key=lambda item: item.index))
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import os
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from functools import partial
+from io import BufferedIOBase
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal
+
+from CTFdPy.bulk import BulkResult, run_bulk
+from CTFdPy.models.challenges import Challenge, ChallengePreview
+from CTFdPy.models.files import File
+from CTFdPy.models.flags import Flag
+from CTFdPy.models.hints import Hint
+from CTFdPy.models.tags import Tag
+from CTFdPy.models.topics import ChallengeTopic
+from CTFdPy.uploads import HashManifest, hash_file
+
+if TYPE_CHECKING:
+    from CTFdPy.client import Client
+
+
+ChallengeKey = tuple[str, str] # (category, name)
+
+
+@dataclass
+class ChallengeSpec:
+    """Represents the desired state of a challenge and everything attached to it"""
+    challenge: Challenge
+    flags: list[Flag] = field(default_factory=list)
+    hints: list[Hint] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    topics: list[str] = field(default_factory=list)
+    files: list[os.PathLike[Any] | BufferedIOBase] = field(default_factory=list)
+    hints_ordered: bool = True # Whether hints require previous hints, from top to bottom
+
+    @property
+    def key(self) -> ChallengeKey:
+        """Returns the key used to match the challenge on the server"""
+        return (self.challenge.category, self.challenge.name)
+
+
+@dataclass
+class SyncOperation:
+    """Represents a single request needed to reach the desired state"""
+    method: Literal["POST", "PATCH", "DELETE"]
+    resource: str
+    challenge: ChallengeKey
+    description: str
+    run: Callable[[], Any] = field(repr=False)
+
+    def __str__(self) -> str:
+        category, name = self.challenge
+        return f"{self.method} {self.resource} [{category}/{name}] {self.description}"
+
+
+@dataclass
+class SyncPlan:
+    """Represents the operations needed to bring the server to the desired state
+
+    Operations of the same challenge run in order, while different challenges
+    are synced concurrently.
+    """
+    operations: list[SyncOperation] = field(default_factory=list)
+
+    def __iter__(self) -> Iterator[SyncOperation]:
+        return iter(self.operations)
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def apply(self, workers: int = 8) -> BulkResult[list[SyncOperation], list[Any]]:
+        """Applies the plan
+
+        Parameters
+        ----------
+        workers : int, optional
+            The number of challenges to sync at once, by default 8
+
+        Returns
+        -------
+        BulkResult[list[SyncOperation], list[Any]]
+            The outcome of each challenge, with its operations as the item.
+            A challenge stops at its first failed operation
+        """
+        groups: dict[ChallengeKey, list[SyncOperation]] = defaultdict(list)
+        for operation in self.operations:
+            groups[operation.challenge].append(operation)
+
+        return run_bulk(
+            lambda operations: [operation.run() for operation in operations],
+            groups.values(),
+            workers
+        )
+
+
+def _same(current: Any, desired: Any) -> bool:
+    """Compares a value from the server with a payload value, which may be a string"""
+    if current in (None, "") and desired in (None, ""):
+        return True
+    if isinstance(current, (dict, list)) or isinstance(desired, (dict, list)):
+        return current == desired
+    return str(current) == str(desired)
+
+
+def _same_requirements(current: dict[str, Any] | None, desired: dict[str, Any]) -> bool:
+    """Compares requirements, prerequisites in any order"""
+    current = current or {}
+    for name, value in desired.items():
+        if name == "prerequisites":
+            if sorted(current.get(name) or []) != sorted(value or []):
+                return False
+        elif not _same(current.get(name), value):
+            return False
+    return True
+
+
+def _file_name(file: os.PathLike[Any] | BufferedIOBase | File) -> str:
+    if isinstance(file, File):
+        return os.path.basename(file.location)
+    if isinstance(file, BufferedIOBase):
+        return os.path.basename(file.name)
+    return os.path.basename(file)
+
+
+def plan_sync(
+    client: Client,
+    specs: Iterable[ChallengeSpec],
+    *,
+    prune: bool = False,
+    workers: int = 8,
+    manifest: HashManifest | None = None
+) -> SyncPlan:
+    """Computes the operations needed to bring the server to the desired state
+
+    The current state is fetched once: the challenge, flag, hint and tag listings,
+    plus the details, hints, topics, files and requirements of each matching challenge,
+    concurrently. Challenges are matched by category and name. Existing challenges are
+    patched instead of recreated, so their solves are kept.
+
+    Files are matched by name and content: a local file is hashed and compared with
+    the `sha1sum` of the file of the same name, and replaced if they differ. Files
+    whose hash the server does not report are replaced, unless `manifest` recorded it.
+
+    Parameters
+    ----------
+    client : Client
+        The client to sync with
+    specs : Iterable[ChallengeSpec]
+        The desired challenges
+    prune : bool, optional
+        Whether to delete challenges on the server that are not in `specs`, by default False.
+        This deletes their solves
+    workers : int, optional
+        The number of concurrent requests used to fetch the current state, by default 8
+    manifest : HashManifest, optional
+        Caches the hashes of local files, and records the hashes of uploaded files
+        for servers that do not report `sha1sum`, see `Client.create_file`
+
+    Returns
+    -------
+    SyncPlan
+        The operations to apply
+
+    Raises
+    ------
+    ValueError
+        If two specs have the same category and name
+    requests.HTTPError
+        If fetching the current state fails
+    """
+    desired: dict[ChallengeKey, ChallengeSpec] = {}
+    for spec in specs:
+        if spec.key in desired:
+            raise ValueError(f"Duplicate challenge {spec.key[0]}/{spec.key[1]}")
+        desired[spec.key] = spec
+
+    current: dict[ChallengeKey, ChallengePreview] = {
+        (challenge.category, challenge.name): challenge for challenge in client.get_challenges()
+    }
+
+    flags: dict[int, list[Flag]] = defaultdict(list)
+    for flag in client.get_flags():
+        flags[flag.challenge_id].append(flag)
+
+    tags: dict[int, list[Tag]] = defaultdict(list)
+    for tag in client.get_tags():
+        tags[tag.challenge_id].append(tag)
+
+    hinted = {hint.challenge_id for hint in client.get_hints()}
+
+    def fetch(key: ChallengeKey) -> tuple[Challenge, list[Hint], list[ChallengeTopic], list[File], dict | None]:
+        challenge_id = current[key].id
+        return (
+            client.get_challenge(challenge_id),
+            client.get_challenge_hints(challenge_id) if challenge_id in hinted else [],
+            client.get_challenge_topics(challenge_id),
+            client.get_challenge_files(challenge_id),
+            # The challenge itself does not include its requirements
+            client._get(f"/api/v1/challenges/{challenge_id}/requirements")["data"]
+            if desired[key].challenge.requirements is not None else None
+        )
+
+    matched = [key for key in desired if key in current]
+    details = run_bulk(fetch, matched, workers)
+    if details.failed:
+        raise details.failed[0].error
+
+    plan = SyncPlan()
+
+    for key, detail in zip(matched, details):
+        challenge, current_hints, current_topics, current_files, requirements = detail.result
+        _plan_challenge(
+            plan, client, desired[key], challenge,
+            flags[challenge.id], current_hints, tags[challenge.id], current_topics, current_files,
+            requirements, manifest
+        )
+    # Keeps the hashes of the local files, so the next plan does not read them again
+    if manifest is not None:
+        manifest.flush()
+
+    for key, spec in desired.items():
+        if key not in current:
+            plan.operations.append(SyncOperation(
+                "POST", "challenge", key, "create with all sub-resources",
+                partial(
+                    client._create_challenge,
+                    spec.challenge,
+                    spec.flags,
+                    spec.hints,
+                    [Tag(tag) for tag in spec.tags],
+                    [ChallengeTopic(topic) for topic in spec.topics],
+                    spec.files or None,
+                    hints_ordered=spec.hints_ordered
+                )
+            ))
+
+    if prune:
+        for key, challenge in current.items():
+            if key not in desired:
+                plan.operations.append(SyncOperation(
+                    "DELETE", "challenge", key, f"id={challenge.id}",
+                    partial(client.delete_challenge, challenge.id)
+                ))
+
+    return plan
+
+
+def _plan_challenge(
+    plan: SyncPlan,
+    client: Client,
+    spec: ChallengeSpec,
+    challenge: Challenge,
+    current_flags: list[Flag],
+    current_hints: list[Hint],
+    current_tags: list[Tag],
+    current_topics: list[ChallengeTopic],
+    current_files: list[File],
+    current_requirements: dict[str, Any] | None = None,
+    manifest: HashManifest | None = None
+) -> None:
+    """Adds the operations needed to sync an existing challenge to the plan"""
+    key = spec.key
+    challenge_id = challenge.id
+    operations = plan.operations
+
+    # Only send the fields that changed
+    changes = {}
+    for name, value in spec.challenge.to_payload().items():
+        if name == "requirements":
+            if not _same_requirements(current_requirements, value):
+                changes[name] = value
+        elif name not in challenge.raw or not _same(challenge.raw[name], value):
+            changes[name] = value
+    if changes:
+        operations.append(SyncOperation(
+            "PATCH", "challenge", key, ", ".join(changes),
+            partial(client.update_challenge, challenge_id, **changes)
+        ))
+
+    # Flags, tags, topics and files are compared as multisets
+    def flag_key(flag: Flag) -> tuple[str, str, str]:
+        return (flag.content, flag.type, flag.data or "")
+
+    wanted_flags = Counter(flag_key(flag) for flag in spec.flags)
+    for flag in current_flags:
+        if wanted_flags[flag_key(flag)] > 0:
+            wanted_flags[flag_key(flag)] -= 1
+        else:
+            operations.append(SyncOperation(
+                "DELETE", "flag", key, f"id={flag.id}", partial(client.delete_flag, flag.id)
+            ))
+    for flag in spec.flags:
+        if wanted_flags[flag_key(flag)] > 0:
+            wanted_flags[flag_key(flag)] -= 1
+            flag.challenge_id = challenge_id
+            operations.append(SyncOperation(
+                "POST", "flag", key, flag.type, partial(client._create_flag, flag)
+            ))
+
+    wanted_tags = Counter(spec.tags)
+    for tag in current_tags:
+        if wanted_tags[tag.value] > 0:
+            wanted_tags[tag.value] -= 1
+        else:
+            operations.append(SyncOperation(
+                "DELETE", "tag", key, tag.value, partial(client.delete_tag, tag.id)
+            ))
+    for value, count in wanted_tags.items():
+        for _ in range(count):
+            operations.append(SyncOperation(
+                "POST", "tag", key, value, partial(client._create_tag, Tag(value, challenge_id))
+            ))
+
+    wanted_topics = Counter(spec.topics)
+    for topic in current_topics:
+        if wanted_topics[topic.value] > 0:
+            wanted_topics[topic.value] -= 1
+        else:
+            operations.append(SyncOperation(
+                "DELETE", "topic", key, topic.value, partial(client.delete_challenge_topic, topic.id)
+            ))
+    for value, count in wanted_topics.items():
+        for _ in range(count):
+            operations.append(SyncOperation(
+                "POST", "topic", key, value,
+                partial(client._create_topic, ChallengeTopic(value, challenge_id))
+            ))
+
+    # Files are matched by name, and replaced if their content changed
+    hasher = manifest.hash if manifest is not None else hash_file
+    wanted_files = {_file_name(file): file for file in spec.files}
+    wanted_hashes = {name: hasher(file) for name, file in wanted_files.items()}
+    for file in current_files:
+        name = _file_name(file)
+        sha1 = file.sha1sum
+        if sha1 is None and manifest is not None:
+            sha1 = manifest.uploaded.get(file.location)
+        if name in wanted_files and sha1 == wanted_hashes[name]:
+            del wanted_files[name]
+        else:
+            operations.append(SyncOperation(
+                "DELETE", "file", key, name, partial(client.delete_file, file.id)
+            ))
+    if wanted_files:
+        operations.append(SyncOperation(
+            "POST", "file", key, ", ".join(wanted_files),
+            partial(client.create_file, challenge_id, *wanted_files.values(), manifest=manifest)
+        ))
+
+    # Hints are compared in order. If the server has a prefix of the desired
+    # hints only the rest are created, otherwise the chain is rebuilt
+    current_hints = sorted(current_hints, key=lambda hint: hint.id)
+    current_chain = [(hint.content, hint.cost) for hint in current_hints]
+    wanted_chain = [(hint.content, hint.cost) for hint in spec.hints]
+    if current_chain == wanted_chain:
+        return
+
+    if current_chain == wanted_chain[:len(current_chain)]:
+        new_hints = spec.hints[len(current_chain):]
+        previous = current_hints[-1] if current_hints else None
+    else:
+        for hint in current_hints:
+            operations.append(SyncOperation(
+                "DELETE", "hint", key, f"id={hint.id}", partial(client.delete_hint, hint.id)
+            ))
+        new_hints = spec.hints
+        previous = None
+
+    if not new_hints:
+        return
+
+    for hint in new_hints:
+        hint.challenge_id = challenge_id
+
+    def create_hints() -> list[Hint]:
+        if spec.hints_ordered and previous is not None:
+            new_hints[0].set_requirements(previous)
+        return client._create_hint_chain(new_hints, spec.hints_ordered)
+
+    operations.append(SyncOperation(
+        "POST", "hint", key, f"{len(new_hints)} hint(s)", create_hints
+    ))
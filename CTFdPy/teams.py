@@ -0,0 +1,243 @@
+"""Provisions teams and their members for CTFs in team mode
+
+A roster is a CSV file with a row per user and the name of their team:
+
+    team,username,email,password,team_password
+    Gryphons,alice,alice@example.com,,hunter2
+    Gryphons,bob,bob@example.com,,
+    Owls,carol,carol@example.com,s3cret,
+
+Only `team`, `username` and `email` are required. Team fields are taken from the
+first row of the team that sets them, and users without a password get a generated one.
+
+Teams and users are created together in a first wave, then every member is added to
+their team in a second wave, and the first member becomes the captain in a third.
+The credentials of every user and team are streamed to a `CTFdPy.csv.CredentialWriter`
+file, with generated passwords written before the users are created:
+
+    python -m CTFdPy.teams roster.csv --credentials credentials.csv --url https://ctf.example.com --token $CTFD_TOKEN
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+from CTFdPy.bulk import BulkItemResult, BulkResult, iter_bulk, run_bulk
+from CTFdPy.models.teams import Team
+from CTFdPy.models.users import User
+
+if TYPE_CHECKING:
+    from CTFdPy.client import Client
+    from CTFdPy.csv import CredentialWriter
+
+TEAM_FIELDS = {"team_email": "email", "team_password": "password"}
+
+
+@dataclass
+class TeamRoster:
+    """Represents a team and the users to create as its members"""
+    team: Team
+    members: list[User] = field(default_factory=list)
+
+
+@dataclass
+class TeamProvisionResult:
+    """Represents what was created for a team, even if some of it failed"""
+    team: Team | None = None                            # The created team
+    users: list[User] = field(default_factory=list)     # The created users, with their passwords
+    members: list[User] = field(default_factory=list)   # The created users that were added to the team
+    captain: User | None = None
+
+
+class TeamProvisionError(Exception):
+    def __init__(self, errors: dict[str, Exception]):
+        self.errors = errors # The error of the team or of each user, by name
+
+    def __str__(self):
+        return "; ".join(f"{name}: {error}" for name, error in self.errors.items())
+
+
+def group_roster(rows: Iterable[dict[str, str]]) -> list[TeamRoster]:
+    """Groups roster rows by team, in the order teams first appear
+
+    Parameters
+    ----------
+    rows : Iterable[dict[str, str]]
+        Rows with a `team` and the fields of a user, plus optionally `team_email`
+        and `team_password`, e.g. from `RosterCSVHandler.read_csv`
+
+    Returns
+    -------
+    list[TeamRoster]
+        The teams with their members
+    """
+    teams: dict[str, TeamRoster] = {}
+    for row in rows:
+        row = dict(row)
+        name = row.pop("team")
+        team_fields = {TEAM_FIELDS[key]: row.pop(key) for key in list(row) if key in TEAM_FIELDS}
+
+        roster = teams.get(name)
+        if roster is None:
+            roster = teams[name] = TeamRoster(Team(name))
+        for key, value in team_fields.items():
+            if value and getattr(roster.team, key) is None:
+                setattr(roster.team, key, value)
+
+        roster.members.append(User(**{key: value or None for key, value in row.items()}))
+    return list(teams.values())
+
+
+def provision_teams(
+    client: Client,
+    rosters: Iterable[TeamRoster],
+    *,
+    workers: int = 8,
+    captains: bool = True,
+    credentials: CredentialWriter | None = None
+) -> BulkResult[TeamRoster, TeamProvisionResult]:
+    """Creates teams and their members, then adds the members to their teams
+
+    Every team and user is created in one pool, so the whole roster takes about as long
+    as `(teams + users) / workers` requests, then memberships are added in a second wave
+    and captains set in a third. A failed team or user does not stop the others.
+
+    Parameters
+    ----------
+    client : Client
+        The client to create the teams with
+    rosters : Iterable[TeamRoster]
+        The teams with their members, e.g. from `group_roster`
+    workers : int, optional
+        The number of concurrent requests, by default 8
+    captains : bool, optional
+        Whether to make the first member of each team its captain, by default True
+    credentials : CredentialWriter, optional
+        Where to write the credentials of every user and team. Members without a password
+        are given one and written as pending before anything is created, and the outcome
+        of every user and team is written as it arrives
+
+    Returns
+    -------
+    BulkResult[TeamRoster, TeamProvisionResult]
+        The outcome of every team. A team fails with a `TeamProvisionError` if the team,
+        a member, a membership or its captain failed, and its result still has what was created
+    """
+    results = [
+        BulkItemResult(i, roster, TeamProvisionResult()) for i, roster in enumerate(rosters)
+    ]
+    errors: list[dict[str, Exception]] = [{} for _ in results]
+
+    def fail(index: int, name: str, error: Exception) -> None:
+        errors[index][name] = error
+
+    if credentials is not None:
+        for item in results:
+            for user in item.item.members:
+                credentials.write_pending(user, item.item.team.name)
+        credentials.flush()
+
+    # Wave 1: teams and users
+    tasks = [(i, item.item.team) for i, item in enumerate(results)]
+    tasks.extend((i, user) for i, item in enumerate(results) for user in item.item.members)
+
+    def create(task: tuple[int, Team | User]) -> Team | User:
+        _, model = task
+        if isinstance(model, Team):
+            return client._create_team(model)
+        return client._create_user(model)
+
+    for created in iter_bulk(create, tasks, workers):
+        index, model = created.item
+        result = results[index].result
+        if credentials is not None:
+            outcome = BulkItemResult(created.index, model, created.result, created.error)
+            if isinstance(model, Team):
+                credentials.write_team(outcome)
+            else:
+                credentials.write(outcome, results[index].item.team.name)
+        if not created.ok:
+            fail(index, model.name if isinstance(model, Team) else model.username, created.error)
+        elif isinstance(created.result, Team):
+            result.team = created.result
+        else:
+            result.users.append(created.result)
+
+    # Wave 2: memberships
+    memberships = [
+        (i, user) for i, item in enumerate(results) if item.result.team is not None
+        for user in item.result.users
+    ]
+
+    def add(membership: tuple[int, User]) -> list[int]:
+        index, user = membership
+        return client.add_team_member(results[index].result.team.id, user.id)
+
+    for added in run_bulk(add, memberships, workers):
+        index, user = added.item
+        if added.ok:
+            results[index].result.members.append(user)
+        else:
+            fail(index, user.username, added.error)
+
+    # Wave 3: captains, the first member in roster order
+    if captains:
+        def captain(index: int) -> User:
+            result = results[index].result
+            order = {user.username: i for i, user in enumerate(results[index].item.members)}
+            user = min(result.members, key=lambda user: order[user.username])
+            result.team = client.update_team(result.team.id, captain_id=user.id)
+            return user
+
+        appointed = run_bulk(captain, [i for i, item in enumerate(results) if item.result.members], workers)
+        for item in appointed:
+            if item.ok:
+                results[item.item].result.captain = item.result
+            else:
+                fail(item.item, results[item.item].item.team.name, item.error)
+
+    for item, item_errors in zip(results, errors):
+        if item_errors:
+            item.error = TeamProvisionError(item_errors)
+    return BulkResult(results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m CTFdPy.teams", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("roster", help="the roster CSV file")
+    parser.add_argument(
+        "--credentials", required=True,
+        help="the CSV file the credentials of created users and teams are appended to"
+    )
+    parser.add_argument("--url", default=os.environ.get("CTFD_URL"), help="the CTFd URL, by default $CTFD_URL")
+    parser.add_argument("--token", default=os.environ.get("CTFD_TOKEN"), help="an admin API token, by default $CTFD_TOKEN")
+    parser.add_argument("--workers", type=int, default=8, help="requests sent at once")
+    parser.add_argument("--no-captains", action="store_true", help="do not make the first member of each team its captain")
+    args = parser.parse_args()
+
+    if not args.url or not args.token:
+        parser.error("--url and --token are required")
+
+    from CTFdPy.client import Client
+    from CTFdPy.csv import CredentialWriter, RosterCSVHandler
+
+    rosters = RosterCSVHandler(args.roster).read_rosters()
+    client = Client(args.url, args.token, max_connections=args.workers)
+    with CredentialWriter(args.credentials) as writer:
+        report = provision_teams(
+            client, rosters, workers=args.workers, captains=not args.no_captains, credentials=writer
+        )
+    for item in report.failed:
+        print(f"Failed {item.item.team.name}: {item.error}", file=sys.stderr)
+    print(f"{len(report.succeeded)}/{len(report)} teams provisioned")
+    if not report.ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
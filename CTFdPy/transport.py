@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+import requests
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Decides which failed requests are retried, and how long to wait before retrying
+
+    Idempotent requests are retried on any of `retry_statuses` and on connection errors.
+    Other requests (POST) could have been processed by the server before failing, so they
+    are only retried when the server is known to have rejected them without processing,
+    i.e. on `safe_statuses` or when the connection could not be established.
+
+    The wait between attempts grows exponentially with full jitter, unless the server
+    sends a `Retry-After` header, which is respected up to `max_backoff`.
+
+    Subclass and override `should_retry` or `delay` for custom behaviour.
+
+    Parameters
+    ----------
+    max_retries : int, optional
+        The maximum number of retries of a single request, by default 3
+    backoff : float, optional
+        The base wait in seconds, doubled on every retry, by default 0.5
+    max_backoff : float, optional
+        The maximum wait in seconds, by default 30
+    jitter : bool, optional
+        Whether to randomise the wait between 0 and the backoff, by default True
+    retry_statuses : frozenset[int], optional
+        The statuses that retry idempotent requests, by default 429, 502, 503 and 504
+    safe_statuses : frozenset[int], optional
+        The statuses that retry any request, by default 429
+    """
+    max_retries: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30
+    jitter: bool = True
+    retry_statuses: frozenset[int] = field(default_factory=lambda: frozenset({429, 502, 503, 504}))
+    safe_statuses: frozenset[int] = field(default_factory=lambda: frozenset({429}))
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: requests.Response | None = None,
+        error: Exception | None = None
+    ) -> bool:
+        """Returns whether a request should be retried
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the request
+        attempt : int
+            The number of retries already made
+        response : requests.Response, optional
+            The response, if one was received
+        error : Exception, optional
+            The exception raised while sending the request, if any
+        """
+        if attempt >= self.max_retries:
+            return False
+
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        if error is not None:
+            if isinstance(error, requests.ConnectTimeout):
+                return True
+            return idempotent and isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+        if response is None:
+            return False
+        if response.status_code in self.safe_statuses:
+            return True
+        return idempotent and response.status_code in self.retry_statuses
+
+    def delay(self, attempt: int, response: requests.Response | None = None) -> float:
+        """Returns the number of seconds to wait before retrying"""
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        backoff = min(self.max_backoff, self.backoff * 2 ** attempt)
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parses a Retry-After header, which is either seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """A client-side rate limiter
+
+    Allows `rate` requests per second on average, with bursts of up to `capacity`
+    requests. `acquire` blocks until a request may be sent. The bucket is safe to
+    share between threads, and between clients to limit them together.
+
+    Parameters
+    ----------
+    rate : float
+        The number of requests allowed per second
+    capacity : float, optional
+        The maximum burst size, by default `rate`
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+
+        self.rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Blocks until `tokens` tokens are available, then takes them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
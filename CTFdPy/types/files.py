@@ -3,7 +3,8 @@ from __future__ import annotations
 from typing import TypedDict
 
 
-class FileDict(TypedDict):
+class FileDict(TypedDict, total=False):
     id: int
     location: str
-    type: str
\ No newline at end of file
+    type: str
+    sha1sum: str | None
\ No newline at end of file
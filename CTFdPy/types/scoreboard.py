@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Literal, TypedDict
+
+
+class ScoreboardMemberDict(TypedDict):
+    id: int
+    oauth_id: int | None
+    name: str
+    score: int
+    bracket_id: int | None
+    bracket_name: str | None
+
+
+class ScoreboardEntryDict(TypedDict):
+    pos: int
+    account_id: int
+    account_url: str
+    account_type: Literal["user", "team"]
+    oauth_id: int | None
+    name: str
+    score: int
+    bracket_id: int | None
+    bracket_name: str | None
+    members: list[ScoreboardMemberDict]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Literal, TypedDict
+
+
+class SubmissionChallengeDict(TypedDict):
+    id: int
+    name: str
+    category: str
+    value: int
+
+
+class SubmissionAccountDict(TypedDict):
+    id: int
+    name: str
+
+
+class SubmissionDict(TypedDict):
+    id: int
+    challenge_id: int
+    user_id: int
+    team_id: int | None
+    ip: str
+    provided: str
+    type: Literal["correct", "incorrect", "discard"]
+    date: str
+    challenge: SubmissionChallengeDict
+    user: SubmissionAccountDict
+    team: SubmissionAccountDict | None
+
+
+class SolveDict(TypedDict):
+    account_id: int
+    name: str
+    date: str
+    account_url: str
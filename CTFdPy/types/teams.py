@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import TypedDict
+
+
+class TeamDict(TypedDict, total=False):
+    id: int
+    oauth_id: int | None
+    name: str
+    email: str | None
+    password: str # Only sent, never returned
+    website: str | None
+    affiliation: str | None
+    country: str | None
+    bracket_id: int | None
+    hidden: bool
+    banned: bool
+    captain_id: int | None
+    members: list[int]
+    created: str
+    fields: list[dict[str, str]] # You can ignore this
+
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Literal, TypedDict
+
+
+class UserDict(TypedDict, total=False):
+    id: int
+    oauth_id: int | None
+    name: str
+    email: str
+    password: str # Only sent, never returned
+    type: Literal["user", "admin"]
+    website: str | None
+    affiliation: str | None
+    country: str | None
+    bracket_id: int | None
+    hidden: bool
+    banned: bool
+    verified: bool
+    language: str | None
+    team_id: int | None
+    created: str
+    fields: list[dict[str, str]] # You can ignore this
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import uuid
+from dataclasses import dataclass, field
+from io import BufferedIOBase
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator
+
+CHUNK_SIZE = 1024 * 1024
+
+# Escapes quoted header parameters as browsers and urllib3 do, so a quote or a
+# line break in a file name cannot end the parameter or the header
+_PARAM_TABLE = str.maketrans({'"': "%22", "\r": "%0D", "\n": "%0A"})
+
+# Called with the name of the file being sent, the bytes sent so far and the total bytes of the request
+ProgressCallback = Callable[[str, int, int], None]
+
+
+def hash_file(file: os.PathLike[Any] | BufferedIOBase, chunk_size: int = CHUNK_SIZE) -> str:
+    """Returns the SHA1 of a file, reading it in chunks
+
+    SHA1 is used as it is what CTFd stores for uploaded files.
+    File objects are read from their current position, which is restored afterwards.
+
+    Parameters
+    ----------
+    file : os.PathLike[Any] | BufferedIOBase
+        The path or file object to hash
+    chunk_size : int, optional
+        The number of bytes read at a time, by default 1 MiB
+
+    Returns
+    -------
+    str
+        The hex digest of the file
+    """
+    sha1 = hashlib.sha1()
+
+    if isinstance(file, BufferedIOBase):
+        position = file.tell()
+        while chunk := file.read(chunk_size):
+            sha1.update(chunk)
+        file.seek(position)
+    else:
+        with open(file, "rb") as f:
+            while chunk := f.read(chunk_size):
+                sha1.update(chunk)
+
+    return sha1.hexdigest()
+
+
+def _quote(value: str) -> str:
+    """Escapes the value of a quoted Content-Disposition parameter"""
+    return value.translate(_PARAM_TABLE)
+
+
+@dataclass
+class HashManifest:
+    """A local record of file hashes, saved as JSON
+
+    It remembers the hash of every local file by path, size and modification time,
+    so unchanged files are never hashed twice, and the hash of every file uploaded
+    by location, for servers that do not report `File.sha1sum`.
+
+    Changes are kept in memory until `flush` (or `save`), as rewriting the whole file
+    after every change would make recording n files cost O(n²). `Client.create_file`
+    flushes once at the end of every call, and using the manifest as a context manager
+    flushes it on exit. The manifest is safe to share between threads.
+    """
+    path: str | os.PathLike[Any]
+    local: dict[str, dict[str, Any]] = field(default_factory=dict)   # path -> {"size", "mtime_ns", "sha1"}
+    uploaded: dict[str, str] = field(default_factory=dict)           # location -> sha1
+
+    def __post_init__(self):
+        self.path = Path(self.path)
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        # Incremented by every change, to know whether what is on disk is stale
+        self._version = 0
+        self._saved_version = 0
+        if self.path.is_file():
+            with open(self.path) as f:
+                data = json.load(f)
+            self.local.update(data.get("local", {}))
+            self.uploaded.update(data.get("uploaded", {}))
+
+    def save(self) -> None:
+        """Writes the manifest to disk atomically"""
+        # Saves are serialized, so the last snapshot taken is the one left on disk
+        with self._save_lock:
+            with self._lock:
+                data = {"local": dict(self.local), "uploaded": dict(self.uploaded)}
+                version = self._version
+            # A unique temporary file, in case another process saves the same manifest
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.path.parent, prefix=self.path.name + ".", suffix=".tmp", delete=False
+            ) as f:
+                json.dump(data, f)
+            try:
+                os.replace(f.name, self.path)
+            except BaseException:
+                os.unlink(f.name)
+                raise
+            self._saved_version = version
+
+    def flush(self) -> None:
+        """Saves the manifest if it changed since it was last saved"""
+        if self._version != self._saved_version:
+            self.save()
+
+    def __enter__(self) -> HashManifest:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+    def hash(self, file: os.PathLike[Any] | BufferedIOBase) -> str:
+        """Returns the SHA1 of a file, only reading it if it changed since it was last hashed"""
+        if isinstance(file, BufferedIOBase):
+            return hash_file(file)
+
+        path = os.path.abspath(file)
+        stat = os.stat(path)
+        entry = self.local.get(path)
+        if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha1"]
+
+        sha1 = hash_file(path)
+        with self._lock:
+            self.local[path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": sha1}
+            self._version += 1
+        return sha1
+
+    def record(self, location: str, sha1: str) -> None:
+        """Records the hash of an uploaded file"""
+        with self._lock:
+            self.uploaded[location] = sha1
+            self._version += 1
+
+
+class MultipartEncoder:
+    """A `multipart/form-data` body that is streamed instead of built in memory
+
+    Files given as paths are opened only when they are reached and closed as soon
+    as they are fully read, so at most one file is open and at most one chunk is
+    in memory at a time. File objects are read from their current position and
+    left open for the caller to close.
+
+    The encoder is a file-like object with a known length, so `requests` sends
+    it with a `Content-Length` header while reading it chunk by chunk.
+
+    Parameters
+    ----------
+    fields : dict[str, str]
+        The plain form fields
+    files : list[tuple[str, os.PathLike[Any] | BufferedIOBase]]
+        The (field name, path or file object) of every file
+    progress : ProgressCallback, optional
+        Called after every chunk with the file name, the bytes sent and the total bytes
+    chunk_size : int, optional
+        The maximum number of bytes read from a file at a time, by default 1 MiB
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str],
+        files: list[tuple[str, os.PathLike[Any] | BufferedIOBase]],
+        progress: ProgressCallback | None = None,
+        chunk_size: int = CHUNK_SIZE
+    ):
+        self.boundary = uuid.uuid4().hex
+        self.progress = progress
+        self.chunk_size = chunk_size
+
+        # Every part is either bytes or a (name, path or file object, size) to stream
+        self._parts: list[bytes | tuple[str, os.PathLike[Any] | BufferedIOBase, int]] = []
+        for name, value in fields.items():
+            self._parts.append(
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"\r\n\r\n{value}\r\n'.encode()
+            )
+        for name, file in files:
+            if isinstance(file, BufferedIOBase):
+                if not file.readable():
+                    raise ValueError("File must be readable")
+                filename = os.path.basename(getattr(file, "name", name))
+                position = file.tell()
+                size = file.seek(0, os.SEEK_END) - position
+                file.seek(position)
+            elif os.path.isfile(file):
+                filename = os.path.basename(file)
+                size = os.path.getsize(file)
+            else:
+                raise ValueError("File must be a path or a readable")
+
+            self._parts.append(
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"; filename="{_quote(filename)}"\r\n'
+                f'Content-Type: application/octet-stream\r\n\r\n'.encode()
+            )
+            self._parts.append((filename, file, size))
+            self._parts.append(b"\r\n")
+        self._parts.append(f"--{self.boundary}--\r\n".encode())
+
+        self.length = sum(len(part) if isinstance(part, bytes) else part[2] for part in self._parts)
+        self.sent = 0
+        self._current_name = ""
+        self._buffer = memoryview(b"")
+        self._chunks = self._iter_chunks()
+
+    @property
+    def content_type(self) -> str:
+        """Returns the value of the Content-Type header"""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self.length
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+                continue
+
+            self._current_name, file, size = part
+            if isinstance(file, BufferedIOBase):
+                yield from self._read_file(file, size)
+            else:
+                with open(file, "rb") as f:
+                    yield from self._read_file(f, size)
+
+    def _read_file(self, file: BinaryIO, size: int) -> Iterator[bytes]:
+        remaining = size
+        while remaining > 0:
+            chunk = file.read(min(self.chunk_size, remaining))
+            if not chunk:
+                raise ValueError(f"File {self._current_name} changed size while being uploaded")
+            remaining -= len(chunk)
+            yield chunk
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads the next part of the body, at most one chunk is returned at a time"""
+        if not self._buffer:
+            self._buffer = memoryview(next(self._chunks, b""))
+
+        if size is None or size < 0 or size >= len(self._buffer):
+            chunk = self._buffer
+        else:
+            chunk = self._buffer[:size]
+        # Slicing a memoryview does not copy the rest of the chunk
+        self._buffer = self._buffer[len(chunk):]
+
+        self.sent += len(chunk)
+        if chunk and self.progress is not None:
+            self.progress(self._current_name, self.sent, self.length)
+        return bytes(chunk)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self.read(self.chunk_size):
+            yield chunk
+
+    def close(self) -> None:
+        """Closes any file opened by the encoder"""
+        self._chunks.close()
@@ -0,0 +1,59 @@
+"""Decoding benchmark of the models, for a listing the size of a large CTF
+
+    python benchmarks/decode.py
+    python benchmarks/decode.py --records 50000
+
+Reports the time to build models from a JSON listing of users, and the memory
+still held afterwards, with and without keeping the raw dictionaries.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from CTFdPy.models.users import User
+
+
+def listing(records: int) -> bytes:
+    return json.dumps({"success": True, "data": [{
+        "id": i, "name": f"user{i}", "email": f"user{i}@example.com", "password": "password",
+        "type": "user", "website": None, "affiliation": None, "country": None, "bracket_id": None,
+        "hidden": False, "banned": False, "verified": True, "team_id": None, "oauth_id": None,
+        "created": "2024-01-01T00:00:00+00:00", "fields": []
+    } for i in range(records)]}).encode()
+
+
+def decode(body: bytes, keep_raw: bool) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    data = json.loads(body)["data"]
+    start = time.perf_counter()
+    users = [User.from_dict(d, keep_raw) for d in data]
+    elapsed = time.perf_counter() - start
+    del data
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del users
+    return elapsed, held / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=20000)
+    args = parser.parse_args()
+
+    body = listing(args.records)
+    for keep_raw in (True, False):
+        elapsed, held = decode(body, keep_raw)
+        print(f"keep_raw={keep_raw!s:<5} {args.records} users {elapsed:>7.3f}s {held:>8.1f}MiB held")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""An in-process fake of the CTFd API, for benchmarking the client offline
+
+Implements the endpoints documented in `endpoints/*.md` plus users and teams, backed by
+in-memory dictionaries. Latency and errors can be injected to mimic a loaded server.
+
+    with FakeCTFd(latency=0.01, error_rate=0.01) as server:
+        client = Client(server.url, "token", credentials=("admin", "admin"))
+"""
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+CHUNK_SIZE = 1024 * 1024
+USERS_PER_PAGE = 50
+
+# Listings that only have some fields of their records, as in `endpoints/*.md`
+LISTING_FIELDS = {
+    "challenges": ("id", "type", "name", "value", "solves", "solved_by_me", "category", "tags", "template", "script"),
+    "hints": ("id", "cost", "challenge_id", "challenge", "type"),
+}
+
+
+class FakeCTFd:
+    """A fake CTFd server running on a background thread
+
+    Parameters
+    ----------
+    latency : float, optional
+        The seconds added to every request, by default 0
+    jitter : float, optional
+        A random number of seconds, up to this, added to the latency, by default 0
+    error_rate : float, optional
+        The probability of answering a request with an error before processing it, by default 0
+    error_status : int, optional
+        The status of injected errors, e.g. 429 to mimic rate limiting, by default 503
+    retry_after : str, optional
+        The Retry-After header of injected errors, None to leave it out, by default "0"
+    port : int, optional
+        The port to listen on, by default a free port
+    """
+
+    def __init__(
+        self,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        port: int = 0,
+        *,
+        error_status: int = 503,
+        retry_after: str | None = "0"
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        # Errors to answer the next requests with, before any random ones
+        self.queued_errors: list[tuple[int, str | None]] = []
+        # The method and path of every request received, including failed ones
+        self.requests: list[tuple[str, str]] = []
+
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.data: dict[str, dict[int, dict[str, Any]]] = defaultdict(dict)
+        self.topic_ids: dict[str, int] = {}
+        self.uploaded_bytes = 0
+
+        handler = type("Handler", (_Handler,), {"server_state": self})
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FakeCTFd:
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> FakeCTFd:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def create(self, resource: str, record: dict[str, Any]) -> dict[str, Any]:
+        with self.lock:
+            record["id"] = next(self.ids)
+            self.data[resource][record["id"]] = record
+        return record
+
+    def fail_next(self, count: int = 1, status: int | None = None, retry_after: str | None = "0") -> None:
+        """Answers the next `count` requests with an error, by default `error_status`"""
+        with self.lock:
+            self.queued_errors.extend([(status or self.error_status, retry_after)] * count)
+
+    def by_challenge(self, resource: str, challenge_id: int) -> list[dict[str, Any]]:
+        with self.lock:
+            return [r for r in self.data[resource].values() if r.get("challenge_id") == challenge_id]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, avoid waiting on delayed ACKs
+    disable_nagle_algorithm = True
+    server_state: FakeCTFd
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def reply(self, status: int, body: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> None:
+        payload = json.dumps(body if body is not None else {"success": status < 400}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def read_json(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(body) or {}
+        except ValueError:
+            return {}
+
+    def read_multipart(self) -> tuple[dict[str, str], list[tuple[str, int, str]]]:
+        """Reads a multipart body in chunks, returning its fields and (filename, size, sha1) of its files
+
+        File contents are counted, hashed and discarded, so uploads of any size use constant memory
+        """
+        boundary = self.headers["Content-Type"].split("boundary=")[-1].encode()
+        delimiter = b"\r\n--" + boundary
+        remaining = int(self.headers["Content-Length"])
+
+        def read_more() -> bool:
+            nonlocal buffer, remaining
+            if remaining <= 0:
+                return False
+            chunk = self.rfile.read(min(CHUNK_SIZE, remaining))
+            remaining -= len(chunk)
+            buffer += chunk
+            return bool(chunk)
+
+        fields: dict[str, str] = {}
+        files: list[tuple[str, int, str]] = []
+
+        # The body starts with the delimiter without its leading newline
+        buffer = b"\r\n"
+        part: dict[str, Any] | None = None # The part being read, None for the preamble
+
+        def consume(data: bytes) -> None:
+            if part is None:
+                return
+            if part["filename"] is None:
+                part["value"] += data
+            else:
+                part["size"] += len(data)
+                part["sha1"].update(data)
+
+        while True:
+            index = buffer.find(delimiter)
+            if index == -1:
+                # Keep enough bytes for a delimiter split across chunks
+                keep = len(delimiter)
+                if len(buffer) > keep:
+                    consume(buffer[:-keep])
+                    buffer = buffer[-keep:]
+                if not read_more():
+                    break
+                continue
+
+            consume(buffer[:index])
+            if part is not None:
+                if part["filename"] is None:
+                    fields[part["name"]] = part["value"].decode()
+                else:
+                    files.append((part["filename"], part["size"], part["sha1"].hexdigest()))
+            buffer = buffer[index + len(delimiter):]
+
+            while len(buffer) < 2 and read_more():
+                pass
+            if buffer.startswith(b"--"):
+                break
+
+            while (header_end := buffer.find(b"\r\n\r\n")) == -1:
+                if not read_more():
+                    return fields, files
+            headers = buffer[:header_end].decode()
+            buffer = buffer[header_end + 4:]
+
+            filename = re.search(r'filename="([^"]*)"', headers)
+            part = {
+                "name": re.search(r' name="([^"]*)"', headers).group(1),
+                "filename": filename.group(1) if filename else None,
+                "value": b"",
+                "size": 0,
+                "sha1": hashlib.sha1()
+            }
+
+        # Drain anything after the closing delimiter
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(CHUNK_SIZE, remaining)))
+        return fields, files
+
+    def handle_request(self, method: str) -> None:
+        state = self.server_state
+        if state.latency or state.jitter:
+            time.sleep(state.latency + random.uniform(0, state.jitter))
+        with state.lock:
+            state.requests.append((method, self.path))
+            error = state.queued_errors.pop(0) if state.queued_errors else None
+        if error is None and state.error_rate and random.random() < state.error_rate:
+            error = (state.error_status, state.retry_after)
+        if error is not None:
+            # Drain the body so the connection can be reused
+            remaining = int(self.headers.get("Content-Length") or 0)
+            while remaining > 0:
+                remaining -= len(self.rfile.read(min(CHUNK_SIZE, remaining)))
+            status, retry_after = error
+            return self.reply(status, headers={"Retry-After": retry_after} if retry_after is not None else None)
+
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        parts = [p for p in url.path.split("/") if p]
+
+        if parts == ["login"]:
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            return self.reply(200, headers={"Set-Cookie": "session=fake; Path=/"})
+        if parts[:2] != ["api", "v1"] or len(parts) < 3:
+            return self.reply(404)
+
+        resource = parts[2]
+        record_id = int(parts[3]) if len(parts) > 3 and parts[3].isdigit() else None
+        sub_resource = parts[4] if len(parts) > 4 else None
+
+        if resource == "files" and method == "POST":
+            return self.upload_files()
+        body = self.read_json() if method in ("POST", "PATCH") else {}
+        # Requests without a body still send one, drain it
+        if method in ("GET", "DELETE"):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+
+        if resource == "topics" and method == "DELETE" and record_id is None:
+            with state.lock:
+                state.data["challenge_topics"].pop(int(query.get("target_id", 0)), None)
+            return self.reply(200)
+
+        if resource == "teams" and sub_resource == "members":
+            with state.lock:
+                team = state.data["teams"].get(record_id)
+                user = state.data["users"].get(body.get("user_id")) if method == "POST" else None
+                if team is not None and user is not None:
+                    if user.get("team_id") is not None:
+                        return self.reply(400, {"success": False, "errors": {"id": ["User has already joined a team"]}})
+                    user["team_id"] = record_id
+                    team.setdefault("members", []).append(user["id"])
+            if team is None or (method == "POST" and user is None):
+                return self.reply(404)
+            return self.reply(200, {"success": True, "data": list(team.get("members", []))})
+
+        if resource == "challenges" and sub_resource == "requirements":
+            with state.lock:
+                record = state.data["challenges"].get(record_id)
+            if record is None:
+                return self.reply(404)
+            return self.reply(200, {"success": True, "data": record.get("requirements")})
+
+        if sub_resource is not None:
+            source = "challenge_topics" if sub_resource == "topics" else sub_resource
+            return self.reply(200, {"success": True, "data": state.by_challenge(source, record_id)})
+
+        if method == "GET" and record_id is None:
+            with state.lock:
+                records = list(state.data[resource].values())
+            if resource in LISTING_FIELDS:
+                records = [{k: r[k] for k in LISTING_FIELDS[resource] if k in r} for r in records]
+            if resource in ("users", "teams"):
+                page = int(query.get("page", 1))
+                per_page = int(query.get("per_page", USERS_PER_PAGE))
+                pages = max(1, -(-len(records) // per_page))
+                return self.reply(200, {
+                    "success": True,
+                    "data": records[(page - 1) * per_page:page * per_page],
+                    "meta": {"pagination": {
+                        "page": page, "per_page": per_page, "pages": pages, "total": len(records),
+                        "next": page + 1 if page < pages else None, "prev": page - 1 if page > 1 else None
+                    }}
+                })
+            return self.reply(200, {"success": True, "data": records})
+
+        if method == "GET":
+            with state.lock:
+                record = state.data[resource].get(record_id)
+            if record is None:
+                return self.reply(404)
+            # Requirements have their own endpoint
+            if resource == "challenges":
+                record = {k: v for k, v in record.items() if k != "requirements"}
+            return self.reply(200, {"success": True, "data": record})
+
+        if method == "POST":
+            return self.reply(200, {"success": True, "data": self.create(resource, body)})
+
+        if method == "PATCH":
+            with state.lock:
+                record = state.data[resource].get(record_id)
+                if record is not None:
+                    record.update(body)
+            if record is None:
+                return self.reply(404)
+            return self.reply(200, {"success": True, "data": record})
+
+        if method == "DELETE":
+            with state.lock:
+                found = state.data[resource].pop(record_id, None) is not None
+                if resource == "challenges":
+                    for records in state.data.values():
+                        for key in [k for k, r in records.items() if r.get("challenge_id") == record_id]:
+                            del records[key]
+            return self.reply(200 if found else 404)
+
+        return self.reply(405)
+
+    def create(self, resource: str, body: dict[str, Any]) -> dict[str, Any]:
+        state = self.server_state
+        if resource == "users" or resource == "teams":
+            body.pop("password", None)
+        elif resource == "challenges":
+            body.setdefault("state", "visible")
+            body.setdefault("type", "standard")
+            body.update(solves=0, solved_by_me=False, tags=[])
+        elif resource == "flags" or resource == "tags":
+            body["challenge"] = body.get("challenge_id")
+        elif resource == "hints":
+            body["challenge"] = body.get("challenge_id")
+            body["type"] = "standard"
+        elif resource == "topics":
+            with state.lock:
+                topic_id = state.topic_ids.get(body["value"])
+            if topic_id is None:
+                topic_id = state.create("topics", {"value": body["value"]})["id"]
+                with state.lock:
+                    state.topic_ids[body["value"]] = topic_id
+            record = state.create("challenge_topics", {
+                "challenge_id": body.get("challenge_id"), "topic_id": topic_id, "value": body["value"]
+            })
+            return {**record, "challenge": record["challenge_id"], "topic": topic_id}
+        return state.create(resource, body)
+
+    def upload_files(self) -> None:
+        state = self.server_state
+        fields, files = self.read_multipart()
+        challenge_id = int(fields.get("challenge_id", 0)) or None
+        created = []
+        for filename, size, sha1 in files:
+            with state.lock:
+                state.uploaded_bytes += size
+            created.append(state.create("files", {
+                "type": "challenge", "location": f"{random.getrandbits(64):016x}/{filename}",
+                "challenge_id": challenge_id, "sha1sum": sha1
+            }))
+        self.reply(200, {"success": True, "data": created})
+
+    def do_GET(self) -> None:
+        self.handle_request("GET")
+
+    def do_POST(self) -> None:
+        self.handle_request("POST")
+
+    def do_PATCH(self) -> None:
+        self.handle_request("PATCH")
+
+    def do_DELETE(self) -> None:
+        self.handle_request("DELETE")
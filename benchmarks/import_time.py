@@ -0,0 +1,59 @@
+"""Startup benchmark of the package, for short-lived scripts and cron jobs
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 50
+
+Runs every statement in fresh interpreters and reports the median wall time,
+the time added over an empty interpreter, and whether `requests` was imported.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+
+STATEMENTS = [
+    "pass",
+    "import CTFdPy",
+    "from CTFdPy import ChallengeType",
+    "from CTFdPy.passwords import generate_password",
+    "from CTFdPy import Client",
+    "from CTFdPy import AsyncClient",
+]
+
+
+def measure(statement: str, runs: int) -> tuple[float, bool]:
+    code = f"{statement}\nimport sys\nprint('requests' in sys.modules)"
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), output.strip() == "True"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    baseline = None
+    for statement in STATEMENTS:
+        elapsed, imports_requests = measure(statement, args.runs)
+        if baseline is None:
+            baseline = elapsed
+        print(
+            f"{statement:<50} {elapsed * 1000:>7.1f}ms  +{(elapsed - baseline) * 1000:>6.1f}ms"
+            f"  requests={'yes' if imports_requests else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
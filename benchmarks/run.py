@@ -0,0 +1,185 @@
+"""Offline throughput benchmarks of the client against an in-process fake CTFd
+
+    python benchmarks/run.py                       # every scenario
+    python benchmarks/run.py users challenges --latency 0.01 --error-rate 0.01
+    python benchmarks/run.py upload --upload-mb 1024 --json
+
+Each scenario runs in its own process and reports requests per second, p50/p99
+request latency and the peak RSS of that process. The fake server runs in the
+same process, so RSS includes it.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_ctfd import FakeCTFd
+
+from CTFdPy.bulk import run_bulk
+from CTFdPy.client import Client
+from CTFdPy.hooks import RequestHook, RequestInfo
+
+
+class LatencyRecorder(RequestHook):
+    """Records the exact duration of every request"""
+
+    def __init__(self):
+        self.durations: list[float] = []
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def after_response(self, info: RequestInfo) -> None:
+        with self._lock:
+            self.durations.append(info.duration)
+            if info.status >= 400:
+                self.errors += 1
+
+    def on_error(self, info: RequestInfo) -> None:
+        with self._lock:
+            self.durations.append(info.duration)
+            self.errors += 1
+
+    def percentile(self, q: float) -> float:
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def scenario_users(client: Client, args: argparse.Namespace) -> str:
+    users = ({"username": f"user{i}", "email": f"user{i}@example.com"} for i in range(args.users))
+    report = client.create_users(users, workers=args.workers)
+    return f"{len(report.succeeded)}/{len(report)} users created"
+
+
+def scenario_challenges(client: Client, args: argparse.Namespace) -> str:
+    def deploy(i: int):
+        return client.create_challenge(
+            f"challenge{i}", f"category{i % 10}", "description",
+            value=100,
+            flags=[(f"flag{{{i}}}", "static", False), (f"flag{{{i}-alt}}", "static", True)],
+            hints=[("first", 0), ("second", 10), ("third", 50)],
+            tags=["easy", "web", "bench"],
+            topics=["benchmark"],
+            workers=args.sub_workers
+        )
+
+    report = run_bulk(deploy, range(args.challenges), args.workers)
+    return f"{len(report.succeeded)}/{len(report)} challenges deployed"
+
+
+def scenario_upload(client: Client, args: argparse.Namespace) -> str:
+    # Streamed uploads are not retried by the client, so failed attempts are counted and sent again
+    failures = 0
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "handout.bin")
+        block = os.urandom(1024 * 1024)
+        with open(path, "wb") as f:
+            for _ in range(args.upload_mb):
+                f.write(block)
+
+        challenge = None
+        for _ in range(args.upload_attempts):
+            try:
+                if challenge is None:
+                    challenge = client.create_challenge("upload", "bench", "description", value=100, flag="flag")
+                client.create_file(challenge.id, path)
+                break
+            except Exception:
+                failures += 1
+        else:
+            return f"upload failed after {failures} attempts"
+    return f"{args.upload_mb} MiB uploaded, {failures} failed"
+
+
+SCENARIOS: dict[str, Callable[[Client, argparse.Namespace], str]] = {
+    "users": scenario_users,
+    "challenges": scenario_challenges,
+    "upload": scenario_upload,
+}
+
+
+def run_scenario(name: str, args: argparse.Namespace) -> dict[str, object]:
+    """Runs a scenario in a new process, so its peak RSS is not inherited from earlier scenarios"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(_run_scenario, name, args).result()
+
+
+def _run_scenario(name: str, args: argparse.Namespace) -> dict[str, object]:
+    recorder = LatencyRecorder()
+    with FakeCTFd(args.latency, args.jitter, args.error_rate, error_status=args.error_status) as server:
+        client = Client(
+            server.url, "token", credentials=("admin", "admin"),
+            max_connections=max(10, args.workers * args.sub_workers),
+            hooks=[recorder]
+        )
+        start = time.perf_counter()
+        outcome = SCENARIOS[name](client, args)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "scenario": name,
+        "outcome": outcome,
+        "seconds": round(elapsed, 3),
+        "requests": len(recorder.durations),
+        "errors": recorder.errors,
+        "requests_per_second": round(len(recorder.durations) / elapsed, 1),
+        "p50_ms": round(recorder.percentile(0.50) * 1000, 2),
+        "p99_ms": round(recorder.percentile(0.99) * 1000, 2),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)}, by default all")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random seconds, up to this, added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of an error response")
+    parser.add_argument("--error-status", type=int, default=503, help="status of error responses, e.g. 429")
+    parser.add_argument("--workers", type=int, default=16, help="concurrent users or challenges")
+    parser.add_argument("--sub-workers", type=int, default=1, help="concurrent sub-resources per challenge")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--challenges", type=int, default=200)
+    parser.add_argument("--upload-mb", type=int, default=1024)
+    parser.add_argument("--upload-attempts", type=int, default=5, help="times a failed upload is sent again")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per scenario")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    for name in args.scenarios or SCENARIOS:
+        result = run_scenario(name, args)
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(
+                f"{result['scenario']:<12} {result['outcome']:<32} {result['seconds']:>8.2f}s "
+                f"{result['requests']:>7} req {result['requests_per_second']:>9.1f} req/s "
+                f"p50 {result['p50_ms']:>7.2f}ms p99 {result['p99_ms']:>7.2f}ms "
+                f"rss {result['peak_rss_mb']:>7.1f}MiB errors {result['errors']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
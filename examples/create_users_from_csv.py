@@ -1,19 +1,20 @@
-from CTFdPy.csv import CSVHandler
+from CTFdPy.csv import CSVHandler, CredentialWriter
 from CTFdPy.client import Client
 
 API_KEY = "<YOUR_API_KEY>"
 URL = "<YOUR_CTFD_URL>"
-client = Client(URL, API_KEY)
+client = Client(URL, API_KEY, max_connections=16)
 
 # Example user creation
 handler = CSVHandler('users.csv')
-users = handler.read_csv()
 
-for user in users:
-    try:
-        res = client.create_user(**user)
-        
-        print(res['password'])
-        # You can store the password elsewhere, safely.
-    except Exception as e:
-        print(f"Error creating user '{user['username']}': {str(e)}")
+# Users are read lazily, so creation starts with the first row.
+# Passwords are written to credentials.csv before the users are sent, and rerunning
+# the script after a crash skips the users that were already created.
+with CredentialWriter('credentials.csv') as writer:
+    users = writer.pending(handler.iter_rows())
+
+    for row in client.iter_create_users(users, workers=16):
+        writer.write(row)
+        if not row.ok:
+            print(f"Error creating user '{row.item.username}': {str(row.error)}")
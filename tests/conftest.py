@@ -0,0 +1,23 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from fake_ctfd import FakeCTFd  # noqa: E402
+
+from CTFdPy.client import Client  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    with FakeCTFd() as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return Client(server.url, "token", credentials=("admin", "admin"))
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from CTFdPy.async_client import AsyncClient  # noqa: E402
+from CTFdPy.journal import Journal, JournalState  # noqa: E402
+from CTFdPy.models.hints import Hint  # noqa: E402
+from CTFdPy.models.users import User  # noqa: E402
+from CTFdPy.uploads import HashManifest  # noqa: E402
+
+
+def run(server, test):
+    async def main():
+        async with AsyncClient(server.url, "token", credentials=("admin", "admin"), concurrency=4) as client:
+            return await test(client)
+    return asyncio.run(main())
+
+
+def test_bulk_user_operations_follow_pagination(server):
+    async def test(client):
+        report = await client.create_users(User(f"user{i}", f"user{i}@example.com") for i in range(60))
+        assert report.ok
+        assert [item.result.username for item in report] == [f"user{i}" for i in range(60)]
+        assert all(item.result.password for item in report)
+
+        # Users are listed 50 per page, so the predicate must see the second page
+        assert len(await client.get_users()) == 60
+        banned = await client.ban_users(lambda user: user.username in ("user1", "user55"))
+        assert sorted(item.result.username for item in banned) == ["user1", "user55"]
+
+        deleted = await client.delete_users([report.results[0].result, 10**6])
+        assert [item.ok for item in deleted] == [True, False]
+        return report
+
+    report = run(server, test)
+    assert len(server.data["users"]) == 59
+    assert server.data["users"][report.results[55].result.id]["banned"] is True
+
+
+def test_teams_and_submissions(server):
+    server.create("submissions", {"type": "correct", "provided": "flag{1}"})
+
+    async def test(client):
+        team = await client.create_team("Gryphons", password="hunter2")
+        alice = await client.create_user("alice", "alice@example.com")
+        assert await client.add_team_member(team.id, alice.id) == [alice.id]
+        assert await client.get_team_members(team.id) == [alice.id]
+
+        updated = await client.update_team(team.id, captain_id=alice.id)
+        assert updated.captain_id == alice.id
+        assert [team.name async for team in client.iter_teams(per_page=1)] == ["Gryphons"]
+
+        submissions = await client.get_submissions(type="correct")
+        assert [submission.provided for submission in submissions] == ["flag{1}"]
+
+    run(server, test)
+
+
+def test_login_can_be_the_first_call(server, tmp_path):
+    handout = tmp_path / "handout.txt"
+    handout.write_text("handout")
+
+    manifest = HashManifest(tmp_path / "manifest.json")
+
+    async def main():
+        async with AsyncClient(server.url, credentials=("admin", "admin")) as client:
+            await client.login("admin", "admin")
+            challenge = await client.create_challenge("a", "misc", "description", value=100, flag="flag")
+            assert await client.create_file(challenge.id, str(handout), manifest=manifest)
+            # Already attached, so not sent again
+            assert await client.create_file(challenge.id, str(handout), deduplicate=True, manifest=manifest)
+            return await client.get_challenge_files(challenge.id)
+
+    assert len(asyncio.run(main())) == 1
+
+
+def test_listings_follow_pagination(server, monkeypatch):
+    requested = []
+
+    async def _get(self, endpoint):
+        requested.append(endpoint)
+        page = int(endpoint.rsplit("page=", 1)[1])
+        return {
+            "success": True,
+            "data": [{"id": page, "challenge_id": 1, "content": f"flag{page}", "type": "static", "data": ""}],
+            "meta": {"pagination": {"next": page + 1 if page < 3 else None}}
+        }
+
+    monkeypatch.setattr(AsyncClient, "_get", _get)
+    flags = run(server, lambda client: client.get_flags())
+    assert [flag.content for flag in flags] == ["flag1", "flag2", "flag3"]
+    assert requested == [f"/api/v1/flags?page={page}" for page in (1, 2, 3)]
+
+
+def test_challenge_sub_resources_are_created_at_once(server, tmp_path, monkeypatch):
+    in_flight = peak = 0
+    original = AsyncClient._post
+
+    async def _post(self, endpoint, json):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await original(self, endpoint, json)
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(AsyncClient, "_post", _post)
+    path = str(tmp_path / "deploy.journal")
+
+    async def test(client):
+        with Journal(path) as journal:
+            challenge = await client.create_challenge(
+                "a", "misc", "description", value=100,
+                flags=[("flag{1}", "static", False), ("flag{2}", "static", True)],
+                hints=[("first", 0), ("second", 10), ("third", 20)],
+                tags=["easy", "web"], topics=["sqli"], journal=journal
+            )
+        hints = await client.get_challenge_hints(challenge.id)
+        [topic] = await client.get_challenge_topics(challenge.id)
+        assert await client.delete_challenge_topic(topic.id)
+        updated = await client.update_challenge(challenge.id, value=200)
+        return challenge, hints, updated
+
+    challenge, hints, updated = run(server, test)
+    assert peak >= 5
+    assert updated.value == 200
+    assert [hint.content for hint in hints] == ["first", "second", "third"]
+    assert [hint.requirements for hint in hints[1:]] == [
+        {"prerequisites": [hints[0].id]}, {"prerequisites": [hints[1].id]}
+    ]
+
+    [recorded] = JournalState.read(path).completed
+    assert recorded.ids == [challenge.id]
+    assert sorted(resource for resource, _ in recorded.resources) == ["flags"] * 2 + ["hints"] * 3 + ["tags"] * 2 + ["topics"]
+
+
+def test_failed_sub_resources_roll_the_challenge_back(server, tmp_path, monkeypatch):
+    async def _create_tag(self, tag):
+        raise Exception("Internal Server Error")
+
+    monkeypatch.setattr(AsyncClient, "_create_tag", _create_tag)
+    path = str(tmp_path / "deploy.journal")
+
+    async def test(client):
+        with Journal(path) as journal:
+            with pytest.raises(Exception, match="Internal Server Error"):
+                await client.create_challenge(
+                    "a", "misc", "description", value=100, flag="flag",
+                    hints=[("first", 0), ("second", 10)], tags=["easy"], journal=journal
+                )
+
+    run(server, test)
+    assert not server.data["challenges"] and not server.data["flags"] and not server.data["hints"]
+    assert not JournalState.read(path).incomplete
+
+
+def test_hint_chains_stop_at_their_first_failure(server, monkeypatch):
+    original = AsyncClient._create_hint
+
+    async def _create_hint(self, hint):
+        if hint.content == "broken":
+            raise Exception("Internal Server Error")
+        return await original(self, hint)
+
+    monkeypatch.setattr(AsyncClient, "_create_hint", _create_hint)
+
+    async def test(client):
+        a = await client.create_challenge("a", "misc", "description", value=100, flag="flag")
+        b = await client.create_challenge("b", "misc", "description", value=100, flag="flag")
+        return await client.create_hint_chains([
+            [Hint(0, "first", a.id), Hint(10, "second", a.id)],
+            [Hint(0, "broken", b.id), Hint(10, "never", b.id)]
+        ])
+
+    report = run(server, test)
+    assert [item.ok for item in report] == [True, False]
+    assert [hint.content for hint in report.results[0].result] == ["first", "second"]
+    assert report.results[1].result == []
+    assert sorted(hint["content"] for hint in server.data["hints"].values()) == ["first", "second"]
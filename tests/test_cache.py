@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import threading
+
+from CTFdPy.cache import ResponseCache
+from CTFdPy.client import Client
+
+
+def test_writes_invalidate_dependent_resources():
+    cache = ResponseCache()
+    cache.set("/api/v1/challenges/1", {"data": 1})
+    cache.set("/api/v1/users/1", {"data": 2})
+    cache.invalidate("/api/v1/flags/3")
+    assert cache.get("/api/v1/challenges/1") is None
+    assert cache.get("/api/v1/users/1") == {"data": 2}
+
+
+def test_responses_are_returned_as_copies():
+    cache = ResponseCache()
+    response = {"data": {"tags": ["easy"]}}
+    cache.set("/api/v1/challenges/1", response)
+    response["data"]["tags"].append("changed")
+    cached = cache.get("/api/v1/challenges/1")
+    cached["data"]["tags"].append("mutated")
+    assert cache.get("/api/v1/challenges/1") == {"data": {"tags": ["easy"]}}
+
+
+def test_stale_response_is_not_stored_after_an_invalidation():
+    cache = ResponseCache()
+    generation = cache.generation("/api/v1/challenges/1")
+    cache.invalidate("/api/v1/hints/2")
+    cache.set("/api/v1/challenges/1", {"data": "stale"}, generation)
+    assert cache.get("/api/v1/challenges/1") is None
+
+    generation = cache.generation("/api/v1/users/1")
+    cache.invalidate("/api/v1/hints/2")
+    cache.set("/api/v1/users/1", {"data": "fresh"}, generation)
+    assert cache.get("/api/v1/users/1") == {"data": "fresh"}
+
+    cache.clear()
+    cache.set("/api/v1/users/1", {"data": "stale"}, generation)
+    assert cache.get("/api/v1/users/1") is None
+
+
+def test_get_in_flight_during_a_write_is_not_cached(server, monkeypatch):
+    client = Client(server.url, "token", cache=ResponseCache())
+    challenge = client.create_challenge("cached", "misc", "old", value=100, flag="flag")
+
+    send = client._send
+    in_flight = threading.Event()
+    written = threading.Event()
+
+    def slow_send(method: str, endpoint: str, **kwargs):
+        response = send(method, endpoint, **kwargs)
+        if method == "GET":
+            # The response is read before the write, and only returned once it completed
+            in_flight.set()
+            written.wait(5)
+        return response
+
+    monkeypatch.setattr(client, "_send", slow_send)
+    reader = threading.Thread(target=client._get, args=(f"/api/v1/challenges/{challenge.id}",))
+    reader.start()
+    in_flight.wait(5)
+    monkeypatch.setattr(client, "_send", send)
+    client.update_challenge(challenge.id, description="new")
+    written.set()
+    reader.join()
+
+    assert client._get(f"/api/v1/challenges/{challenge.id}")["data"]["description"] == "new"
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+
+from CTFdPy.bulk import BulkItemResult
+from CTFdPy.csv import (CredentialWriter, CSVHandler, InvalidRowError,
+                        MissingFieldsError, UnexpectedFieldsError)
+
+
+def write(tmp_path, content: str) -> str:
+    path = tmp_path / "users.csv"
+    path.write_text(content)
+    return str(path)
+
+
+def test_rows_are_stripped(tmp_path):
+    path = write(tmp_path, "username,email, password\nalice, alice@example.com, hunter2\nbob,bob@example.com,\n")
+    users = list(CSVHandler(path).iter_rows())
+    assert [(u.username, u.email, u.password) for u in users] == [
+        ("alice", "alice@example.com", "hunter2"), ("bob", "bob@example.com", "")
+    ]
+
+
+@pytest.mark.parametrize("row", ["carol", "carol,carol@example.com,secret,extra"])
+def test_rows_with_the_wrong_number_of_fields_are_rejected(tmp_path, row):
+    path = write(tmp_path, f"username,email,password\nalice,alice@example.com,\n\n{row}\n")
+    rows = CSVHandler(path).iter_rows()
+    assert next(rows).username == "alice"
+    with pytest.raises(InvalidRowError) as e:
+        next(rows)
+    assert e.value.line_num == 4
+    assert "Line 4" in str(e.value)
+
+
+def test_headers_are_validated(tmp_path):
+    with pytest.raises(MissingFieldsError):
+        CSVHandler(write(tmp_path, "username,password\nalice,x\n")).read_csv()
+    with pytest.raises(UnexpectedFieldsError):
+        CSVHandler(write(tmp_path, "username,email,team\nalice,a@example.com,x\n")).read_csv()
+
+
+def rows(count: int) -> list[dict[str, str]]:
+    return [{"username": f"user{i}", "email": f"user{i}@example.com"} for i in range(count)]
+
+
+def test_passwords_are_on_disk_before_users_are_yielded(tmp_path):
+    path = tmp_path / "credentials.csv"
+    with CredentialWriter(str(path), batch_size=2) as writer:
+        users = writer.pending(rows(3))
+        first = next(users)
+        on_disk = list(CredentialWriter.read(str(path)))
+        assert [(row["username"], row["status"]) for row in on_disk] == [("user0", "pending"), ("user1", "pending")]
+        assert on_disk[0]["password"] == first.password
+
+
+def test_resume_skips_created_users_and_reuses_recorded_passwords(client, server, tmp_path):
+    path = str(tmp_path / "credentials.csv")
+    users = rows(4)
+    users[3]["password"] = "hunter2"
+
+    # The first run dies after creating user0 and user1, with only user0's outcome written
+    writer = CredentialWriter(path, batch_size=2)
+    pending = list(writer.pending(users))
+    passwords = {user.username: user.password for user in pending}
+    writer.write(BulkItemResult(0, pending[0], client._create_user(pending[0])))
+    client._create_user(pending[1])
+    writer.write(BulkItemResult(2, pending[2], error=Exception("Internal Server Error")))
+    writer.close()
+
+    with CredentialWriter(path) as writer:
+        resumed = list(writer.pending(rows(4)))
+        assert [user.username for user in resumed] == ["user1", "user2", "user3"]
+        assert all(user.password == passwords[user.username] for user in resumed)
+        assert writer.write_results(client.iter_create_users(resumed)) == 3
+
+    latest = {row["username"]: row for row in CredentialWriter.read(path)}
+    assert {row["status"] for row in latest.values()} == {"created"}
+    assert {name: row["password"] for name, row in latest.items()} == passwords
+    assert passwords["user3"] == "hunter2"
+    with CredentialWriter(path) as writer:
+        assert list(writer.pending(rows(4))) == []
+
+
+def test_files_without_a_team_column_keep_their_columns(tmp_path):
+    path = tmp_path / "credentials.csv"
+    path.write_text("id,username,email,password,status,error\n1,user0,user0@example.com,x,created,\n")
+    with CredentialWriter(str(path)) as writer:
+        assert [user.username for user in writer.pending(rows(2))] == ["user1"]
+
+    lines = path.read_text().splitlines()
+    assert lines[0] == "id,username,email,password,status,error"
+    assert lines[-1].count(",") == 5
+
+
+def test_credentials_can_be_written_without_a_handler(client, tmp_path):
+    path = str(tmp_path / "credentials.csv")
+    users = CSVHandler(write(tmp_path, "username,email\nalice,alice@example.com\n")).iter_rows()
+    assert CSVHandler.write_csv(path, client.iter_create_users(users)) == 1
+
+    [row] = CredentialWriter.read(path)
+    assert (row["username"], row["status"]) == ("alice", "created") and row["password"]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from CTFdPy.export import (BOOL, FLOAT64, INT64, STRING, export, load_arrow,
+                           load_numpy, load_pandas, write_table)
+from CTFdPy.models.users import User
+
+COLUMNS = {"id": INT64, "score": FLOAT64, "hidden": BOOL, "name": STRING, "extra": STRING}
+PAGES = [
+    [
+        {"id": 1, "score": 1.5, "hidden": False, "name": "alice", "extra": "x"},
+        {"id": 2, "score": None, "hidden": True, "name": "bøb", "extra": {"a": 1}}
+    ],
+    [{"id": 3, "score": 3.0, "hidden": None, "name": None, "ignored": "y"}],
+]
+
+
+@pytest.fixture
+def table(tmp_path):
+    schema = write_table(str(tmp_path / "rows"), COLUMNS, PAGES)
+    (tmp_path / "schema.json").write_text(json.dumps({"rows": schema}))
+    return str(tmp_path)
+
+
+def test_tables_record_rows_and_missing_values(table):
+    with open(f"{table}/schema.json") as f:
+        schema = json.load(f)["rows"]
+    assert schema["rows"] == 3
+    assert {name: column["null_count"] for name, column in schema["columns"].items()} == {
+        "id": 0, "score": 1, "hidden": 1, "name": 1, "extra": 1
+    }
+
+
+def test_numpy_round_trip(table):
+    np = pytest.importorskip("numpy")
+    arrays = load_numpy(table, "rows")
+
+    assert arrays["id"].tolist() == [1, 2, 3] and arrays["id"].dtype == np.int64
+    assert arrays["score"].tolist() == [1.5, None, 3.0]
+    assert arrays["hidden"].tolist() == [False, True, None]
+    assert arrays["name"].tolist() == ["alice", "bøb", None]
+    assert arrays["extra"].tolist() == ["x", '{"a": 1}', None]
+
+
+def test_arrow_and_pandas_round_trip(table):
+    pytest.importorskip("numpy")
+    pytest.importorskip("pyarrow")
+    assert load_arrow(table, "rows").to_pylist() == [
+        {"id": 1, "score": 1.5, "hidden": False, "name": "alice", "extra": "x"},
+        {"id": 2, "score": None, "hidden": True, "name": "bøb", "extra": '{"a": 1}'},
+        {"id": 3, "score": 3.0, "hidden": None, "name": None, "extra": None},
+    ]
+
+    pd = pytest.importorskip("pandas")
+    frame = load_pandas(table, "rows")
+    assert frame["name"].tolist()[:2] == ["alice", "bøb"] and pd.isna(frame["name"][2])
+
+
+def test_export_streams_every_page(client, server, tmp_path):
+    pytest.importorskip("numpy")
+    client.create_users([User(f"user{i}", f"user{i}@example.com") for i in range(60)])
+    challenge = client.create_challenge("a", "misc", "description", value=100, flag="flag")
+
+    directory = str(tmp_path / "export")
+    rows = export(client, directory, ["users", "challenges"], per_page=25)
+    assert rows == {"users": 60, "challenges": 1}
+
+    users = load_numpy(directory, "users")
+    assert sorted(users["name"].tolist()) == sorted(f"user{i}" for i in range(60))
+    assert users["id"].tolist() == sorted(server.data["users"])
+    challenges = load_numpy(directory, "challenges")
+    assert challenges["id"].tolist() == [challenge.id] and challenges["solves"].tolist() == [0]
+
+    with pytest.raises(ValueError):
+        export(client, directory, ["scores"])
+    with pytest.raises(ValueError):
+        load_numpy(directory, "flags")
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+import requests
+
+from CTFdPy.client import Client
+from CTFdPy.hooks import MetricsCollector, RequestInfo, endpoint_template
+
+
+def observe(collector: MetricsCollector, duration: float, status: int | None = 200, endpoint: str = "/api/v1/users/1"):
+    info = RequestInfo("GET", endpoint, endpoint_template(endpoint), duration=duration, status=status)
+    if status is None:
+        info.error = requests.ConnectionError()
+        collector.on_error(info)
+    else:
+        info.request_bytes, info.response_bytes = 0, 10
+        collector.after_response(info)
+
+
+def samples(text: str, name: str) -> dict[str, float]:
+    """Returns the value of every sample of a metric, by its labels"""
+    values = {}
+    for line in text.splitlines():
+        if line.startswith(name + "{"):
+            labels, value = line[len(name) + 1:].rsplit("} ", 1)
+            values[labels] = float(value)
+    return values
+
+
+def test_prometheus_histograms_are_cumulative():
+    collector = MetricsCollector(buckets=(0.1, 0.5, 1.0))
+    for duration in (0.05, 0.1, 0.3, 0.7, 2.0):
+        observe(collector, duration)
+    observe(collector, 0.2, status=503)
+    observe(collector, 0.4, status=None)
+    observe(collector, 0.01, endpoint="/api/v1/challenges?page=2")
+
+    text = collector.to_prometheus()
+    labels = 'method="GET",endpoint="/api/v1/users/<id>"'
+    # A duration equal to a bound is counted in its bucket, as `le` is inclusive
+    assert samples(text, "ctfdpy_request_duration_seconds_bucket") == {
+        f'{labels},le="0.1"': 2, f'{labels},le="0.5"': 5, f'{labels},le="1.0"': 6, f'{labels},le="+Inf"': 7,
+        'method="GET",endpoint="/api/v1/challenges",le="0.1"': 1,
+        'method="GET",endpoint="/api/v1/challenges",le="0.5"': 1,
+        'method="GET",endpoint="/api/v1/challenges",le="1.0"': 1,
+        'method="GET",endpoint="/api/v1/challenges",le="+Inf"': 1,
+    }
+    assert samples(text, "ctfdpy_request_duration_seconds_count")[labels] == 7
+    assert samples(text, "ctfdpy_request_duration_seconds_sum")[labels] == pytest.approx(3.75)
+    assert samples(text, "ctfdpy_requests_total") == {
+        f'{labels},status="200"': 5, f'{labels},status="503"': 1,
+        'method="GET",endpoint="/api/v1/challenges",status="200"': 1,
+    }
+    assert samples(text, "ctfdpy_request_errors_total")[labels] == 2
+    assert samples(text, "ctfdpy_response_bytes_total")[labels] == 60
+    assert "# TYPE ctfdpy_request_duration_seconds histogram" in text
+
+    assert collector.total_requests == 8
+    assert collector.endpoints[("GET", "/api/v1/users/<id>")].quantile(0.5) == pytest.approx(0.3)
+    collector.reset()
+    assert collector.total_requests == 0
+
+
+def test_retries_are_counted_as_separate_requests(server, monkeypatch):
+    monkeypatch.setattr("CTFdPy.client.time.sleep", lambda seconds: None)
+    collector = MetricsCollector()
+    client = Client(server.url, "token", hooks=[collector])
+
+    server.fail_next(2, 429)
+    client.get_challenges()
+    client.get_challenges()
+
+    metrics = collector.endpoints[("GET", "/api/v1/challenges")]
+    assert metrics.requests == 4 and metrics.errors == 2
+    assert metrics.statuses == {429: 2, 200: 2}
+    assert sum(metrics.bucket_counts) == 4
+    text = collector.to_prometheus()
+    assert samples(text, "ctfdpy_request_duration_seconds_count") == {
+        'method="GET",endpoint="/api/v1/challenges"': 4
+    }
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from CTFdPy.journal import Journal, JournalState, resume, rollback
+from CTFdPy.loader import PackChallenge
+from CTFdPy.models.challenges import Challenge
+from CTFdPy.models.flags import Flag
+from CTFdPy.scheduler import deploy_challenges
+from CTFdPy.sync import ChallengeSpec
+
+
+def challenge(name: str, requirements: list[str] = ()) -> PackChallenge:
+    spec = ChallengeSpec(
+        Challenge(name, "misc", "description", "standard", "visible", value=100),
+        flags=[Flag(f"flag{{{name}}}")]
+    )
+    return PackChallenge(f"misc/{name}", spec, list(requirements))
+
+
+def ids_by_name(server) -> dict[str, list[int]]:
+    ids: dict[str, list[int]] = {}
+    for record in server.data["challenges"].values():
+        ids.setdefault(record["name"], []).append(record["id"])
+    return ids
+
+
+def crash(client, server, path: str) -> None:
+    """Deploys "a", then dies while creating "b" and before the id of "c" was recorded"""
+    with Journal(path) as journal:
+        assert deploy_challenges(client, [challenge("a")], journal=journal).ok
+
+        b = server.create("challenges", {"name": "b", "category": "misc"})
+        journal.begin(("misc", "b"))
+        journal.created("challenges", b["id"], ("misc", "b"))
+
+        server.create("challenges", {"name": "c", "category": "misc"})
+        journal.begin(("misc", "c"))
+
+    # The last record was cut short by the crash
+    with open(path, "a") as f:
+        f.write('{"op": "created", "resource": "fla')
+
+
+def test_state_replays_an_interrupted_deploy(client, server, tmp_path):
+    path = str(tmp_path / "deploy.journal")
+    crash(client, server, path)
+
+    state = JournalState.read(path)
+    assert [c.key for c in state.completed] == [("misc", "a")]
+    assert {c.key: c.pending for c in state.incomplete} == {("misc", "b"): False, ("misc", "c"): True}
+
+
+def test_resume_recreates_interrupted_challenges_and_keeps_completed_ones(client, server, tmp_path):
+    path = str(tmp_path / "deploy.journal")
+    crash(client, server, path)
+    before = ids_by_name(server)
+
+    report = resume(client, path, [challenge("a"), challenge("b"), challenge("c", ["a"]), challenge("d", ["b"])])
+    assert report.ok
+    assert sorted(item.item.spec.challenge.name for item in report) == ["b", "c", "d"]
+
+    after = ids_by_name(server)
+    assert sorted(after) == ["a", "b", "c", "d"]
+    assert after["a"] == before["a"]
+    assert all(len(ids) == 1 for ids in after.values())
+    assert after["b"] != before["b"] and after["c"] != before["c"]
+    assert server.data["challenges"][after["c"][0]]["requirements"] == {"prerequisites": after["a"]}
+
+    state = JournalState.read(path)
+    assert not state.incomplete
+    assert len(state.completed) == 4
+
+
+def test_rollback_deletes_only_what_the_journal_created(client, server, tmp_path):
+    path = str(tmp_path / "deploy.journal")
+    crash(client, server, path)
+    other = server.create("challenges", {"name": "other", "category": "misc"})
+
+    assert rollback(client, path, incomplete_only=True).ok
+    assert sorted(ids_by_name(server)) == ["a", "other"]
+
+    assert rollback(client, path).ok
+    assert list(server.data["challenges"]) == [other["id"]]
+    # Deletions are recorded, so running it again has nothing left to do
+    assert rollback(client, path).ok
+    assert not JournalState.read(path).incomplete
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+from CTFdPy.loader import (PackValidationError, find_challenges, load_pack,
+                           parse_challenge)
+
+
+def write(directory, name: str, category: str = "misc", **data) -> str:
+    path = directory / category / name
+    path.mkdir(parents=True)
+    metadata = {"name": name, "category": category, "description": "description", "value": 100, "flags": ["flag"]}
+    (path / "challenge.json").write_text(json.dumps({**metadata, **data}))
+    return str(path)
+
+
+@pytest.fixture
+def pack(tmp_path):
+    write(tmp_path, "sanity")
+    write(
+        tmp_path, "baby-xss", "web", requirements=["sanity"], next="misc/xss-2",
+        flags=["flag{xss}", {"content": "^flag{.*}$", "type": "regex", "case_insensitive": True}],
+        hints=["Look at the cookies", {"content": "document.cookie", "cost": 50}]
+    )
+    write(tmp_path, "xss-2", requirements=["web/baby-xss"])
+    handouts = tmp_path / "web" / "baby-xss" / "handouts"
+    handouts.mkdir()
+    (handouts / "app.zip").write_bytes(b"zip")
+    return tmp_path
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_packs_are_parsed_in_this_or_other_processes(pack, processes):
+    challenges = load_pack(str(pack), processes=processes)
+    assert [challenge.spec.challenge.name for challenge in challenges] == ["sanity", "xss-2", "baby-xss"]
+
+    xss = challenges[2]
+    assert xss.requirements == ["sanity"] and xss.next == "misc/xss-2"
+    assert [flag.type for flag in xss.spec.flags] == ["static", "regex"]
+    assert [hint.cost for hint in xss.spec.hints] == [0, 50]
+    assert xss.spec.files == [str(pack / "web" / "baby-xss" / "handouts" / "app.zip")]
+
+
+def test_every_invalid_challenge_is_reported(pack):
+    write(pack / "copy", "sanity")
+    write(pack, "broken", flags=[])
+    write(pack, "lost", requirements=["missing"])
+    write(pack, "typo", valeu=100)
+
+    with pytest.raises(PackValidationError) as e:
+        load_pack(str(pack), processes=2)
+    errors = {os.path.relpath(path, pack): messages for path, messages in e.value.errors.items()}
+    assert errors == {
+        "misc/broken": ["At least one flag is required"],
+        "misc/typo": ["Unknown keys: valeu"],
+        "misc/lost": ["Unknown challenge missing"],
+        "misc/sanity": [f"Duplicate of {pack / 'copy' / 'misc' / 'sanity'}"],
+        "web/baby-xss": ["Ambiguous challenge sanity, use category/name"],
+    }
+
+
+def test_cycles_are_reported_on_every_challenge_of_the_cycle(tmp_path):
+    write(tmp_path, "a", requirements=["c"])
+    write(tmp_path, "b", requirements=["a"])
+    write(tmp_path, "c", requirements=["b"])
+    write(tmp_path, "d", requirements=["a"])
+
+    with pytest.raises(PackValidationError) as e:
+        load_pack(str(tmp_path), processes=1)
+    assert sorted(e.value.errors) == [str(tmp_path / "misc" / name) for name in "abc"]
+
+
+def test_files_must_stay_inside_the_challenge_directory(tmp_path):
+    (tmp_path / "secret.txt").write_text("secret")
+    path = write(tmp_path, "escape", files=["../../secret.txt"])
+    with pytest.raises(ValueError, match="outside of the challenge directory"):
+        parse_challenge(path)
+
+    path = write(tmp_path, "missing", files=["handout.txt"])
+    with pytest.raises(ValueError, match="does not exist"):
+        parse_challenge(path)
+
+
+def test_yaml_metadata_needs_pyyaml(tmp_path, monkeypatch):
+    path = tmp_path / "misc" / "yaml"
+    path.mkdir(parents=True)
+    (path / "challenge.yml").write_text("name: yaml\ncategory: misc\ndescription: d\nvalue: 100\nflags: [flag]\n")
+    # Not looked inside, as it is part of a challenge
+    (path / "nested").mkdir()
+    (path / "nested" / "challenge.json").write_text("{}")
+    assert find_challenges(str(tmp_path)) == [str(path)]
+
+    with monkeypatch.context() as m:
+        m.setitem(sys.modules, "yaml", None)
+        with pytest.raises(ValueError, match="PyYAML is required"):
+            parse_challenge(str(path))
+
+    pytest.importorskip("yaml")
+    assert parse_challenge(str(path)).spec.challenge.name == "yaml"
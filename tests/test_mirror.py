@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from CTFdPy.mirror import LocalMirror
+
+
+@pytest.fixture
+def challenge(client, server):
+    created = client.create_challenge(
+        "baby-rev", "rev", "Reverse me", value=100, flag="flag{rev}", hints=[("Look at main", 0)]
+    )
+    return server.data["challenges"][created.id]
+
+
+@pytest.fixture
+def details(client, monkeypatch):
+    """Records the detail endpoints requested"""
+    requested = []
+    original = client._get
+
+    def _get(endpoint: str):
+        if "?" not in endpoint:
+            requested.append(endpoint)
+        return original(endpoint)
+
+    monkeypatch.setattr(client, "_get", _get)
+    return requested
+
+
+def test_lookups_merge_details_over_listings(client, challenge):
+    mirror = LocalMirror(client)
+    results = mirror.refresh()
+    assert results["challenges"].added == [challenge["id"]]
+
+    assert mirror.get_challenge(challenge["id"]).description == "Reverse me"
+    assert mirror.get_challenge_by_name("baby-rev", "rev").id == challenge["id"]
+    [hint] = mirror.get_hints(challenge["id"])
+    assert hint.content == "Look at main"
+    assert [flag.content for flag in mirror.get_flags(challenge["id"])] == ["flag{rev}"]
+    with pytest.raises(KeyError):
+        mirror.get_challenge_by_name("baby-rev", "pwn")
+
+
+def test_only_changed_listings_are_fetched_again(client, server, challenge, details):
+    mirror = LocalMirror(client)
+    mirror.refresh()
+    details.clear()
+
+    assert all(result.unchanged for result in mirror.refresh(detail_max_age=None).values())
+    assert details == []
+
+    challenge["value"] = 200
+    results = mirror.refresh(["challenges"], detail_max_age=None)
+    assert results["challenges"].changed == [challenge["id"]]
+    assert details == [f"/api/v1/challenges/{challenge['id']}"]
+    assert mirror.get_challenge(challenge["id"]).value == 200
+
+    # Volatile keys are stored without fetching the details again
+    details.clear()
+    challenge["solves"] = 3
+    assert mirror.refresh(["challenges"], detail_max_age=None)["challenges"].changed == [challenge["id"]]
+    assert details == []
+
+
+def test_expired_details_are_fetched_again(client, server, challenge, details):
+    mirror = LocalMirror(client)
+    mirror.refresh()
+    hint = next(iter(server.data["hints"].values()))
+
+    # Neither is in the listings, so they are only seen once the details expire
+    challenge["description"] = "Reverse me, again"
+    hint["content"] = "Look at main, then at check"
+    results = mirror.refresh(["challenges", "hints"])
+    assert all(result.unchanged for result in results.values())
+    assert mirror.get_challenge(challenge["id"]).description == "Reverse me"
+
+    results = mirror.refresh(["challenges", "hints"], detail_max_age=0)
+    assert results["challenges"].changed == [challenge["id"]]
+    assert results["hints"].changed == [hint["id"]]
+    assert mirror.get_challenge(challenge["id"]).description == "Reverse me, again"
+    assert mirror.get_hint(hint["id"]).content == "Look at main, then at check"
+
+    # Fetched again, but reported unchanged
+    details.clear()
+    assert mirror.refresh(["challenges"], detail_max_age=0)["challenges"].unchanged
+    assert details == [f"/api/v1/challenges/{challenge['id']}"]
+
+
+def test_failed_details_are_not_stored(client, server, challenge, monkeypatch):
+    mirror = LocalMirror(client)
+    original = client._get
+
+    def _get(endpoint: str):
+        if endpoint == f"/api/v1/challenges/{challenge['id']}":
+            raise Exception("Internal Server Error")
+        return original(endpoint)
+
+    monkeypatch.setattr(client, "_get", _get)
+    result = mirror.refresh(["challenges"])["challenges"]
+    assert list(result.failed) == [challenge["id"]] and result.unchanged
+    with pytest.raises(KeyError):
+        mirror.get_challenge(challenge["id"])
+
+    monkeypatch.setattr(client, "_get", original)
+    assert mirror.refresh(["challenges"])["challenges"].added == [challenge["id"]]
+
+
+def test_removed_records_and_max_age(client, server, challenge):
+    mirror = LocalMirror(client)
+    mirror.refresh()
+    assert mirror.refresh(max_age=60)["users"].skipped
+
+    client.delete_challenge(challenge["id"])
+    assert mirror.refresh(["challenges"])["challenges"].removed == [challenge["id"]]
+    assert mirror.get_challenges() == []
+
+
+def test_readers_share_the_file_and_old_files_are_upgraded(client, challenge, tmp_path):
+    path = str(tmp_path / "mirror.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE records (resource TEXT NOT NULL, id INTEGER NOT NULL, challenge_id INTEGER, name TEXT, "
+        "hash TEXT NOT NULL, detail_hash TEXT NOT NULL, data TEXT NOT NULL, detail TEXT, "
+        "PRIMARY KEY (resource, id)) WITHOUT ROWID"
+    )
+    conn.close()
+
+    with LocalMirror(client, path) as mirror:
+        mirror.refresh(["challenges"])
+    with LocalMirror(path=path) as reader:
+        assert reader.get_challenge(challenge["id"]).description == "Reverse me"
+        with pytest.raises(ValueError):
+            reader.refresh()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from CTFdPy.models.flags import Flag
+from CTFdPy.models.scoreboard import ScoreboardEntry, ScoreboardMember
+from CTFdPy.models.users import User
+
+
+def test_aliases_map_server_keys_to_fields():
+    user = User.from_dict({"id": 1, "name": "alice", "email": "alice@example.com"})
+    assert user.username == "alice" and user.id == 1
+
+    # A key named after the field takes precedence over its alias
+    assert User.from_dict({"name": "alice", "username": "bob"}).username == "bob"
+
+
+def test_unknown_keys_are_dropped_and_kept_only_in_raw():
+    d = {"id": 1, "name": "alice", "fields": [], "place": "1st"}
+    user = User.from_dict(d)
+    assert not hasattr(user, "fields") and not hasattr(user, "place")
+    assert user.raw is d
+
+
+def test_raw_is_not_kept_when_disabled(monkeypatch):
+    d = {"id": 1, "name": "alice"}
+    user = User.from_dict(d, keep_raw=False)
+    assert not hasattr(user, "_raw")
+    assert user.raw == user._to_dict and user.raw["username"] == "alice"
+
+    monkeypatch.setattr(User, "keep_raw", False)
+    assert not hasattr(User.from_dict(d), "_raw")
+    assert User.from_dict(d, keep_raw=True).raw is d
+
+
+def test_decoders_are_cached_per_class():
+    User.from_dict({"name": "alice"})
+    decoder = User.__dict__["_decoder_cache"]
+    assert ("name", "username") in decoder and ("_raw", "_raw") not in decoder
+    assert User._decoder() is decoder
+
+    @dataclass(slots=True)
+    class Admin(User):
+        level: int = 0
+
+    # Not inherited, so fields added by subclasses are decoded
+    assert Admin.from_dict({"name": "root", "level": 3}).level == 3
+    assert User.__dict__["_decoder_cache"] is decoder
+    assert Flag._decoder() is not decoder
+
+
+def test_scoreboard_members_are_decoded_too():
+    d = {
+        "pos": 1, "account_id": 1, "account_type": "team", "name": "Gryphons", "score": 300,
+        "members": [{"id": 2, "name": "alice", "score": 200}, {"id": 3, "name": "bob", "score": 100}]
+    }
+    entry = ScoreboardEntry.from_dict(d, keep_raw=False)
+    assert entry.name == "Gryphons" and not hasattr(entry, "_raw")
+    assert entry.members == [ScoreboardMember(2, "alice", 200), ScoreboardMember(3, "bob", 100)]
+    assert not hasattr(entry.members[0], "_raw")
+
+    assert ScoreboardEntry.from_dict({"pos": 1, "members": None}).members == []
+    assert ScoreboardEntry.from_dict(d).raw is d
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import CTFdPy
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def imported_after(code: str) -> set[str]:
+    """Runs code in a fresh interpreter, returning the modules it imported"""
+    output = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{code}\nprint(' '.join(sys.modules))"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+def test_constants_do_not_import_the_client():
+    modules = imported_after("import CTFdPy\nCTFdPy.ChallengeType")
+    assert "requests" not in modules and "CTFdPy.client" not in modules
+
+
+def test_star_import_does_not_need_aiohttp():
+    modules = imported_after("from CTFdPy import *")
+    assert "requests" in modules and "aiohttp" not in modules
+    assert "AsyncClient" not in CTFdPy.__all__ and "AsyncClient" in dir(CTFdPy)
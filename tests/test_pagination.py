@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+
+def pages_requested(server, resource: str) -> list[int]:
+    return [
+        int(path.split("page=")[1].split("&")[0])
+        for method, path in server.requests if method == "GET" and path.startswith(f"/api/v1/{resource}?")
+    ]
+
+
+@pytest.fixture
+def users(server):
+    return [server.create("users", {"name": f"user{i}", "email": f"user{i}@example.com"})["id"] for i in range(120)]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_every_page_is_iterated_once(client, server, users, prefetch):
+    assert [user.id for user in client.iter_users(per_page=25, prefetch=prefetch)] == users
+    assert pages_requested(server, "users") == [1, 2, 3, 4, 5]
+
+    # The server's default page size
+    assert [user.id for user in client.iter_users(prefetch=prefetch)] == users
+
+
+def test_the_next_page_is_prefetched_while_the_current_one_is_processed(client, server, users):
+    iterator = client.iter_users(per_page=50, prefetch=True)
+    next(iterator)
+    deadline = time.monotonic() + 5
+    while pages_requested(server, "users") != [1, 2] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pages_requested(server, "users") == [1, 2]
+
+    # Stopping early does not request the pages after the prefetched one
+    iterator.close()
+    assert pages_requested(server, "users") == [1, 2]
+
+
+def test_pages_are_fetched_lazily_without_prefetch(client, server, users):
+    iterator = client.iter_users(per_page=50)
+    for _ in range(50):
+        next(iterator)
+    assert pages_requested(server, "users") == [1]
+    next(iterator)
+    assert pages_requested(server, "users") == [1, 2]
+    iterator.close()
+
+
+def test_unpaginated_endpoints_are_a_single_page(client, server):
+    challenge = client.create_challenge(
+        "a", "misc", "description", value=100, flags=[("flag{1}", "static", False), ("flag{2}", "static", False)]
+    )
+    assert [flag.content for flag in client.iter_flags(per_page=1, prefetch=True)] == ["flag{1}", "flag{2}"]
+    assert [flag.challenge_id for flag in client.get_flags()] == [challenge.id] * 2
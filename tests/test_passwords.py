@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import os
+from array import array
+from collections import Counter
+
+import pytest
+
+from CTFdPy.passwords import (DEFAULT_ALPHABET, CharacterPolicy,
+                              PassphrasePolicy, PasswordPool, _random_indices)
+
+
+@pytest.fixture
+def random_bytes(monkeypatch):
+    """Replaces the random source with the given bytes, repeated as needed"""
+    def use(data: bytes):
+        def token_bytes(n: int) -> bytes:
+            return (data * (n // len(data) + 1))[:n]
+        monkeypatch.setattr("CTFdPy.passwords.secrets.token_bytes", token_bytes)
+    return use
+
+
+def test_passwords_have_the_policy_length_and_alphabet():
+    passwords = CharacterPolicy(length=20).generate(1000)
+    assert len(passwords) == 1000 and len(set(passwords)) == 1000
+    assert all(len(password) == 20 for password in passwords)
+    assert set("".join(passwords)) <= set(DEFAULT_ALPHABET)
+
+    assert set("".join(CharacterPolicy(length=8, alphabet="ab").generate(100))) == {"a", "b"}
+
+
+@pytest.mark.parametrize("size", [2, 10, 62, 100, 255, 256])
+def test_every_index_is_equally_likely(random_bytes, size):
+    # Every byte value once, so a biased mapping would show up as uneven counts
+    random_bytes(bytes(range(256)))
+    per_block = 256 // size * size
+
+    counts = Counter(_random_indices(per_block * 4, size))
+    assert sorted(counts) == list(range(size))
+    assert set(counts.values()) == {256 // size * 4}
+
+
+def test_passphrases_reject_numbers_that_would_bias_them(random_bytes):
+    words = ["correct", "horse", "battery"]
+    # 2**32 % 3 == 1, so only the largest 32-bit number is rejected
+    random_bytes(array("I", [2**32 - 1, 0, 1, 2, 5]).tobytes())
+
+    [passphrase] = PassphrasePolicy(words, count=4, separator=" ").generate()
+    assert passphrase == "correct horse battery battery"
+
+
+def test_passphrase_policy(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("11111 apple\n11112 banana\n\n11113 apple\nred-wine\ncherry\n")
+
+    policy = PassphrasePolicy.from_file(str(path), count=3)
+    assert policy.words == ("apple", "banana", "cherry")
+    assert policy.entropy == pytest.approx(3 * 1.585, abs=1e-3)
+    for passphrase in policy.generate(100):
+        assert len(passphrase.split("-")) == 3
+        assert set(passphrase.split("-")) <= set(policy.words)
+
+    with pytest.raises(ValueError):
+        PassphrasePolicy(["apple", "apple"])
+    with pytest.raises(ValueError):
+        PassphrasePolicy(["apple"])
+    with pytest.raises(ValueError):
+        CharacterPolicy(alphabet="aab")
+
+
+def test_pool_refills_once_empty():
+    batches = []
+
+    class Policy:
+        def generate(self, count: int = 1) -> list[str]:
+            batches.append(count)
+            return [f"{len(batches)}-{i}" for i in range(count)]
+
+    pool = PasswordPool(Policy(), batch_size=3)
+    passwords = [pool.get() for _ in range(7)]
+    assert batches == [3, 3, 3]
+    assert len(set(passwords)) == 7
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_children_do_not_reuse_the_parents_passwords():
+    pool = PasswordPool(batch_size=16)
+    pool.get()
+
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(write, "".join(pool.get() for _ in range(15)).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write)
+    with os.fdopen(read) as f:
+        child = f.read()
+    os.waitpid(pid, 0)
+
+    parent = "".join(pool.get() for _ in range(15))
+    assert len(child) == len(parent) == 15 * 16
+    assert child != parent
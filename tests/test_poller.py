@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from urllib.parse import parse_qs, urlsplit
+
+from CTFdPy.client import Client
+from CTFdPy.poller import SubmissionPoller
+
+
+class _Response:
+    status_code = 200
+    headers: dict[str, str] = {}
+
+    def __init__(self, body):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+class StubClient:
+    """Serves a paginated submission listing, recording the pages requested"""
+    _submissions_endpoint = staticmethod(Client._submissions_endpoint)
+    _handle = staticmethod(Client._handle)
+
+    def __init__(self, per_page: int):
+        self.per_page = per_page
+        self.submissions: list[dict] = []
+        self.last_id = 0
+        self.pages: list[int] = []
+
+    def add(self, count: int = 1) -> None:
+        for _ in range(count):
+            self.last_id += 1
+            self.submissions.append({"id": self.last_id, "type": "correct", "provided": f"flag{self.last_id}"})
+
+    def _listing(self, endpoint: str) -> dict:
+        query = {k: v[-1] for k, v in parse_qs(urlsplit(endpoint).query).items()}
+        page = int(query.get("page", 1))
+        per_page = int(query.get("per_page", self.per_page))
+        self.pages.append(page)
+        pages = max(1, -(-len(self.submissions) // per_page))
+        return {
+            "success": True,
+            "data": self.submissions[(page - 1) * per_page:page * per_page],
+            "meta": {"pagination": {"page": page, "pages": pages, "next": page + 1 if page < pages else None}}
+        }
+
+    def _get(self, endpoint: str) -> dict:
+        return self._listing(endpoint)
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> _Response:
+        return _Response(self._listing(endpoint))
+
+
+def test_full_last_page_then_one_new_submission():
+    client = StubClient(per_page=2)
+    client.add(4)
+    poller = SubmissionPoller(client, per_page=2)
+    poller.seek_end()
+    assert poller.last_id == 4
+
+    client.add()
+    client.pages.clear()
+    assert [s.id for s in poller.poll()] == [5]
+    assert client.pages == [2, 3]
+
+    client.pages.clear()
+    assert poller.poll() == []
+    assert client.pages == [3]
+
+
+def test_poll_returns_everything_after_the_last_id():
+    client = StubClient(per_page=3)
+    client.add(7)
+    poller = SubmissionPoller(client, per_page=3, last_id=2)
+    assert [s.id for s in poller.poll()] == [3, 4, 5, 6, 7]
+    client.add(4)
+    assert [s.id for s in poller.poll()] == [8, 9, 10, 11]
+
+
+def test_steps_back_after_deletions():
+    client = StubClient(per_page=2)
+    client.add(6)
+    poller = SubmissionPoller(client, per_page=2)
+    poller.seek_end()
+
+    # Deleting earlier submissions moves the unseen ones back a page
+    del client.submissions[:2]
+    client.add()
+    client.add()
+    assert [s.id for s in poller.poll()] == [7, 8]
+
+
+def test_poll_requests_at_most_max_pages():
+    client = StubClient(per_page=1)
+    client.add(10)
+    poller = SubmissionPoller(client, per_page=1, max_pages=4)
+    assert [s.id for s in poller.poll()] == [1, 2, 3, 4]
+    assert client.pages == [1, 2, 3, 4]
+
+    # The next poll carries on from the first page it did not request
+    client.pages.clear()
+    assert [s.id for s in poller.poll()] == [5, 6, 7, 8]
+    assert client.pages == [5, 6, 7, 8]
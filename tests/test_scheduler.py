@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+
+from CTFdPy.loader import PackChallenge
+from CTFdPy.models.challenges import Challenge
+from CTFdPy.models.flags import Flag
+from CTFdPy.models.hints import Hint
+from CTFdPy.scheduler import CycleError, DependencyGraph, deploy_challenges
+from CTFdPy.sync import ChallengeSpec
+
+
+def challenge(name: str, requirements: list[str] = (), hints: list[str] = (), next: str | None = None) -> PackChallenge:
+    spec = ChallengeSpec(
+        Challenge(name, "misc", "description", "standard", "visible", value=100),
+        flags=[Flag(f"flag{{{name}}}")],
+        hints=[Hint(0, content) for content in hints]
+    )
+    return PackChallenge(f"misc/{name}", spec, list(requirements), next=next)
+
+
+def names(server, resource: str) -> set[str]:
+    return {record["name"] for record in server.data[resource].values()}
+
+
+def test_levels_follow_requirements():
+    challenges = [challenge("c", ["b"]), challenge("b", ["a"]), challenge("a"), challenge("d", ["a"])]
+    levels = DependencyGraph.from_challenges(challenges).levels()
+    assert [sorted(name for _, name in level) for level in levels] == [["a"], ["b", "d"], ["c"]]
+
+
+def test_cycle_is_reported_before_anything_is_created(client, server):
+    challenges = [challenge("a", ["c"]), challenge("b", ["a"]), challenge("c", ["b"]), challenge("d")]
+    with pytest.raises(CycleError) as e:
+        deploy_challenges(client, challenges)
+    assert len(e.value.cycle) == 4
+    assert not server.data["challenges"]
+
+
+def test_requirements_and_next_are_set(client, server):
+    report = deploy_challenges(
+        client, [challenge("b", ["a"], next="c"), challenge("a", hints=["h1", "h2"]), challenge("c")], workers=4
+    )
+    assert report.ok
+    ids = {record["name"]: id for id, record in server.data["challenges"].items()}
+    b = server.data["challenges"][ids["b"]]
+    assert b["requirements"]["prerequisites"] == [ids["a"]]
+    assert b["next_id"] == ids["c"]
+
+    hints = sorted(server.data["hints"].values(), key=lambda hint: hint["id"])
+    assert [hint["content"] for hint in hints] == ["h1", "h2"]
+    assert hints[1]["requirements"]["prerequisites"] == [hints[0]["id"]]
+
+
+def test_failed_hints_fail_dependents_before_they_are_created(client, server, monkeypatch):
+    create_hint = client._create_hint
+
+    def failing_create_hint(hint: Hint) -> Hint:
+        if hint.content == "broken":
+            raise ValueError("hint rejected")
+        return create_hint(hint)
+
+    monkeypatch.setattr(client, "_create_hint", failing_create_hint)
+    challenges = [
+        challenge("a", hints=["fine", "broken"]),
+        challenge("b", ["a"]),
+        challenge("c", ["b"]),
+        challenge("d", hints=["fine"])
+    ]
+    report = deploy_challenges(client, challenges)
+
+    assert [item.ok for item in report] == [False, False, False, True]
+    assert "hint rejected" in str(report.results[0].error)
+    assert "Requirement misc/a" in str(report.results[1].error)
+    # The challenge was deleted and its dependents never created
+    assert names(server, "challenges") == {"d"}
+
+
+def test_the_callers_challenges_are_left_unchanged(client, server):
+    challenges = [challenge("a"), challenge("b", ["a"])]
+    assert deploy_challenges(client, challenges).ok
+    assert [c.spec.challenge.requirements for c in challenges] == [None, None]
+
+    # So they can be deployed again, resolving requirements to the new ids
+    server.data["challenges"].clear()
+    assert deploy_challenges(client, challenges).ok
+    ids = {record["name"]: id for id, record in server.data["challenges"].items()}
+    assert server.data["challenges"][ids["b"]]["requirements"] == {"prerequisites": [ids["a"]]}
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pytest
+
+from CTFdPy.models.challenges import Challenge
+from CTFdPy.models.flags import Flag
+from CTFdPy.models.hints import Hint
+from CTFdPy.sync import ChallengeSpec, plan_sync
+from CTFdPy.uploads import HashManifest
+
+
+def spec(name: str = "web1", value: int = 100, **kwargs) -> ChallengeSpec:
+    return ChallengeSpec(
+        Challenge(name, "web", "description", "standard", "visible", value=value),
+        flags=[Flag(f"flag{{{name}}}")],
+        **kwargs
+    )
+
+
+def sync(client, specs, **kwargs):
+    plan = plan_sync(client, specs, **kwargs)
+    report = plan.apply()
+    assert report.ok, [item.error for item in report.failed]
+    return plan
+
+
+def operations(plan) -> list[tuple[str, str]]:
+    return sorted((operation.method, operation.resource) for operation in plan)
+
+
+def test_new_challenges_are_created_and_then_left_alone(client, server, tmp_path):
+    handout = tmp_path / "handout.txt"
+    handout.write_text("v1")
+    specs = [spec(hints=[Hint(0, "first"), Hint(10, "second")], tags=["easy"], topics=["xss"], files=[str(handout)])]
+
+    assert operations(sync(client, specs)) == [("POST", "challenge")]
+    assert len(server.data["hints"]) == 2 and len(server.data["files"]) == 1
+
+    specs = [spec(hints=[Hint(0, "first"), Hint(10, "second")], tags=["easy"], topics=["xss"], files=[str(handout)])]
+    assert len(plan_sync(client, specs)) == 0
+
+
+def test_changed_fields_and_sub_resources_are_patched(client, server):
+    sync(client, [spec(tags=["easy", "web"], hints=[Hint(0, "first")])])
+    [challenge_id] = server.data["challenges"]
+
+    desired = spec(value=200, tags=["web", "hard"], hints=[Hint(0, "first"), Hint(10, "second")])
+    desired.flags.append(Flag("flag{alt}"))
+    plan = sync(client, [desired])
+    assert operations(plan) == [
+        ("DELETE", "tag"), ("PATCH", "challenge"), ("POST", "flag"), ("POST", "hint"), ("POST", "tag")
+    ]
+    assert [operation.description for operation in plan if operation.resource == "challenge"] == ["value"]
+
+    assert server.data["challenges"][challenge_id]["value"] == "200"
+    assert sorted(tag["value"] for tag in server.data["tags"].values()) == ["hard", "web"]
+    hints = sorted(server.data["hints"].values(), key=lambda hint: hint["id"])
+    assert hints[1]["requirements"] == {"prerequisites": [hints[0]["id"]]}
+
+
+def test_requirements_are_only_patched_when_they_change(client, server):
+    sync(client, [spec("web1"), spec("web2")])
+    ids = {record["name"]: record["id"] for record in server.data["challenges"].values()}
+
+    def with_requirements(*names: str) -> list[ChallengeSpec]:
+        desired = spec("web2")
+        desired.challenge.requirements = {"prerequisites": [ids[name] for name in names]}
+        return [spec("web1"), desired]
+
+    plan = sync(client, with_requirements("web1"))
+    assert [operation.description for operation in plan] == ["requirements"]
+    assert server.data["challenges"][ids["web2"]]["requirements"] == {"prerequisites": [ids["web1"]]}
+
+    assert len(plan_sync(client, with_requirements("web1"))) == 0
+    assert [operation.description for operation in plan_sync(client, with_requirements())] == ["requirements"]
+
+
+def test_files_with_new_content_are_replaced(client, server, tmp_path):
+    handout = tmp_path / "handout.txt"
+    handout.write_text("v1")
+    sync(client, [spec(files=[str(handout)])])
+    [old] = server.data["files"]
+
+    handout.write_text("v2")
+    plan = sync(client, [spec(files=[str(handout)])])
+    assert operations(plan) == [("DELETE", "file"), ("POST", "file")]
+    [new] = server.data["files"].values()
+    assert new["id"] != old and new["location"].endswith("/handout.txt")
+
+    assert len(plan_sync(client, [spec(files=[str(handout)])])) == 0
+
+
+def test_manifest_matches_files_the_server_does_not_hash(client, server, tmp_path):
+    handout = tmp_path / "handout.txt"
+    handout.write_text("v1")
+    manifest = HashManifest(tmp_path / "manifest.json")
+    sync(client, [spec()])
+    [challenge_id] = server.data["challenges"]
+    client.create_file(challenge_id, str(handout), manifest=manifest)
+    for record in server.data["files"].values():
+        record["sha1sum"] = None
+
+    assert len(plan_sync(client, [spec(files=[str(handout)])], manifest=manifest)) == 0
+    # Without the manifest the content is unknown, so the file is replaced
+    assert operations(plan_sync(client, [spec(files=[str(handout)])])) == [("DELETE", "file"), ("POST", "file")]
+
+
+def test_prune_and_duplicates(client, server):
+    sync(client, [spec("web1"), spec("web2")])
+
+    plan = sync(client, [spec("web1")], prune=True)
+    assert operations(plan) == [("DELETE", "challenge")]
+    assert [record["name"] for record in server.data["challenges"].values()] == ["web1"]
+
+    with pytest.raises(ValueError):
+        plan_sync(client, [spec("web1"), spec("web1")])
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from CTFdPy.csv import CredentialWriter
+from CTFdPy.teams import (TeamProvisionError, group_roster, main,
+                          provision_teams)
+
+
+def roster(*rows: tuple[str, str]) -> list:
+    return group_roster(
+        {"team": team, "username": name, "email": f"{name}@example.com", "team_password": ""} for team, name in rows
+    )
+
+
+def test_teams_get_their_members_and_first_member_as_captain(client, server):
+    rosters = roster(("Gryphons", "alice"), ("Owls", "carol"), ("Gryphons", "bob"))
+    report = provision_teams(client, rosters, workers=4)
+    assert report.ok
+
+    gryphons = report.results[0].result
+    assert sorted(user.username for user in gryphons.members) == ["alice", "bob"]
+    assert gryphons.captain.username == "alice"
+    assert all(user.password for user in gryphons.users)
+
+    record = server.data["teams"][gryphons.team.id]
+    assert sorted(record["members"]) == sorted(user.id for user in gryphons.users)
+    assert record["captain_id"] == gryphons.captain.id
+
+
+def test_a_failed_membership_fails_only_its_team(client, server):
+    rosters = roster(("Gryphons", "alice"), ("Owls", "carol"))
+    original = client.add_team_member
+
+    def add_team_member(team_id: int, user_id: int) -> list[int]:
+        if server.data["users"][user_id]["name"] == "carol":
+            raise Exception("User has already joined a team")
+        return original(team_id, user_id)
+
+    client.add_team_member = add_team_member
+    report = provision_teams(client, rosters)
+
+    assert [item.ok for item in report] == [True, False]
+    owls = report.results[1]
+    assert isinstance(owls.error, TeamProvisionError)
+    assert list(owls.error.errors) == ["carol"]
+    assert owls.result.team is not None and owls.result.captain is None
+
+
+def test_credentials_are_written_for_every_user_and_team(client, server, tmp_path, monkeypatch):
+    path = tmp_path / "roster.csv"
+    path.write_text(
+        "team,username,email,password,team_password\n"
+        "Gryphons,alice,alice@example.com,,hunter2\n"
+        "Gryphons,bob,bob@example.com,s3cret,\n"
+        "Owls,carol,carol@example.com,,\n"
+    )
+    credentials = tmp_path / "credentials.csv"
+    monkeypatch.setattr(sys, "argv", [
+        "teams", str(path), "--credentials", str(credentials), "--url", server.url, "--token", "token"
+    ])
+    main()
+
+    rows = list(CredentialWriter.read(str(credentials)))
+    pending = {row["username"]: row for row in rows if row["status"] == "pending"}
+    created = {row["username"] or row["team"]: row for row in rows if row["status"] == "created"}
+    assert sorted(pending) == ["alice", "bob", "carol"]
+    assert sorted(created) == ["Gryphons", "Owls", "alice", "bob", "carol"]
+
+    assert created["bob"]["password"] == "s3cret"
+    assert created["alice"]["password"] == pending["alice"]["password"] != ""
+    assert (created["carol"]["team"], created["Gryphons"]["password"]) == ("Owls", "hunter2")
+    users = {record["name"]: record["id"] for record in server.data["users"].values()}
+    assert {name: int(created[name]["id"]) for name in users} == users
+
+
+def test_credentials_are_required(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "argv", ["teams", str(tmp_path / "roster.csv"), "--url", "url", "--token", "token"])
+    with pytest.raises(SystemExit):
+        main()
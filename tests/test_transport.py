@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+from fake_ctfd import FakeCTFd
+
+from CTFdPy.client import Client
+from CTFdPy.transport import RetryPolicy, TokenBucket, _parse_retry_after
+
+
+@pytest.fixture
+def delays(monkeypatch):
+    """Records the waits between attempts instead of sleeping"""
+    recorded = []
+    monkeypatch.setattr("CTFdPy.client.time.sleep", recorded.append)
+    return recorded
+
+
+def attempts(server, method: str, path: str = "/api/v1/challenges") -> int:
+    return sum(1 for m, p in server.requests if m == method and p.startswith(path))
+
+
+@pytest.mark.parametrize("method", ["GET", "PATCH", "DELETE"])
+def test_idempotent_requests_are_retried(client, server, delays, method):
+    challenge = client.create_challenge("a", "misc", "description", value=100, flag="flag")
+    server.fail_next(2, 503)
+
+    response = client._send(method, f"/api/v1/challenges/{challenge.id}", json={"value": 200})
+    assert response.status_code == 200
+    assert attempts(server, method) == 3
+    assert len(delays) == 2
+
+
+@pytest.mark.parametrize("status", [502, 503])
+def test_posts_are_not_sent_again_after_gateway_errors(client, server, delays, status):
+    server.fail_next(1, status)
+
+    with pytest.raises(requests.HTTPError):
+        client.create_challenge("a", "misc", "description", value=100, flag="flag")
+    assert attempts(server, "POST") == 1
+    assert not server.data["challenges"] and delays == []
+
+
+def test_posts_are_sent_again_when_rate_limited(client, server, delays):
+    server.fail_next(2, 429)
+
+    client.create_challenge("a", "misc", "description", value=100, flag="flag")
+    assert attempts(server, "POST") == 3
+    assert len(server.data["challenges"]) == 1
+
+
+def test_retry_after_is_honored_up_to_max_backoff(server, delays):
+    client = Client(server.url, "token", retry=RetryPolicy(backoff=0, max_backoff=5))
+    server.fail_next(1, 429, retry_after="2")
+    server.fail_next(1, 429, retry_after="60")
+    server.fail_next(1, 503, retry_after=None)
+
+    assert client._send("GET", "/api/v1/challenges").status_code == 200
+    assert delays == [2, 5, 0]
+
+
+def test_retries_stop_after_max_retries(server, delays):
+    with FakeCTFd(error_rate=1, error_status=429) as failing:
+        client = Client(failing.url, "token", retry=RetryPolicy(max_retries=2))
+        assert client._send("GET", "/api/v1/challenges").status_code == 429
+        assert attempts(failing, "GET") == 3
+
+    client = Client(server.url, "token", retry=None)
+    server.fail_next(1, 503)
+    assert client._send("GET", "/api/v1/challenges").status_code == 503
+    assert delays == [0, 0]
+
+
+def test_connection_errors():
+    policy = RetryPolicy()
+    assert policy.should_retry("GET", 0, error=requests.ConnectionError())
+    assert not policy.should_retry("POST", 0, error=requests.ConnectionError())
+    # The request never reached the server, so even a POST is safe to send again
+    assert policy.should_retry("POST", 0, error=requests.ConnectTimeout())
+    assert not policy.should_retry("POST", 0, error=requests.ReadTimeout())
+
+
+def test_backoff_grows_exponentially_with_jitter():
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(4)] == [1, 2, 4, 5]
+
+    policy = RetryPolicy(backoff=1, max_backoff=5)
+    assert all(0 <= policy.delay(3) <= 5 for _ in range(100))
+
+
+def test_retry_after_accepts_seconds_and_dates():
+    assert _parse_retry_after("3") == 3
+    assert _parse_retry_after("-1") == 0
+    assert 55 < _parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert _parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after(None) is None
+
+
+def test_token_bucket_allows_bursts_then_limits_the_rate():
+    bucket = TokenBucket(rate=20, capacity=5)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.1
+
+    for _ in range(4):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.19
+
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_clients_sharing_a_bucket_are_limited_together(server):
+    bucket = TokenBucket(rate=20, capacity=1)
+    clients = [Client(server.url, "token", rate_limit=bucket) for _ in range(2)]
+
+    start = time.monotonic()
+    for _ in range(3):
+        for client in clients:
+            client._send("GET", "/api/v1/challenges")
+    assert time.monotonic() - start >= 0.24
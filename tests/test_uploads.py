@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from urllib3.fields import format_multipart_header_param
+
+from CTFdPy.uploads import HashManifest, MultipartEncoder, hash_file
+
+
+def test_concurrent_saves(tmp_path):
+    manifest = HashManifest(tmp_path / "manifest.json")
+
+    def record(i: int) -> None:
+        manifest.record(f"location/{i}", f"{i:040x}")
+        if i % 10 == 0:
+            manifest.save()
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(record, range(500)))
+    manifest.flush()
+
+    with open(tmp_path / "manifest.json") as f:
+        assert len(json.load(f)["uploaded"]) == 500
+    assert [path.name for path in tmp_path.iterdir()] == ["manifest.json"]
+    assert len(HashManifest(tmp_path / "manifest.json").uploaded) == 500
+
+
+def test_unchanged_files_are_not_hashed_again(tmp_path, monkeypatch):
+    path = tmp_path / "handout.txt"
+    path.write_bytes(b"handout")
+    with HashManifest(tmp_path / "manifest.json") as manifest:
+        sha1 = manifest.hash(path)
+
+    monkeypatch.setattr("CTFdPy.uploads.hash_file", lambda file: "changed")
+    assert HashManifest(tmp_path / "manifest.json").hash(path) == sha1
+
+
+def test_manifests_are_saved_once_per_upload(client, tmp_path, monkeypatch):
+    paths = []
+    for i in range(5):
+        paths.append(tmp_path / f"handout{i}.txt")
+        paths[-1].write_text(f"handout {i}")
+    manifest = HashManifest(tmp_path / "manifest.json")
+    saves = []
+    save = manifest.save
+    monkeypatch.setattr(manifest, "save", lambda: saves.append(save()))
+
+    challenge = client.create_challenge("a", "misc", "description", value=100, flag="flag")
+    client.create_file(challenge.id, *paths, manifest=manifest, parallel=2)
+    assert len(saves) == 1
+    assert len(HashManifest(tmp_path / "manifest.json").uploaded) == 5
+
+    # Nothing changed, so nothing is written
+    client.create_file(challenge.id, *paths, deduplicate=True, manifest=manifest)
+    manifest.flush()
+    assert len(saves) == 1
+
+
+def test_file_names_cannot_break_the_header(client, server, tmp_path):
+    path = tmp_path / 'say "hi"\r\nX-Injected: 1.txt'
+    path.write_text("handout")
+    encoder = MultipartEncoder({"challenge_id": "1"}, [("file", path)])
+    body = b"".join(encoder)
+    assert len(body) == len(encoder)
+    assert body.split(b"\r\n")[5] == f'Content-Disposition: form-data; name="file"; {format_multipart_header_param("filename", path.name)}'.encode()
+
+    challenge = client.create_challenge("a", "misc", "description", value=100, flag="flag")
+    client.create_file(challenge.id, path)
+    [record] = server.data["files"].values()
+    assert record["location"].endswith("/say %22hi%22%0D%0AX-Injected: 1.txt")
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Records the files the encoder opens"""
+    files = []
+
+    def tracked_open(*args, **kwargs):
+        files.append(open(*args, **kwargs))
+        return files[-1]
+
+    monkeypatch.setattr("CTFdPy.uploads.open", tracked_open, raising=False)
+    return files
+
+
+@pytest.mark.parametrize("parallel", [1, 3])
+def test_uploads_stream_their_announced_length(client, server, tmp_path, opened, parallel):
+    sizes = [0, 1, 3 * 1024 * 1024 + 7]
+    paths = []
+    for i, size in enumerate(sizes):
+        paths.append(tmp_path / f"handout{i}.bin")
+        paths[-1].write_bytes(os.urandom(size))
+    handle = open(tmp_path / "handout0.bin", "rb")
+
+    sent = []
+    send = client.session.send
+
+    def recording_send(request, **kwargs):
+        response = send(request, **kwargs)
+        if request.url.endswith("/api/v1/files"):
+            # The body is the encoder, which counts the bytes read from it
+            sent.append((int(request.headers["Content-Length"]), request.body.sent))
+        return response
+
+    client.session.send = recording_send
+    progress = []
+    challenge = client.create_challenge("a", "misc", "description", value=100, flag="flag")
+    client.create_file(
+        challenge.id, *paths, handle, parallel=parallel,
+        progress=lambda name, done, total: progress.append((done, total))
+    )
+
+    assert len(opened) == 3 and all(f.closed for f in opened)
+    # File objects are left for the caller to close
+    assert not handle.closed
+    handle.close()
+
+    assert len(sent) == (1 if parallel == 1 else 4)
+    assert all(length == count for length, count in sent)
+    assert sorted(done for done, total in progress if done == total) == sorted(length for length, _ in sent)
+    assert server.uploaded_bytes == sum(sizes)
+    assert sorted(file["sha1sum"] for file in server.data["files"].values()) == sorted(
+        [hash_file(path) for path in paths] + [hash_file(paths[0])]
+    )
+
+
+def test_closing_an_encoder_closes_the_file_being_read(tmp_path, opened):
+    path = tmp_path / "handout.bin"
+    path.write_bytes(b"x" * 100)
+    encoder = MultipartEncoder({}, [("file", path)], chunk_size=10)
+    while not opened:
+        encoder.read()
+
+    assert not opened[0].closed
+    encoder.close()
+    assert opened[0].closed
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from fake_ctfd import FakeCTFd
+
+from CTFdPy.client import Client
+from CTFdPy.models.users import User
+
+
+def test_bulk_creation_keeps_input_order_and_isolates_failures():
+    rows = [{"username": f"user{i}", "email": f"user{i}@example.com"} for i in range(40)]
+    rows[5] = {"username": "user5", "mail": "user5@example.com"}
+    rows[17]["password"] = "hunter2"
+
+    # Jitter makes the requests finish out of order
+    with FakeCTFd(jitter=0.01) as server:
+        client = Client(server.url, "token")
+        # A POST failing at the gateway is not sent again, so exactly one more row fails
+        server.fail_next(1, 502)
+        report = client.create_users(rows, workers=8)
+
+    assert [item.index for item in report] == list(range(40))
+    assert [item.item for item in report] == rows
+    assert isinstance(report.results[5].error, TypeError)
+    assert len(report.failed) == 2 and len(report.succeeded) == 38
+    for item in report.succeeded:
+        assert item.result.username == item.item["username"]
+        assert item.result.id in server.data["users"] and item.result.password
+    assert report.results[17].result.password == "hunter2"
+    assert len(server.data["users"]) == 38
+
+
+def test_update_with_a_partial_user_only_sends_what_it_sets(client, server):
+    created = client.create_user("alice", "alice@example.com")
+    server.data["users"][created.id]["hidden"] = True
+
+    updated = client.update_user(User("alice", website="https://alice.example.com", id=created.id))
+
+    record = server.data["users"][created.id]
+    assert record["email"] == "alice@example.com"
+    assert record["hidden"] is True
+    assert updated.website == record["website"] == "https://alice.example.com"
+
+
+def test_update_with_a_decoded_user_sends_its_changes(client, server):
+    created = client.create_user("bob", "bob@example.com")
+    user = client.get_user(created.id)
+    assert user.to_changes() == {}
+
+    user.hidden = True
+    user.email = None
+    assert user.to_changes() == {"hidden": True}
+    client.update_user(user, banned=True)
+
+    record = server.data["users"][created.id]
+    assert (record["email"], record["hidden"], record["banned"]) == ("bob@example.com", True, True)
+
+
+def test_bulk_operations_select_users_by_predicate(client, server):
+    report = client.create_users([User(f"user{i}", f"user{i}@example.com") for i in range(10)])
+    assert report.ok
+
+    banned = client.ban_users(lambda user: user.username in ("user1", "user2"))
+    assert sorted(item.result.username for item in banned) == ["user1", "user2"]
+
+    reset = client.reset_passwords([report.results[0].result])
+    assert reset.ok and reset.results[0].result.password
+
+    deleted = client.delete_users(lambda user: user.banned)
+    assert deleted.ok and len(deleted) == 2
+    assert {record["name"] for record in server.data["users"].values()} == {f"user{i}" for i in (0, *range(3, 10))}
+
+
+def test_update_with_a_partial_team_only_sends_what_it_sets(client, server):
+    from CTFdPy.models.teams import Team
+
+    created = client.create_team("Gryphons", "team@example.com")
+    server.data["teams"][created.id]["banned"] = True
+    client.update_team(Team("Gryphons", affiliation="SP", id=created.id))
+
+    record = server.data["teams"][created.id]
+    assert (record["email"], record["banned"], record["affiliation"]) == ("team@example.com", True, "SP")